@@ -0,0 +1,112 @@
+"""
+Bulk event submission benchmark.
+
+Reports the state of a fleet of switches through the bundled mock server,
+once with one send_power_state_event() call per device and once with a
+single SinricPro.send_events_bulk() call, and prints the events/s of each:
+
+- submit: until the call(s) returned, i.e. all events were signed and queued
+- delivered: until the mock server received all events
+
+Each round flips the state of every switch, so no event is suppressed as a
+duplicate; the event limiters are reset between rounds.
+
+Usage:
+    python benchmarks/bench_bulk_events.py [--devices 1000,10000] [--rounds 3]
+"""
+
+import os
+
+# The deviceids header of 10 000 devices exceeds the default header line limit
+# of websockets; must be set before websockets is imported.
+os.environ.setdefault("WEBSOCKETS_MAX_LINE_LENGTH", str(4 * 1024 * 1024))
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import time  # noqa: E402
+from typing import Awaitable, Callable  # noqa: E402
+
+from sinricpro import SinricPro, SinricProConfig, SinricProSwitch  # noqa: E402
+from sinricpro.testing import MockSinricProServer  # noqa: E402
+from sinricpro.utils.logger import LogLevel, SinricProLogger  # noqa: E402
+
+APP_KEY = "00000000-0000-4000-8000-000000000000"
+APP_SECRET = "benchmark-app-secret-0123456789abcdef"
+
+# Sends one round of events for the switches, reporting the given state
+Submit = Callable[[SinricPro, list[SinricProSwitch], bool], Awaitable[None]]
+
+
+async def submit_per_call(client: SinricPro, switches: list[SinricProSwitch], state: bool) -> None:
+    """One send_power_state_event() call per switch."""
+    for switch in switches:
+        await switch.send_power_state_event(state)
+
+
+async def submit_bulk(client: SinricPro, switches: list[SinricProSwitch], state: bool) -> None:
+    """One send_events_bulk() call for all switches."""
+    value = {"state": "On" if state else "Off"}
+    await client.send_events_bulk((switch, "setPowerState", value) for switch in switches)
+
+
+async def run(devices: int, rounds: int) -> None:
+    """Benchmark both submission styles with the given number of switches."""
+    server = MockSinricProServer(APP_KEY, APP_SECRET)
+    await server.start()
+    client = SinricPro()
+    switches = [SinricProSwitch(f"{index:024x}") for index in range(devices)]
+    for switch in switches:
+        client.add(switch)
+    config = SinricProConfig(
+        app_key=APP_KEY,
+        app_secret=APP_SECRET,
+        server_url=server.host,
+        server_port=server.port,
+        use_ssl=False,
+    )
+    await client.begin(config)
+    await server.wait_for_devices(devices)
+
+    submitted = 0
+    state = False
+    try:
+        styles: list[tuple[str, Submit]] = [("per-call", submit_per_call), ("bulk", submit_bulk)]
+        for name, submit in styles:
+            submit_rates, delivered_rates = [], []
+            for _ in range(rounds):
+                state = not state
+                for switch in switches:
+                    switch._power_state_limiter.reset()
+
+                start = time.perf_counter()
+                await submit(client, switches, state)
+                submit_rates.append(devices / (time.perf_counter() - start))
+                submitted += devices
+                await server.wait_for_events(submitted, timeout=120)
+                delivered_rates.append(devices / (time.perf_counter() - start))
+
+            print(
+                f"{devices:>7} devices {name:>8}: submit {max(submit_rates):12,.0f} events/s, "
+                f"delivered {max(delivered_rates):10,.0f} events/s (best of {rounds})"
+            )
+        stats = server.get_stats()
+        if stats["invalid_signatures"] or stats["invalid_messages"]:
+            raise RuntimeError(f"Benchmark run had errors: {stats}")
+    finally:
+        await client.stop()
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", default="1000,10000", help="Comma-separated fleet sizes")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    SinricProLogger.set_level(LogLevel.ERROR)
+    for devices in (int(count) for count in args.devices.split(",")):
+        asyncio.run(run(devices, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
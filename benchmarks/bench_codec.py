@@ -0,0 +1,94 @@
+"""
+JSON codec benchmark.
+
+Measures the end-to-end request/response cycle of the message path for each
+available codec: parse and validate an incoming signed request, then build,
+sign and serialize the response, as SinricPro does for every request. Also
+checks that every codec produces identical signatures.
+
+Usage:
+    python benchmarks/bench_codec.py [--messages 50000]
+"""
+
+import argparse
+import time
+from typing import Any
+
+from sinricpro.core.codec import CODEC_JSON, CODEC_ORJSON, JsonCodec, get_codec, orjson_available
+from sinricpro.core.message_builder import MessageBuilder
+from sinricpro.core.signature import Signature, parse_message
+from sinricpro.utils.logger import LogLevel, SinricProLogger
+
+APP_SECRET = "benchmark-app-secret-0123456789abcdef"
+
+REQUEST = {
+    "header": {"payloadVersion": 2, "signatureVersion": 1},
+    "payload": {
+        "action": "setRangeValue",
+        "clientId": "alexa-skill",
+        "createdAt": 1700000000,
+        "deviceId": "5dc1564130e5xxxxxxxxxxxx",
+        "instanceId": "speed",
+        "message": "OK",
+        "replyToken": "6a9f1c2e-6f8e-4c9b-9d0a-1b2c3d4e5f60",
+        "success": True,
+        "type": "request",
+        "value": {"rangeValue": 42, "level": 0.75},
+    },
+}
+
+
+def cycle(signature: Signature, builder: MessageBuilder, raw: str) -> str:
+    """Handle one request the way SinricPro does and return the framed response."""
+    message, raw_payload = parse_message(raw)
+    assert signature.validate(message, raw_payload)
+
+    payload = message["payload"]
+    response: dict[str, Any] = {
+        "action": payload["action"],
+        "clientId": payload["clientId"],
+        "createdAt": 1700000001,
+        "deviceId": payload["deviceId"],
+        "message": "OK",
+        "replyToken": payload["replyToken"],
+        "success": True,
+        "type": "response",
+        "value": payload["value"],
+        "instanceId": payload["instanceId"],
+    }
+    return builder.build(response)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=50000)
+    args = parser.parse_args()
+
+    SinricProLogger.set_level(LogLevel.NONE)
+
+    reference = JsonCodec()
+    request = dict(REQUEST)
+    request["signature"] = {"HMAC": Signature(APP_SECRET).sign(dict(REQUEST))}
+    raw = reference.dumps(request)
+
+    names = [CODEC_JSON] + ([CODEC_ORJSON] if orjson_available() else [])
+    responses = set()
+    for name in names:
+        codec = get_codec(name)
+        signature = Signature(APP_SECRET, codec)
+        builder = MessageBuilder(signature)
+        responses.add(cycle(signature, builder, raw))
+
+        start = time.perf_counter()
+        for _ in range(args.messages):
+            cycle(signature, builder, raw)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>8}: {args.messages / elapsed:12,.0f} request/response cycles/s")
+
+    if not orjson_available():
+        print("  orjson: not installed (pip install orjson)")
+    assert len(responses) == 1, "codecs produced different responses"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Logging benchmark.
+
+Measures the per-message cost of the debug logging on the WebSocket frame
+path (one debug call per received and per sent frame) while the log level
+is INFO, i.e. with debug logging disabled:
+
+- eager: the previous behaviour, an f-string formatted before the call and a
+  logger call that initialized the handler and checked the level inside
+- lazy: SinricProLogger.debug() with %-style arguments, which returns after
+  one level comparison
+- guarded: SinricProLogger.debug_enabled checked at the call site, as the
+  frame path does
+
+The cost is reported net of an empty loop.
+
+Usage:
+    python benchmarks/bench_logging.py [--messages 1000000]
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable
+
+from sinricpro.utils.logger import LogLevel, SinricProLogger
+
+FRAME = (
+    '{"header":{"payloadVersion":2,"signatureVersion":1},"payload":{"action":"setPowerState",'
+    '"clientId":"alexa-skill","createdAt":1700000000,"deviceId":"5dc1564130xxxxxxxxxxxxxx",'
+    '"message":"OK","replyToken":"6a9f1c2e-6f8e-4c9b-9d0a-1b2c3d4e5f60","success":true,'
+    '"type":"request","value":{"state":"On"}},"signature":{"HMAC":"AAAAAAAAAAAAAAAAAAAAAAAA"}}'
+)
+
+logger = logging.getLogger("sinricpro")
+
+
+def eager_debug(message: str) -> None:
+    """The previous SinricProLogger.debug(): initialize, then log."""
+    SinricProLogger._init()
+    logger.debug(message)
+
+
+def baseline(messages: int) -> None:
+    """Empty loop."""
+    message = FRAME
+    for _ in range(messages):
+        pass
+    del message
+
+
+def eager(messages: int) -> None:
+    """f-string and the previous logger call per frame."""
+    message = FRAME
+    for _ in range(messages):
+        eager_debug(f"WebSocket received: {message}")
+
+
+def lazy(messages: int) -> None:
+    """SinricProLogger.debug() with %-style arguments per frame."""
+    message = FRAME
+    for _ in range(messages):
+        SinricProLogger.debug("WebSocket received: %s", message)
+
+
+def guarded(messages: int) -> None:
+    """debug_enabled check at the call site per frame."""
+    message = FRAME
+    for _ in range(messages):
+        if SinricProLogger.debug_enabled:
+            SinricProLogger.debug("WebSocket received: %s", message)
+
+
+def timed(loop: Callable[[int], None], messages: int) -> float:
+    """Run a loop and return the elapsed seconds (best of 3)."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        loop(messages)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    SinricProLogger.set_level(LogLevel.INFO)
+    empty = timed(baseline, args.messages)
+
+    print(f"Debug logging disabled (level INFO), {args.messages:,} frames")
+    print(f"{'variant':>8} {'ns/frame':>10}")
+    results = {}
+    for loop in (eager, lazy, guarded):
+        results[loop.__name__] = (timed(loop, args.messages) - empty) / args.messages * 1e9
+        print(f"{loop.__name__:>8} {results[loop.__name__]:10.1f}")
+
+    print()
+    for name in ("lazy", "guarded"):
+        print(f"{name}: {results[name] / results['eager'] * 100:.0f}% of the eager cost")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Signature benchmark.
+
+Compares incoming-message throughput of validating the HMAC over the raw
+payload span (parse_message) against parsing with json.loads and
+re-serializing the payload (the previous behaviour). Both variants include
+parsing the message.
+
+Also compares computing the signature with hmac.new() per message against
+copying the pre-keyed HMAC held by Signature.
+
+Usage:
+    python benchmarks/bench_signature.py [--messages 50000]
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Callable
+
+from sinricpro.core.signature import Signature, parse_message
+from sinricpro.utils.logger import LogLevel, SinricProLogger
+
+APP_SECRET = "benchmark-app-secret-0123456789abcdef"
+
+REQUEST = {
+    "header": {"payloadVersion": 2, "signatureVersion": 1},
+    "payload": {
+        "action": "setPowerState",
+        "clientId": "alexa-skill",
+        "createdAt": 1700000000,
+        "deviceId": "5dc1564130xxxxxxxxxxxxxx",
+        "message": "OK",
+        "replyToken": "6a9f1c2e-6f8e-4c9b-9d0a-1b2c3d4e5f60",
+        "success": True,
+        "type": "request",
+        "value": {"state": "On"},
+    },
+}
+
+
+def bench(label: str, messages: int, validate: Callable[[], None]) -> None:
+    """Run `validate` on a fresh copy of the raw request `messages` times."""
+    start = time.perf_counter()
+    for _ in range(messages):
+        validate()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>24}: {messages / elapsed:12,.0f} messages/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=50000)
+    args = parser.parse_args()
+
+    SinricProLogger.set_level(LogLevel.NONE)
+    signature = Signature(APP_SECRET)
+    message = json.loads(json.dumps(REQUEST))
+    signature.sign(message)
+    raw = json.dumps(message, separators=(",", ":"))
+
+    def reserialize() -> None:
+        assert signature.validate(json.loads(raw))
+
+    def raw_span() -> None:
+        assert signature.validate(*parse_message(raw))
+
+    bench("re-serialize payload", args.messages, reserialize)
+    bench("raw payload span", args.messages, raw_span)
+
+    key = APP_SECRET.encode("utf-8")
+    payload = json.dumps(message["payload"], separators=(",", ":"))
+
+    def hmac_new() -> None:
+        base64.b64encode(hmac.new(key, payload.encode("utf-8"), hashlib.sha256).digest())
+
+    def pre_keyed() -> None:
+        signature.sign_text(payload)
+
+    bench("hmac.new() per message", args.messages, hmac_new)
+    bench("copy of keyed HMAC", args.messages, pre_keyed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Event spool throughput benchmark.
+
+Appends and acknowledges signed-event-sized records with each fsync policy
+and prints the sustained events/s.
+
+Usage:
+    python benchmarks/bench_spool.py [--events 20000] [--dir /path/on/target/disk]
+"""
+
+import argparse
+import tempfile
+import time
+
+from sinricpro.core.event_spool import EventSpool, FsyncPolicy
+
+# Roughly the size of a signed powerUsage event
+SAMPLE_EVENT = (
+    '{"header":{"payloadVersion":2,"signatureVersion":1},"payload":{"action":"powerUsage",'
+    '"cause":{"type":"PERIODIC_POLL"},"createdAt":1700000000,"deviceId":"5dc1564130xxxxxxxxxxxxxx",'
+    '"type":"event","value":{"startTime":1699999940,"voltage":230.1,"current":1.25,"power":287.6,'
+    '"apparentPower":-1,"reactivePower":-1,"factor":-1,"wattHours":4.79}},'
+    '"signature":{"HMAC":"6BqKhgujzGi1ka6wM8b5elakuCYb/CGc3zzATAXbd2M="}}'
+)
+
+
+def run(policy: FsyncPolicy, events: int, directory: str) -> float:
+    """Append and ack `events` records, returning events per second."""
+    spool = EventSpool(directory, fsync_policy=policy)
+    spool.open()
+    start = time.perf_counter()
+    for _ in range(events):
+        spool.ack(spool.append(SAMPLE_EVENT))
+    spool.close()
+    return events / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--dir", default=None, help="Directory on the disk to test")
+    args = parser.parse_args()
+
+    for policy in FsyncPolicy:
+        # fsync on every append is orders of magnitude slower, keep the run short
+        events = args.events if policy != FsyncPolicy.ALWAYS else min(args.events, 2000)
+        with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+            rate = run(policy, events, directory)
+        print(f"{policy.value:>8}: {rate:12,.0f} events/s ({events} events)")
+
+
+if __name__ == "__main__":
+    main()
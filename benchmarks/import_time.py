@@ -0,0 +1,137 @@
+"""
+Import time benchmark.
+
+Measures the cold-start cost of importing the SDK with `python -X importtime`
+in fresh interpreters, and fails when the budget is exceeded or when modules
+that should be deferred (aiohttp, websockets, ...) are imported up front.
+
+Scenarios:
+- package: `import sinricpro`
+- switch: `from sinricpro import SinricPro, SinricProConfig, SinricProSwitch`,
+  the imports of a typical one-device script (checked against the budget)
+
+The budget applies to the median of the runs. The default suits CI
+machines; on low-power boards pass a budget measured on the board itself.
+
+Usage:
+    python benchmarks/import_time.py [--runs 7] [--budget-ms 250] [--output results.json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any
+
+MARKER = "-- sinricpro import benchmark --"
+
+SCENARIOS = {
+    "package": "import sinricpro",
+    "switch": "from sinricpro import SinricPro, SinricProConfig, SinricProSwitch",
+}
+
+# Scenario checked against the budget
+BUDGET_SCENARIO = "switch"
+
+# Imported on first use only; must not be loaded by the scenarios
+DEFERRED_MODULES = ("aiohttp", "websockets", "multiprocessing")
+
+
+def measure(statement: str) -> tuple[float, list[str]]:
+    """
+    Import in a fresh interpreter.
+
+    Returns:
+        Time spent in the imports of the statement (ms) and the deferred
+        modules that were imported
+    """
+    code = (
+        f"import sys; sys.stderr.write({MARKER!r} + '\\n'); {statement}; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Sum the cumulative times of the top-level imports made by the statement
+    total_us = 0
+    _, _, report = process.stderr.partition(MARKER)
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):  # nested imports are indented
+            total_us += int(cumulative)
+
+    loaded = [module for module in process.stdout.strip().split(",") if module]
+    return total_us / 1000, loaded
+
+
+def run(runs: int) -> list[dict[str, Any]]:
+    """Measure all scenarios and print the results."""
+    results = []
+    print(f"{'scenario':>10} {'median ms':>10} {'min ms':>8} {'max ms':>8}  deferred loaded")
+    for scenario, statement in SCENARIOS.items():
+        times, loaded = [], set()
+        for _ in range(runs):
+            elapsed, modules = measure(statement)
+            times.append(elapsed)
+            loaded.update(modules)
+        entry = {
+            "scenario": scenario,
+            "statement": statement,
+            "median_ms": statistics.median(times),
+            "min_ms": min(times),
+            "max_ms": max(times),
+            "deferred_loaded": sorted(loaded),
+        }
+        results.append(entry)
+        print(
+            f"{scenario:>10} {entry['median_ms']:10.1f} {entry['min_ms']:8.1f} "
+            f"{entry['max_ms']:8.1f}  {', '.join(entry['deferred_loaded']) or '-'}"
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=7, help="fresh interpreters per scenario")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=250.0,
+        help=f"maximum median import time of the {BUDGET_SCENARIO!r} scenario",
+    )
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump({"budget_ms": args.budget_ms, "results": results}, output, indent=2)
+
+    failures = [
+        f"{entry['scenario']}: imported {', '.join(entry['deferred_loaded'])}"
+        for entry in results
+        if entry["deferred_loaded"]
+    ]
+    budgeted = next(entry for entry in results if entry["scenario"] == BUDGET_SCENARIO)
+    if budgeted["median_ms"] > args.budget_ms:
+        failures.append(
+            f"{BUDGET_SCENARIO}: {budgeted['median_ms']:.1f} ms exceeds the budget of "
+            f"{args.budget_ms:.1f} ms"
+        )
+    if failures:
+        print("\nFAILED:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print(f"\nOK: within the budget of {args.budget_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
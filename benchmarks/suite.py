@@ -0,0 +1,296 @@
+"""
+Benchmark suite.
+
+Measures the SDK hot paths offline, against the bundled mock server, at
+several device counts:
+
+- request_response: signed request -> _handle_message -> device handle_request
+  -> _send_response -> socket, timed at the mock server (loopback round trip)
+- event: device.send_event -> send_queue -> socket, timed until the mock
+  server has received the event
+- sign / validate: Signature.sign and Signature.validate of a request
+- add: SinricPro.add
+
+Throughput (ops/s) is measured with pipelined messages, latency percentiles
+with one message in flight at a time. Results are written as JSON so runs
+can be compared between releases.
+
+Usage:
+    python benchmarks/suite.py [--devices 1,100,1000,10000] [--messages 2000]
+                               [--output results.json] [--compare baseline.json]
+"""
+
+import os
+
+# The deviceids header of 10 000 devices exceeds the default header line limit
+# of websockets; must be set before websockets is imported.
+os.environ.setdefault("WEBSOCKETS_MAX_LINE_LENGTH", str(4 * 1024 * 1024))
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import datetime  # noqa: E402
+import json  # noqa: E402
+import platform  # noqa: E402
+import time  # noqa: E402
+from typing import Any  # noqa: E402
+
+from sinricpro import SinricPro, SinricProConfig, SinricProSwitch, __version__  # noqa: E402
+from sinricpro.core.codec import get_codec  # noqa: E402
+from sinricpro.core.signature import Signature, parse_message  # noqa: E402
+from sinricpro.testing import MockSinricProServer  # noqa: E402
+from sinricpro.utils.logger import LogLevel, SinricProLogger  # noqa: E402
+
+APP_KEY = "00000000-0000-4000-8000-000000000000"
+APP_SECRET = "benchmark-app-secret-0123456789abcdef"
+DEVICE_COUNTS = (1, 100, 1000, 10000)
+
+REQUEST = {
+    "header": {"payloadVersion": 2, "signatureVersion": 1},
+    "payload": {
+        "action": "setPowerState",
+        "clientId": "alexa-skill",
+        "createdAt": 1700000000,
+        "deviceId": "5dc1564130xxxxxxxxxxxxxx",
+        "message": "OK",
+        "replyToken": "6a9f1c2e-6f8e-4c9b-9d0a-1b2c3d4e5f60",
+        "success": True,
+        "type": "request",
+        "value": {"state": "On"},
+    },
+}
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Get a percentile of sorted values (nearest rank)."""
+    index = min(len(values) - 1, max(0, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+def result(
+    benchmark: str,
+    devices: int | None,
+    ops: int,
+    elapsed: float,
+    latencies: list[float],
+) -> dict[str, Any]:
+    """Build a result record from a throughput run and latency samples (in seconds)."""
+    latencies = sorted(latencies)
+    return {
+        "benchmark": benchmark,
+        "devices": devices,
+        "ops": ops,
+        "ops_per_s": ops / elapsed,
+        "p50_us": percentile(latencies, 0.50) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+    }
+
+
+def device_id(index: int) -> str:
+    """Get the ID of the index-th benchmark device."""
+    return f"{index:024x}"
+
+
+async def on_power_state(state: bool) -> bool:
+    """Power state callback of the benchmark devices."""
+    return True
+
+
+async def connect(devices: int) -> tuple[MockSinricProServer, SinricPro]:
+    """Start a mock server and connect a client with the given number of switches."""
+    server = MockSinricProServer(APP_KEY, APP_SECRET)
+    await server.start()
+
+    client = SinricPro()
+    for index in range(devices):
+        switch = SinricProSwitch(device_id(index))
+        switch.on_power_state(on_power_state)
+        client.add(switch)
+
+    config = SinricProConfig(
+        app_key=APP_KEY,
+        app_secret=APP_SECRET,
+        server_url=server.host,
+        server_port=server.port,
+        use_ssl=False,
+        # The event benchmark repeats values; measure the send path, not suppression
+        suppress_duplicate_events=False,
+    )
+    await client.begin(config)
+    await server.wait_for_devices(devices)
+    return server, client
+
+
+async def disconnect(server: MockSinricProServer, client: SinricPro) -> None:
+    """Stop the client and the mock server."""
+    await client.stop()
+    await server.stop()
+
+
+def check(server: MockSinricProServer) -> None:
+    """Fail the benchmark if the mock server saw protocol errors."""
+    stats = server.get_stats()
+    failures = stats["invalid_signatures"] + stats["invalid_messages"] + stats["timeouts"]
+    if failures or stats["responses_failed"]:
+        raise RuntimeError(f"Benchmark run had errors: {stats}, last: {list(server.errors)[-3:]}")
+
+
+async def bench_request_response(devices: int, messages: int) -> dict[str, Any]:
+    """Round trip of power state requests through the SDK."""
+    server, client = await connect(devices)
+    try:
+        latencies = []
+        for index in range(messages):
+            start = time.perf_counter()
+            await server.send_request(device_id(index % devices), "setPowerState", {"state": "On"})
+            latencies.append(time.perf_counter() - start)
+
+        server.reset_stats()
+        stats = await server.run_load(rate=1e9, count=messages)
+        check(server)
+        responses, elapsed = stats["responses"], stats["elapsed_s"]
+        return result("request_response", devices, responses, elapsed, latencies)
+    finally:
+        await disconnect(server, client)
+
+
+async def bench_event(devices: int, messages: int) -> dict[str, Any]:
+    """Events from device.send_event until the mock server received them."""
+    server, client = await connect(devices)
+    switches = [client.devices[device_id(index)] for index in range(devices)]
+    try:
+        latencies = []
+        for index in range(messages):
+            start = time.perf_counter()
+            await switches[index % devices].send_event("setPowerState", {"state": "On"})
+            await server.wait_for_events(index + 1)
+            latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for index in range(messages):
+            await switches[index % devices].send_event("setPowerState", {"state": "Off"})
+        await server.wait_for_events(2 * messages, timeout=60)
+        elapsed = time.perf_counter() - start
+        check(server)
+        return result("event", devices, messages, elapsed, latencies)
+    finally:
+        await disconnect(server, client)
+
+
+def bench_signature(messages: int) -> list[dict[str, Any]]:
+    """Signature.sign and Signature.validate of a request."""
+    signature = Signature(APP_SECRET, get_codec())
+    message = json.loads(json.dumps(REQUEST))
+    message["signature"] = {"HMAC": signature.sign(message)}
+    raw = json.dumps(message, separators=(",", ":"))
+    parsed, raw_payload = parse_message(raw)
+
+    results = []
+    for name, operation in (
+        ("sign", lambda: signature.sign(message)),
+        ("validate", lambda: signature.validate(parsed, raw_payload)),
+    ):
+        latencies = []
+        for _ in range(messages):
+            start = time.perf_counter()
+            operation()
+            latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(messages):
+            operation()
+        results.append(result(name, None, messages, time.perf_counter() - start, latencies))
+    return results
+
+
+def bench_add(devices: int) -> dict[str, Any]:
+    """SinricPro.add of devices to an empty client."""
+    client = SinricPro()
+    switches = [SinricProSwitch(device_id(index)) for index in range(devices)]
+    latencies = []
+    start = time.perf_counter()
+    for switch in switches:
+        added = time.perf_counter()
+        client.add(switch)
+        latencies.append(time.perf_counter() - added)
+    return result("add", devices, devices, time.perf_counter() - start, latencies)
+
+
+def metadata() -> dict[str, Any]:
+    """Describe the environment the results were measured in."""
+    return {
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "json_codec": get_codec().name,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def compare(results: list[dict[str, Any]], baseline_path: str) -> None:
+    """Print the change of every result against a baseline results file."""
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = {
+            (entry["benchmark"], entry["devices"]): entry
+            for entry in json.load(baseline_file)["results"]
+        }
+
+    print(f"\nChange against {baseline_path}:")
+    for entry in results:
+        before = baseline.get((entry["benchmark"], entry["devices"]))
+        if before is None:
+            continue
+        changes = "  ".join(
+            f"{key} {(entry[key] / before[key] - 1) * 100:+6.1f}%"
+            for key in ("ops_per_s", "p50_us", "p99_us")
+            if before[key]
+        )
+        print(f"{entry['benchmark']:>16} {str(entry['devices']):>7}  {changes}")
+
+
+async def run(device_counts: list[int], messages: int) -> list[dict[str, Any]]:
+    """Run all benchmarks and print the results as they complete."""
+    results = bench_signature(messages * 10)
+    for devices in device_counts:
+        results.append(bench_add(devices))
+        results.append(await bench_request_response(devices, messages))
+        results.append(await bench_event(devices, messages))
+
+    print(f"{'benchmark':>16} {'devices':>7} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10}")
+    for entry in results:
+        print(
+            f"{entry['benchmark']:>16} {str(entry['devices']):>7} {entry['ops_per_s']:12,.0f} "
+            f"{entry['p50_us']:10.1f} {entry['p99_us']:10.1f}"
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        "--devices",
+        default=",".join(str(count) for count in DEVICE_COUNTS),
+        help="comma-separated device counts",
+    )
+    parser.add_argument("--messages", type=int, default=2000, help="messages per benchmark")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="print the change against a previous results file")
+    args = parser.parse_args()
+
+    SinricProLogger.set_level(LogLevel.NONE)
+    device_counts = [int(count) for count in args.devices.split(",")]
+    results = asyncio.run(run(device_counts, args.messages))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump({"metadata": metadata(), "results": results}, output, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
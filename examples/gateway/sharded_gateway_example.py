@@ -0,0 +1,80 @@
+"""
+SinricPro Sharded Gateway Example
+
+Demonstrates serving a large fleet of switches from several worker processes.
+"""
+
+import asyncio
+import os
+
+from sinricpro import ShardedGateway, SinricProConfig, SinricProSwitch
+
+# Device IDs from SinricPro portal
+DEVICE_IDS = [
+    "YOUR_DEVICE_ID_HERE",  # Replace with your device IDs
+]
+
+# Credentials from SinricPro portal
+APP_KEY = os.getenv("SINRICPRO_APP_KEY", "YOUR_APP_KEY_HERE")
+APP_SECRET = os.getenv("SINRICPRO_APP_SECRET", "YOUR_APP_SECRET_HERE")
+
+
+async def on_power_state(state: bool) -> bool:
+    """
+    Handle power state changes from SinricPro (runs in a worker process).
+
+    Args:
+        state: True for On, False for Off
+
+    Returns:
+        True if the state was successfully changed
+    """
+    print(f"[pid {os.getpid()}] Switch turned {'ON' if state else 'OFF'}")
+    return True
+
+
+def make_device(device_id: str) -> SinricProSwitch:
+    """
+    Create a device inside a worker process.
+
+    Must be a module-level function so it can be sent to the workers.
+
+    Args:
+        device_id: Device ID
+
+    Returns:
+        The configured device
+    """
+    switch = SinricProSwitch(device_id)
+    switch.on_power_state(on_power_state)
+    return switch
+
+
+async def main() -> None:
+    """Main function."""
+    config = SinricProConfig(app_key=APP_KEY, app_secret=APP_SECRET)
+
+    # One worker process per CPU core by default
+    gateway = ShardedGateway(config, DEVICE_IDS, make_device)
+
+    try:
+        await gateway.start()
+        print("Gateway started. Press Ctrl+C to exit")
+
+        while True:
+            await asyncio.sleep(10)
+            status = gateway.get_status()
+            print(
+                f"{status['connected']}/{status['workers']} workers connected, "
+                f"{status['devices']} devices, {status['restarts']} restarts"
+            )
+
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        await gateway.stop()
+
+
+if __name__ == "__main__":
+    # The guard is required: worker processes import this module
+    asyncio.run(main())
@@ -11,54 +11,124 @@ This file is part of the SinricPro Python SDK (https://github.com/sinricpro/)
 
 __version__ = "5.2.1"
 
-from sinricpro.core.sinric_pro import SinricPro, SinricProConfig
-from sinricpro.core.sinric_pro_device import SinricProDevice
-from sinricpro.utils.logger import SinricProLogger, LogLevel
-
-# Devices - Lighting & Switches
-from sinricpro.devices.sinric_pro_switch import SinricProSwitch
-from sinricpro.devices.sinric_pro_light import SinricProLight
-from sinricpro.devices.sinric_pro_dimswitch import SinricProDimSwitch
-
-# Devices - Sensors
-from sinricpro.devices.sinric_pro_motion_sensor import SinricProMotionSensor
-from sinricpro.devices.sinric_pro_contact_sensor import SinricProContactSensor
-from sinricpro.devices.sinric_pro_temperature_sensor import SinricProTemperatureSensor
-from sinricpro.devices.sinric_pro_air_quality_sensor import SinricProAirQualitySensor
-from sinricpro.devices.sinric_pro_power_sensor import SinricProPowerSensor
-
-# Devices - Control
-from sinricpro.devices.sinric_pro_blinds import SinricProBlinds
-from sinricpro.devices.sinric_pro_garage_door import SinricProGarageDoor
-from sinricpro.devices.sinric_pro_lock import SinricProLock
-
-# Devices - Climate
-from sinricpro.devices.sinric_pro_thermostat import SinricProThermostat
-from sinricpro.devices.sinric_pro_window_ac import SinricProWindowAC
-
-# Devices - Other
-from sinricpro.devices.sinric_pro_fan import SinricProFan
-from sinricpro.devices.sinric_pro_doorbell import SinricProDoorbell
-from sinricpro.devices.sinric_pro_camera import SinricProCamera
-from sinricpro.devices.sinric_pro_custom_device import SinricProCustomDevice
-from sinricpro.devices.sinric_pro_speaker import SinricProSpeaker
-from sinricpro.devices.sinric_pro_tv import SinricProTV
-
-# Exceptions
-from sinricpro.core.exceptions import (
-    SinricProError,
-    SinricProConnectionError,
-    SinricProConfigurationError,
-    SinricProDeviceError,
-    SinricProSignatureError,
-    SinricProTimeoutError,
-)
+from typing import TYPE_CHECKING
+
+from sinricpro.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from sinricpro.core.sinric_pro import SinricPro, SinricProConfig
+    from sinricpro.core.sinric_pro_device import SinricProDevice
+    from sinricpro.core.message_queue import OverflowPolicy, SchedulingPolicy
+    from sinricpro.core.event_spool import FsyncPolicy
+    from sinricpro.core.deadband import Deadband
+    from sinricpro.core.types import BulkEvent
+    from sinricpro.core.sharded_gateway import ShardedGateway
+    from sinricpro.utils.logger import SinricProLogger, LogLevel
+
+    # Devices - Lighting & Switches
+    from sinricpro.devices.sinric_pro_switch import SinricProSwitch
+    from sinricpro.devices.sinric_pro_light import SinricProLight
+    from sinricpro.devices.sinric_pro_dimswitch import SinricProDimSwitch
+
+    # Devices - Sensors
+    from sinricpro.devices.sinric_pro_motion_sensor import SinricProMotionSensor
+    from sinricpro.devices.sinric_pro_contact_sensor import SinricProContactSensor
+    from sinricpro.devices.sinric_pro_temperature_sensor import SinricProTemperatureSensor
+    from sinricpro.devices.sinric_pro_air_quality_sensor import SinricProAirQualitySensor
+    from sinricpro.devices.sinric_pro_power_sensor import SinricProPowerSensor
+
+    # Devices - Control
+    from sinricpro.devices.sinric_pro_blinds import SinricProBlinds
+    from sinricpro.devices.sinric_pro_garage_door import SinricProGarageDoor
+    from sinricpro.devices.sinric_pro_lock import SinricProLock
+
+    # Devices - Climate
+    from sinricpro.devices.sinric_pro_thermostat import SinricProThermostat
+    from sinricpro.devices.sinric_pro_window_ac import SinricProWindowAC
+
+    # Devices - Other
+    from sinricpro.devices.sinric_pro_fan import SinricProFan
+    from sinricpro.devices.sinric_pro_doorbell import SinricProDoorbell
+    from sinricpro.devices.sinric_pro_camera import SinricProCamera
+    from sinricpro.devices.sinric_pro_custom_device import SinricProCustomDevice
+    from sinricpro.devices.sinric_pro_speaker import SinricProSpeaker
+    from sinricpro.devices.sinric_pro_tv import SinricProTV
+
+    # Exceptions
+    from sinricpro.core.exceptions import (
+        SinricProError,
+        SinricProConnectionError,
+        SinricProConfigurationError,
+        SinricProDeviceError,
+        SinricProSignatureError,
+        SinricProTimeoutError,
+    )
+
+# Public name -> defining module, imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "SinricPro": "sinricpro.core.sinric_pro",
+    "SinricProConfig": "sinricpro.core.sinric_pro",
+    "SinricProDevice": "sinricpro.core.sinric_pro_device",
+    "OverflowPolicy": "sinricpro.core.message_queue",
+    "SchedulingPolicy": "sinricpro.core.message_queue",
+    "FsyncPolicy": "sinricpro.core.event_spool",
+    "Deadband": "sinricpro.core.deadband",
+    "BulkEvent": "sinricpro.core.types",
+    "ShardedGateway": "sinricpro.core.sharded_gateway",
+    "SinricProLogger": "sinricpro.utils.logger",
+    "LogLevel": "sinricpro.utils.logger",
+
+    # Devices - Lighting & Switches
+    "SinricProSwitch": "sinricpro.devices.sinric_pro_switch",
+    "SinricProLight": "sinricpro.devices.sinric_pro_light",
+    "SinricProDimSwitch": "sinricpro.devices.sinric_pro_dimswitch",
+
+    # Devices - Sensors
+    "SinricProMotionSensor": "sinricpro.devices.sinric_pro_motion_sensor",
+    "SinricProContactSensor": "sinricpro.devices.sinric_pro_contact_sensor",
+    "SinricProTemperatureSensor": "sinricpro.devices.sinric_pro_temperature_sensor",
+    "SinricProAirQualitySensor": "sinricpro.devices.sinric_pro_air_quality_sensor",
+    "SinricProPowerSensor": "sinricpro.devices.sinric_pro_power_sensor",
+
+    # Devices - Control
+    "SinricProBlinds": "sinricpro.devices.sinric_pro_blinds",
+    "SinricProGarageDoor": "sinricpro.devices.sinric_pro_garage_door",
+    "SinricProLock": "sinricpro.devices.sinric_pro_lock",
+
+    # Devices - Climate
+    "SinricProThermostat": "sinricpro.devices.sinric_pro_thermostat",
+    "SinricProWindowAC": "sinricpro.devices.sinric_pro_window_ac",
+
+    # Devices - Other
+    "SinricProFan": "sinricpro.devices.sinric_pro_fan",
+    "SinricProDoorbell": "sinricpro.devices.sinric_pro_doorbell",
+    "SinricProCamera": "sinricpro.devices.sinric_pro_camera",
+    "SinricProCustomDevice": "sinricpro.devices.sinric_pro_custom_device",
+    "SinricProSpeaker": "sinricpro.devices.sinric_pro_speaker",
+    "SinricProTV": "sinricpro.devices.sinric_pro_tv",
+
+    # Exceptions
+    "SinricProError": "sinricpro.core.exceptions",
+    "SinricProConnectionError": "sinricpro.core.exceptions",
+    "SinricProConfigurationError": "sinricpro.core.exceptions",
+    "SinricProDeviceError": "sinricpro.core.exceptions",
+    "SinricProSignatureError": "sinricpro.core.exceptions",
+    "SinricProTimeoutError": "sinricpro.core.exceptions",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 __all__ = [
     # Main classes
     "SinricPro",
     "SinricProConfig",
     "SinricProDevice",
+    "OverflowPolicy",
+    "SchedulingPolicy",
+    "FsyncPolicy",
+    "Deadband",
+    "BulkEvent",
+    "ShardedGateway",
     # Devices - Lighting & Switches
     "SinricProSwitch",
     "SinricProLight",
@@ -4,31 +4,67 @@ SinricPro Capabilities
 Device capability controllers for SinricPro devices.
 """
 
-from sinricpro.capabilities.air_quality_sensor import AirQualitySensor
-from sinricpro.capabilities.brightness_controller import BrightnessController
-from sinricpro.capabilities.camera_controller import CameraController
-from sinricpro.capabilities.color_controller import ColorController
-from sinricpro.capabilities.color_temperature_controller import ColorTemperatureController
-from sinricpro.capabilities.contact_sensor import ContactSensor
-from sinricpro.capabilities.mode_controller import ModeController
-from sinricpro.capabilities.lock_controller import LockController
-from sinricpro.capabilities.motion_sensor import MotionSensor
-from sinricpro.capabilities.open_close_controller import OpenCloseController
-from sinricpro.capabilities.percentage_controller import PercentageController
-from sinricpro.capabilities.power_level_controller import PowerLevelController
-from sinricpro.capabilities.power_sensor import PowerSensor
-from sinricpro.capabilities.power_state_controller import PowerStateController
-from sinricpro.capabilities.push_notification import PushNotification
-from sinricpro.capabilities.range_controller import RangeController
-from sinricpro.capabilities.setting_controller import SettingController
-from sinricpro.capabilities.temperature_sensor import TemperatureSensor
-from sinricpro.capabilities.thermostat_controller import ThermostatController
-from sinricpro.capabilities.volume_controller import VolumeController
-from sinricpro.capabilities.mute_controller import MuteController
-from sinricpro.capabilities.media_controller import MediaController
-from sinricpro.capabilities.equalizer_controller import EqualizerController
-from sinricpro.capabilities.channel_controller import ChannelController
-from sinricpro.capabilities.input_controller import InputController
+from typing import TYPE_CHECKING
+
+from sinricpro.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from sinricpro.capabilities.air_quality_sensor import AirQualitySensor
+    from sinricpro.capabilities.brightness_controller import BrightnessController
+    from sinricpro.capabilities.camera_controller import CameraController
+    from sinricpro.capabilities.color_controller import ColorController
+    from sinricpro.capabilities.color_temperature_controller import ColorTemperatureController
+    from sinricpro.capabilities.contact_sensor import ContactSensor
+    from sinricpro.capabilities.mode_controller import ModeController
+    from sinricpro.capabilities.lock_controller import LockController
+    from sinricpro.capabilities.motion_sensor import MotionSensor
+    from sinricpro.capabilities.open_close_controller import OpenCloseController
+    from sinricpro.capabilities.percentage_controller import PercentageController
+    from sinricpro.capabilities.power_level_controller import PowerLevelController
+    from sinricpro.capabilities.power_sensor import PowerSensor
+    from sinricpro.capabilities.power_state_controller import PowerStateController
+    from sinricpro.capabilities.push_notification import PushNotification
+    from sinricpro.capabilities.range_controller import RangeController
+    from sinricpro.capabilities.setting_controller import SettingController
+    from sinricpro.capabilities.temperature_sensor import TemperatureSensor
+    from sinricpro.capabilities.thermostat_controller import ThermostatController
+    from sinricpro.capabilities.volume_controller import VolumeController
+    from sinricpro.capabilities.mute_controller import MuteController
+    from sinricpro.capabilities.media_controller import MediaController
+    from sinricpro.capabilities.equalizer_controller import EqualizerController
+    from sinricpro.capabilities.channel_controller import ChannelController
+    from sinricpro.capabilities.input_controller import InputController
+
+# Public name -> defining module, imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "AirQualitySensor": "sinricpro.capabilities.air_quality_sensor",
+    "BrightnessController": "sinricpro.capabilities.brightness_controller",
+    "CameraController": "sinricpro.capabilities.camera_controller",
+    "ColorController": "sinricpro.capabilities.color_controller",
+    "ColorTemperatureController": "sinricpro.capabilities.color_temperature_controller",
+    "ContactSensor": "sinricpro.capabilities.contact_sensor",
+    "ModeController": "sinricpro.capabilities.mode_controller",
+    "LockController": "sinricpro.capabilities.lock_controller",
+    "MotionSensor": "sinricpro.capabilities.motion_sensor",
+    "OpenCloseController": "sinricpro.capabilities.open_close_controller",
+    "PercentageController": "sinricpro.capabilities.percentage_controller",
+    "PowerLevelController": "sinricpro.capabilities.power_level_controller",
+    "PowerSensor": "sinricpro.capabilities.power_sensor",
+    "PowerStateController": "sinricpro.capabilities.power_state_controller",
+    "PushNotification": "sinricpro.capabilities.push_notification",
+    "RangeController": "sinricpro.capabilities.range_controller",
+    "SettingController": "sinricpro.capabilities.setting_controller",
+    "TemperatureSensor": "sinricpro.capabilities.temperature_sensor",
+    "ThermostatController": "sinricpro.capabilities.thermostat_controller",
+    "VolumeController": "sinricpro.capabilities.volume_controller",
+    "MuteController": "sinricpro.capabilities.mute_controller",
+    "MediaController": "sinricpro.capabilities.media_controller",
+    "EqualizerController": "sinricpro.capabilities.equalizer_controller",
+    "ChannelController": "sinricpro.capabilities.channel_controller",
+    "InputController": "sinricpro.capabilities.input_controller",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 __all__ = [
     "AirQualitySensor",
@@ -6,6 +6,8 @@ Provides air quality sensing functionality (PM1.0, PM2.5, PM10).
 
 from typing import Any, TYPE_CHECKING
 
+from sinricpro.core.action_dispatch import EventSpec
+from sinricpro.core.deadband import Deadband
 from sinricpro.core.event_limiter import EventLimiter
 from sinricpro.core.actions import ACTION_AIR_QUALITY
 from sinricpro.core.types import EVENT_LIMIT_SENSOR_VALUE
@@ -28,10 +30,30 @@ class AirQualitySensor:
         >>> await sensor.send_air_quality_event(pm1_0=10, pm2_5=25, pm10=50)
     """
 
+    _events = {ACTION_AIR_QUALITY: EventSpec("_air_quality_limiter", "_air_quality_deadband")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize AirQualitySensor mixin."""
         super().__init__(*args, **kwargs)
         self._air_quality_limiter = EventLimiter(EVENT_LIMIT_SENSOR_VALUE)
+        self._air_quality_deadband: Deadband | None = None
+
+    def set_air_quality_deadband(self, deadband: Deadband | None) -> None:
+        """
+        Send air quality readings only when they change significantly.
+
+        A reading is sent when PM1.0, PM2.5 or PM10 moved beyond the deadband
+        since the last reported reading, or when the deadband's heartbeat is
+        due; other readings are skipped before rate limiting and their send
+        call returns True.
+
+        Args:
+            deadband: Deadband to apply, or None to send every reading
+
+        Example:
+            >>> sensor.set_air_quality_deadband(Deadband(relative=0.1, absolute=2))
+        """
+        self._air_quality_deadband = deadband
 
     async def send_air_quality_event(
         self,
@@ -56,24 +78,16 @@ class AirQualitySensor:
             >>> await sensor.send_air_quality_event(pm1_0=10, pm2_5=25, pm10=50)
             True
         """
-        # Check rate limiting
-        if not self._air_quality_limiter.can_send_event():
-            SinricProLogger.warn("Air quality event rate limited")
-            return False
-
         # Type check - ensure self is a SinricProDevice
         if not hasattr(self, "send_event"):
             SinricProLogger.error("AirQualitySensor must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_AIR_QUALITY,
             value={"pm1": pm1_0, "pm2_5": pm2_5, "pm10": pm10},
             cause=cause,
+            limiter=self._air_quality_limiter,
+            deadband=self._air_quality_deadband,
         )
-
-        if success:
-            self._air_quality_limiter.event_sent()
-
-        return success
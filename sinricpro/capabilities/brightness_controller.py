@@ -7,7 +7,8 @@ Provides brightness control functionality for dimmable devices.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
-from sinricpro.core.actions import ACTION_SET_BRIGHTNESS
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
+from sinricpro.core.actions import ACTION_SET_BRIGHTNESS, ACTION_ADJUST_BRIGHTNESS
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
 
@@ -34,6 +35,18 @@ class BrightnessController:
         >>> light.on_brightness(on_brightness)
     """
 
+    _actions = {
+        ACTION_SET_BRIGHTNESS: ActionSpec("handle_brightness_request", request_value("brightness", 0)),
+        ACTION_ADJUST_BRIGHTNESS: ActionSpec(
+            "handle_adjust_brightness_request",
+            request_value("brightnessDelta", 0),
+            state=ACTION_SET_BRIGHTNESS,
+            relative=True,
+        ),
+    }
+
+    _events = {ACTION_SET_BRIGHTNESS: EventSpec("_brightness_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize BrightnessController mixin."""
         super().__init__(*args, **kwargs)
@@ -89,12 +102,14 @@ class BrightnessController:
             Tuple of (success, response_value)
         """
         if not self._brightness_callback:
-            SinricProLogger.error(f"No brightness callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No brightness callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         # Validate brightness range
         if not 0 <= brightness <= 100:
-            SinricProLogger.error(f"Invalid brightness value: {brightness} (must be 0-100)")
+            SinricProLogger.error("Invalid brightness value: %s (must be 0-100)", brightness)
             return False, {}
 
         try:
@@ -104,7 +119,7 @@ class BrightnessController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in brightness callback: {e}")
+            SinricProLogger.error("Error in brightness callback: %s", e)
             return False, {}
 
     async def handle_adjust_brightness_request(
@@ -121,7 +136,9 @@ class BrightnessController:
             Tuple of (success, response_value)
         """
         if not self._adjust_brightness_callback:
-            SinricProLogger.error(f"No adjust brightness callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No adjust brightness callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -131,7 +148,7 @@ class BrightnessController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in adjust brightness callback: {e}")
+            SinricProLogger.error("Error in adjust brightness callback: %s", e)
             return False, {}
 
     async def send_brightness_event(
@@ -153,12 +170,7 @@ class BrightnessController:
         """
         # Validate brightness range
         if not 0 <= brightness <= 100:
-            SinricProLogger.error(f"Invalid brightness value: {brightness} (must be 0-100)")
-            return False
-
-        # Check rate limiting
-        if not self._brightness_limiter.can_send_event():
-            SinricProLogger.warn("Brightness event rate limited")
+            SinricProLogger.error("Invalid brightness value: %s (must be 0-100)", brightness)
             return False
 
         # Type check - ensure self is a SinricProDevice
@@ -167,13 +179,9 @@ class BrightnessController:
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_BRIGHTNESS,
             value={"brightness": brightness},
             cause=cause,
+            limiter=self._brightness_limiter,
         )
-
-        if success:
-            self._brightness_limiter.event_sent()
-
-        return success
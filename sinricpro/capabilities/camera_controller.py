@@ -5,10 +5,15 @@ Provides camera control functionality including snapshot capture and motion dete
 """
 
 from typing import Any, Callable, Awaitable, TYPE_CHECKING, Optional
-import aiohttp
 import time
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, request_value
+from sinricpro.core.actions import (
+    ACTION_GET_SNAPSHOT,
+    ACTION_GET_WEBRTC_ANSWER,
+    ACTION_GET_CAMERA_STREAM_URL,
+)
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
 
@@ -42,6 +47,16 @@ class CameraController:
     SNAPSHOT_ENDPOINT = "/api/v1/camera/snapshot"
     MOTION_ENDPOINT = "/api/v1/camera/motion"
 
+    _actions = {
+        ACTION_GET_SNAPSHOT: ActionSpec("handle_snapshot_request", state=None),
+        ACTION_GET_WEBRTC_ANSWER: ActionSpec(
+            "handle_get_webrtc_answer", request_value("offer", ""), state=None
+        ),
+        ACTION_GET_CAMERA_STREAM_URL: ActionSpec(
+            "handle_get_camera_stream_url", request_value("protocol", ""), state=None
+        ),
+    }
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize CameraController mixin."""
         super().__init__(*args, **kwargs)
@@ -79,7 +94,7 @@ class CameraController:
     ) -> tuple[bool, dict[str, Any]]:
         if not self._camera_webrtc_answer_callback:
             SinricProLogger.error(
-                f"No get webrtc answer callback registered for {device.get_device_id()}"
+                "No get webrtc answer callback registered for %s", device.get_device_id()
             )
             return False, {}
 
@@ -90,7 +105,7 @@ class CameraController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in webrtc callback: {e}")
+            SinricProLogger.error("Error in webrtc callback: %s", e)
             return False, {}
         
     async def handle_get_camera_stream_url(
@@ -98,7 +113,7 @@ class CameraController:
     ) -> tuple[bool, dict[str, Any]]:
         if not self._camera_stream_url_callback:
             SinricProLogger.error(
-                f"No get camera stream url callback registered for {device.get_device_id()}"
+                "No get camera stream url callback registered for %s", device.get_device_id()
             )
             return False, {}
 
@@ -109,7 +124,7 @@ class CameraController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in get camera stream url callback: {e}")
+            SinricProLogger.error("Error in get camera stream url callback: %s", e)
             return False, {}
                 
     async def handle_snapshot_request(
@@ -125,9 +140,7 @@ class CameraController:
             Tuple of (success, response_value)
         """
         if not self._snapshot_callback:
-            SinricProLogger.error(
-                f"No snapshot callback registered for {device.get_device_id()}"
-            )
+            SinricProLogger.error("No snapshot callback registered for %s", device.get_device_id())
             return False, {}
 
         try:
@@ -137,7 +150,7 @@ class CameraController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in snapshot callback: {e}")
+            SinricProLogger.error("Error in snapshot callback: %s", e)
             return False, {}
 
     async def send_snapshot(
@@ -189,7 +202,9 @@ class CameraController:
                 "Content-Type": content_type,
             }
 
-            # Upload snapshot
+            # Upload snapshot (aiohttp is imported on first use: it is slow to import)
+            import aiohttp
+
             url = f"{self.CAMERA_API_URL}{self.SNAPSHOT_ENDPOINT}"
 
             async with aiohttp.ClientSession() as session:
@@ -202,12 +217,12 @@ class CameraController:
                     else:
                         error_text = await response.text()
                         SinricProLogger.error(
-                            f"Failed to upload snapshot: {response.status} - {error_text}"
+                            "Failed to upload snapshot: %s - %s", response.status, error_text
                         )
                         return False
 
         except Exception as e:
-            SinricProLogger.error(f"Error uploading snapshot: {e}")
+            SinricProLogger.error("Error uploading snapshot: %s", e)
             return False
 
     async def send_motion_event(
@@ -265,6 +280,8 @@ class CameraController:
                     "Content-Type": "video/mp4",
                 }
 
+                import aiohttp
+
                 url = f"{self.CAMERA_API_URL}{self.MOTION_ENDPOINT}"
 
                 async with aiohttp.ClientSession() as session:
@@ -274,12 +291,12 @@ class CameraController:
                         if response.status != 200:
                             error_text = await response.text()
                             SinricProLogger.error(
-                                f"Failed to upload motion data: {response.status} - {error_text}"
+                                "Failed to upload motion data: %s - %s", response.status, error_text
                             )
                             return False
 
             except Exception as e:
-                SinricProLogger.error(f"Error uploading motion data: {e}")
+                SinricProLogger.error("Error uploading motion data: %s", e)
                 return False
 
         # Send motion event
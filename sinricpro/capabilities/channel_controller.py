@@ -7,6 +7,7 @@ Provides TV channel control functionality.
 from typing import Any, Callable, Awaitable, TypedDict, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_CHANGE_CHANNEL, ACTION_SKIP_CHANNELS
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -28,6 +29,18 @@ SkipChannelsCallback = Callable[[int], Awaitable[bool]]
 class ChannelController:
     """Mixin providing TV channel control capability."""
 
+    _actions = {
+        ACTION_CHANGE_CHANNEL: ActionSpec("handle_change_channel_request", request_value("channel", {})),
+        ACTION_SKIP_CHANNELS: ActionSpec(
+            "handle_skip_channels_request",
+            request_value("channelCount", 0),
+            state=ACTION_CHANGE_CHANNEL,
+            relative=True,
+        ),
+    }
+
+    _events = {ACTION_CHANGE_CHANNEL: EventSpec("_channel_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize ChannelController mixin."""
         super().__init__(*args, **kwargs)
@@ -58,7 +71,9 @@ class ChannelController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle changeChannel request."""
         if not self._change_channel_callback:
-            SinricProLogger.error(f"No change channel callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No change channel callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -68,7 +83,7 @@ class ChannelController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in change channel callback: {e}")
+            SinricProLogger.error("Error in change channel callback: %s", e)
             return False, {}
 
     async def handle_skip_channels_request(
@@ -76,7 +91,9 @@ class ChannelController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle skipChannels request."""
         if not self._skip_channels_callback:
-            SinricProLogger.error(f"No skip channels callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No skip channels callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -86,7 +103,7 @@ class ChannelController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in skip channels callback: {e}")
+            SinricProLogger.error("Error in skip channels callback: %s", e)
             return False, {}
 
     async def send_channel_event(
@@ -101,18 +118,14 @@ class ChannelController:
         Returns:
             True if event was sent successfully
         """
-        if not self._channel_limiter.can_send_event():
-            SinricProLogger.warn("Channel event rate limited")
-            return False
-
         if not hasattr(self, "send_event"):
             SinricProLogger.error("ChannelController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_CHANGE_CHANNEL, value={"channel": channel}, cause=cause)
-
-        if success:
-            self._channel_limiter.event_sent()
-
-        return success
+        return await device.send_event(
+            action=ACTION_CHANGE_CHANNEL,
+            value={"channel": channel},
+            cause=cause,
+            limiter=self._channel_limiter,
+        )
@@ -7,6 +7,7 @@ Provides RGB color control functionality for color-capable devices.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_COLOR
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -34,6 +35,12 @@ class ColorController:
         >>> light.on_color(on_color)
     """
 
+    _actions = {
+        ACTION_SET_COLOR: ActionSpec("handle_color_request", request_value("color", {})),
+    }
+
+    _events = {ACTION_SET_COLOR: EventSpec("_color_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize ColorController mixin."""
         super().__init__(*args, **kwargs)
@@ -71,7 +78,7 @@ class ColorController:
             Tuple of (success, response_value)
         """
         if not self._color_callback:
-            SinricProLogger.error(f"No color callback registered for {device.get_device_id()}")
+            SinricProLogger.error("No color callback registered for %s", device.get_device_id())
             return False, {}
 
         try:
@@ -82,7 +89,7 @@ class ColorController:
 
             # Validate RGB range
             if not all(0 <= val <= 255 for val in [r, g, b]):
-                SinricProLogger.error(f"Invalid RGB values: ({r}, {g}, {b}) - must be 0-255")
+                SinricProLogger.error("Invalid RGB values: (%s, %s, %s) - must be 0-255", r, g, b)
                 return False, {}
 
             success = await self._color_callback(r, g, b)
@@ -91,7 +98,7 @@ class ColorController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in color callback: {e}")
+            SinricProLogger.error("Error in color callback: %s", e)
             return False, {}
 
     async def send_color_event(
@@ -115,12 +122,7 @@ class ColorController:
         """
         # Validate RGB range
         if not all(0 <= val <= 255 for val in [r, g, b]):
-            SinricProLogger.error(f"Invalid RGB values: ({r}, {g}, {b}) - must be 0-255")
-            return False
-
-        # Check rate limiting
-        if not self._color_limiter.can_send_event():
-            SinricProLogger.warn("Color event rate limited")
+            SinricProLogger.error("Invalid RGB values: (%s, %s, %s) - must be 0-255", r, g, b)
             return False
 
         # Type check - ensure self is a SinricProDevice
@@ -129,13 +131,9 @@ class ColorController:
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_COLOR,
             value={"color": {"r": r, "g": g, "b": b}},
             cause=cause,
+            limiter=self._color_limiter,
         )
-
-        if success:
-            self._color_limiter.event_sent()
-
-        return success
@@ -7,7 +7,12 @@ Provides color temperature control functionality for lights.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
-from sinricpro.core.actions import ACTION_SET_COLOR_TEMPERATURE
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
+from sinricpro.core.actions import (
+    ACTION_SET_COLOR_TEMPERATURE,
+    ACTION_INCREASE_COLOR_TEMPERATURE,
+    ACTION_DECREASE_COLOR_TEMPERATURE,
+)
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
 
@@ -34,6 +39,24 @@ class ColorTemperatureController:
         >>> light.on_color_temperature(on_color_temperature)
     """
 
+    _actions = {
+        ACTION_SET_COLOR_TEMPERATURE: ActionSpec(
+            "handle_color_temperature_request", request_value("colorTemperature", 2700)
+        ),
+        ACTION_INCREASE_COLOR_TEMPERATURE: ActionSpec(
+            "handle_increase_color_temperature_request",
+            state=ACTION_SET_COLOR_TEMPERATURE,
+            relative=True,
+        ),
+        ACTION_DECREASE_COLOR_TEMPERATURE: ActionSpec(
+            "handle_decrease_color_temperature_request",
+            state=ACTION_SET_COLOR_TEMPERATURE,
+            relative=True,
+        ),
+    }
+
+    _events = {ACTION_SET_COLOR_TEMPERATURE: EventSpec("_color_temperature_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize ColorTemperatureController mixin."""
         super().__init__(*args, **kwargs)
@@ -73,14 +96,14 @@ class ColorTemperatureController:
         """
         if not self._color_temperature_callback:
             SinricProLogger.error(
-                f"No color temperature callback registered for {device.get_device_id()}"
+                "No color temperature callback registered for %s", device.get_device_id()
             )
             return False, {}
 
         # Validate color temperature range (typical range is 2000-7000K)
         if not 1000 <= color_temperature <= 10000:
             SinricProLogger.warn(
-                f"Color temperature {color_temperature}K outside typical range (2000-7000K)"
+                "Color temperature %sK outside typical range (2000-7000K)", color_temperature
             )
 
         try:
@@ -90,7 +113,7 @@ class ColorTemperatureController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in color temperature callback: {e}")
+            SinricProLogger.error("Error in color temperature callback: %s", e)
             return False, {}
 
     async def handle_increase_color_temperature_request(
@@ -147,27 +170,18 @@ class ColorTemperatureController:
         # Validate color temperature range
         if not 1000 <= color_temperature <= 10000:
             SinricProLogger.warn(
-                f"Color temperature {color_temperature}K outside typical range (2000-7000K)"
+                "Color temperature %sK outside typical range (2000-7000K)", color_temperature
             )
 
-        # Check rate limiting
-        if not self._color_temperature_limiter.can_send_event():
-            SinricProLogger.warn("Color temperature event rate limited")
-            return False
-
         # Type check - ensure self is a SinricProDevice
         if not hasattr(self, "send_event"):
             SinricProLogger.error("ColorTemperatureController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_COLOR_TEMPERATURE,
             value={"colorTemperature": color_temperature},
             cause=cause,
+            limiter=self._color_temperature_limiter,
         )
-
-        if success:
-            self._color_temperature_limiter.event_sent()
-
-        return success
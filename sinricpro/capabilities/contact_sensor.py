@@ -6,6 +6,7 @@ Provides contact/door sensor functionality.
 
 from typing import Any, TYPE_CHECKING
 
+from sinricpro.core.action_dispatch import EventSpec
 from sinricpro.core.event_limiter import EventLimiter
 from sinricpro.core.actions import ACTION_SET_CONTACT_STATE
 from sinricpro.core.types import EVENT_LIMIT_STATE
@@ -29,6 +30,8 @@ class ContactSensor:
         >>> await sensor.send_contact_event(True)   # Door open
     """
 
+    _events = {ACTION_SET_CONTACT_STATE: EventSpec("_contact_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize ContactSensor mixin."""
         super().__init__(*args, **kwargs)
@@ -51,24 +54,15 @@ class ContactSensor:
             >>> await sensor.send_contact_event(False)  # Contact closed
             True
         """
-        # Check rate limiting
-        if not self._contact_limiter.can_send_event():
-            SinricProLogger.warn("Contact event rate limited")
-            return False
-
         # Type check - ensure self is a SinricProDevice
         if not hasattr(self, "send_event"):
             SinricProLogger.error("ContactSensor must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_CONTACT_STATE,
             value={"state": "open" if detected else "closed"},
             cause=cause,
+            limiter=self._contact_limiter,
         )
-
-        if success:
-            self._contact_limiter.event_sent()
-
-        return success
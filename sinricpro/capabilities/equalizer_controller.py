@@ -8,6 +8,7 @@ Supports bass, midrange, and treble band adjustments.
 from typing import Any, Callable, Awaitable, TypedDict, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_BANDS, ACTION_ADJUST_BANDS
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -30,6 +31,18 @@ AdjustBandsCallback = Callable[[EqualizerBands], Awaitable[bool]]
 class EqualizerController:
     """Mixin providing equalizer control capability."""
 
+    _actions = {
+        ACTION_SET_BANDS: ActionSpec("handle_set_bands_request", request_value("bands", {})),
+        ACTION_ADJUST_BANDS: ActionSpec(
+            "handle_adjust_bands_request",
+            request_value("bands", {}),
+            state=ACTION_SET_BANDS,
+            relative=True,
+        ),
+    }
+
+    _events = {ACTION_SET_BANDS: EventSpec("_equalizer_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize EqualizerController mixin."""
         super().__init__(*args, **kwargs)
@@ -60,7 +73,7 @@ class EqualizerController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle setBands request."""
         if not self._set_bands_callback:
-            SinricProLogger.error(f"No set bands callback registered for {device.get_device_id()}")
+            SinricProLogger.error("No set bands callback registered for %s", device.get_device_id())
             return False, {}
 
         try:
@@ -70,7 +83,7 @@ class EqualizerController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in set bands callback: {e}")
+            SinricProLogger.error("Error in set bands callback: %s", e)
             return False, {}
 
     async def handle_adjust_bands_request(
@@ -78,7 +91,9 @@ class EqualizerController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle adjustBands request."""
         if not self._adjust_bands_callback:
-            SinricProLogger.error(f"No adjust bands callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No adjust bands callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -88,7 +103,7 @@ class EqualizerController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in adjust bands callback: {e}")
+            SinricProLogger.error("Error in adjust bands callback: %s", e)
             return False, {}
 
     async def send_bands_event(
@@ -103,18 +118,14 @@ class EqualizerController:
         Returns:
             True if event was sent successfully
         """
-        if not self._equalizer_limiter.can_send_event():
-            SinricProLogger.warn("Equalizer bands event rate limited")
-            return False
-
         if not hasattr(self, "send_event"):
             SinricProLogger.error("EqualizerController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_SET_BANDS, value={"bands": bands}, cause=cause)
-
-        if success:
-            self._equalizer_limiter.event_sent()
-
-        return success
+        return await device.send_event(
+            action=ACTION_SET_BANDS,
+            value={"bands": bands},
+            cause=cause,
+            limiter=self._equalizer_limiter,
+        )
@@ -7,6 +7,7 @@ Provides input selection functionality for TVs and AV receivers.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SELECT_INPUT
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -20,6 +21,12 @@ SelectInputCallback = Callable[[str], Awaitable[bool]]
 class InputController:
     """Mixin providing input selection capability."""
 
+    _actions = {
+        ACTION_SELECT_INPUT: ActionSpec("handle_select_input_request", request_value("input", "")),
+    }
+
+    _events = {ACTION_SELECT_INPUT: EventSpec("_input_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize InputController mixin."""
         super().__init__(*args, **kwargs)
@@ -40,7 +47,9 @@ class InputController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle selectInput request."""
         if not self._select_input_callback:
-            SinricProLogger.error(f"No select input callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No select input callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -50,7 +59,7 @@ class InputController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in select input callback: {e}")
+            SinricProLogger.error("Error in select input callback: %s", e)
             return False, {}
 
     async def send_input_event(
@@ -65,18 +74,14 @@ class InputController:
         Returns:
             True if event was sent successfully
         """
-        if not self._input_limiter.can_send_event():
-            SinricProLogger.warn("Input event rate limited")
-            return False
-
         if not hasattr(self, "send_event"):
             SinricProLogger.error("InputController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_SELECT_INPUT, value={"input": input_name}, cause=cause)
-
-        if success:
-            self._input_limiter.event_sent()
-
-        return success
+        return await device.send_event(
+            action=ACTION_SELECT_INPUT,
+            value={"input": input_name},
+            cause=cause,
+            limiter=self._input_limiter,
+        )
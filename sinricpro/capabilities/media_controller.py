@@ -7,6 +7,7 @@ Provides media playback control functionality for speakers, TVs, and media devic
 from typing import Any, Callable, Awaitable, Literal, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_MEDIA_CONTROL
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -21,6 +22,14 @@ MediaControlCallback = Callable[[MediaControl], Awaitable[bool]]
 class MediaController:
     """Mixin providing media playback control capability."""
 
+    _actions = {
+        ACTION_MEDIA_CONTROL: ActionSpec(
+            "handle_media_control_request", request_value("control", ""), state=None
+        ),
+    }
+
+    _events = {ACTION_MEDIA_CONTROL: EventSpec("_media_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize MediaController mixin."""
         super().__init__(*args, **kwargs)
@@ -41,7 +50,9 @@ class MediaController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle mediaControl request."""
         if not self._media_control_callback:
-            SinricProLogger.error(f"No media control callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No media control callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -51,7 +62,7 @@ class MediaController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in media control callback: {e}")
+            SinricProLogger.error("Error in media control callback: %s", e)
             return False, {}
 
     async def send_media_control_event(
@@ -66,18 +77,14 @@ class MediaController:
         Returns:
             True if event was sent successfully
         """
-        if not self._media_limiter.can_send_event():
-            SinricProLogger.warn("Media control event rate limited")
-            return False
-
         if not hasattr(self, "send_event"):
             SinricProLogger.error("MediaController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_MEDIA_CONTROL, value={"control": control}, cause=cause)
-
-        if success:
-            self._media_limiter.event_sent()
-
-        return success
+        return await device.send_event(
+            action=ACTION_MEDIA_CONTROL,
+            value={"control": control},
+            cause=cause,
+            limiter=self._media_limiter,
+        )
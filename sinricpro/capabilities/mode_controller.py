@@ -8,6 +8,7 @@ Supports optional instanceId for multi-instance mode control.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_MODE
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -22,6 +23,12 @@ ModeStateCallback = Callable[[str, str], Awaitable[bool]]
 class ModeController:
     """Mixin providing mode control capability."""
 
+    _actions = {
+        ACTION_SET_MODE: ActionSpec("handle_mode_request", request_value("mode", "", with_instance=True)),
+    }
+
+    _events = {ACTION_SET_MODE: EventSpec("_mode_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize ModeController mixin."""
         super().__init__(*args, **kwargs)
@@ -52,7 +59,9 @@ class ModeController:
             Tuple of (success, response_value)
         """
         if not self._mode_state_callback:
-            SinricProLogger.error(f"No mode state callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No mode state callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -62,7 +71,7 @@ class ModeController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in mode state callback: {e}")
+            SinricProLogger.error("Error in mode state callback: %s", e)
             return False, {}
 
     async def send_mode_event(
@@ -78,23 +87,15 @@ class ModeController:
         Returns:
             True if event was sent successfully
         """
-        if not self._mode_limiter.can_send_event():
-            SinricProLogger.warn("Mode event rate limited")
-            return False
-
         if not hasattr(self, "send_event"):
             SinricProLogger.error("ModeController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_MODE,
             value={"mode": mode},
             cause=cause,
-            instance_id=instance_id
+            instance_id=instance_id,
+            limiter=self._mode_limiter,
         )
-
-        if success:
-            self._mode_limiter.event_sent()
-
-        return success
@@ -6,6 +6,7 @@ Provides motion detection functionality.
 
 from typing import Any, TYPE_CHECKING
 
+from sinricpro.core.action_dispatch import EventSpec
 from sinricpro.core.event_limiter import EventLimiter
 from sinricpro.core.actions import ACTION_MOTION
 from sinricpro.core.types import EVENT_LIMIT_SENSOR_VALUE
@@ -28,6 +29,8 @@ class MotionSensor:
         >>> await sensor.send_motion_event(True)  # Motion detected
     """
 
+    _events = {ACTION_MOTION: EventSpec("_motion_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize MotionSensor mixin."""
         super().__init__(*args, **kwargs)
@@ -50,24 +53,15 @@ class MotionSensor:
             >>> await sensor.send_motion_event(False)  # No motion
             True
         """
-        # Check rate limiting
-        if not self._motion_limiter.can_send_event():
-            SinricProLogger.warn("Motion event rate limited")
-            return False
-
         # Type check - ensure self is a SinricProDevice
         if not hasattr(self, "send_event"):
             SinricProLogger.error("MotionSensor must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_MOTION,
             value={"state": "detected" if detected else "notDetected"},
             cause=cause,
-        )   
-
-        if success:
-            self._motion_limiter.event_sent()
-
-        return success
+            limiter=self._motion_limiter,
+        )
@@ -7,6 +7,7 @@ Provides mute/unmute functionality for speakers, TVs, and other audio devices.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_MUTE
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -20,6 +21,12 @@ MuteCallback = Callable[[bool], Awaitable[bool]]
 class MuteController:
     """Mixin providing mute control capability."""
 
+    _actions = {
+        ACTION_SET_MUTE: ActionSpec("handle_mute_request", request_value("mute", False)),
+    }
+
+    _events = {ACTION_SET_MUTE: EventSpec("_mute_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize MuteController mixin."""
         super().__init__(*args, **kwargs)
@@ -39,7 +46,7 @@ class MuteController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle setMute request."""
         if not self._mute_callback:
-            SinricProLogger.error(f"No mute callback registered for {device.get_device_id()}")
+            SinricProLogger.error("No mute callback registered for %s", device.get_device_id())
             return False, {}
 
         try:
@@ -49,7 +56,7 @@ class MuteController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in mute callback: {e}")
+            SinricProLogger.error("Error in mute callback: %s", e)
             return False, {}
 
     async def send_mute_event(self, mute: bool, cause: str = "PHYSICAL_INTERACTION") -> bool:
@@ -62,18 +69,14 @@ class MuteController:
         Returns:
             True if event was sent successfully
         """
-        if not self._mute_limiter.can_send_event():
-            SinricProLogger.warn("Mute event rate limited")
-            return False
-
         if not hasattr(self, "send_event"):
             SinricProLogger.error("MuteController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_SET_MUTE, value={"mute": mute}, cause=cause)
-
-        if success:
-            self._mute_limiter.event_sent()
-
-        return success
+        return await device.send_event(
+            action=ACTION_SET_MUTE,
+            value={"mute": mute},
+            cause=cause,
+            limiter=self._mute_limiter,
+        )
@@ -1,7 +1,8 @@
 """OpenCloseController Capability - Open/close control for blinds, curtains."""
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 from sinricpro.core.event_limiter import EventLimiter
-from sinricpro.core.actions import ACTION_SET_RANGE_VALUE
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
+from sinricpro.core.actions import ACTION_SET_RANGE_VALUE, ACTION_ADJUST_RANGE_VALUE
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
 
@@ -13,6 +14,18 @@ AdjustOpenCloseCallback = Callable[[int], Awaitable[bool]]  # signed delta to ap
 
 class OpenCloseController:
     """Mixin providing open/close control capability."""
+    _actions = {
+        ACTION_SET_RANGE_VALUE: ActionSpec("handle_open_close_request", request_value("rangeValue", 0)),
+        ACTION_ADJUST_RANGE_VALUE: ActionSpec(
+            "handle_adjust_open_close_request",
+            request_value("rangeValueDelta", 0),
+            state=ACTION_SET_RANGE_VALUE,
+            relative=True,
+        ),
+    }
+
+    _events = {ACTION_SET_RANGE_VALUE: EventSpec("_open_close_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._open_close_callback: OpenCloseCallback | None = None
@@ -35,40 +48,44 @@ class OpenCloseController:
     async def handle_open_close_request(self, position: int, device: "SinricProDevice") -> tuple[bool, dict[str, Any]]:
         """Handle setRangeValue request (used for open/close)."""
         if not self._open_close_callback:
-            SinricProLogger.error(f"No open/close callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No open/close callback registered for %s", device.get_device_id()
+            )
             return False, {}
         if not 0 <= position <= 100:
-            SinricProLogger.error(f"Invalid position: {position} (must be 0-100)")
+            SinricProLogger.error("Invalid position: %s (must be 0-100)", position)
             return False, {}
         try:
             success = await self._open_close_callback(position)
             return (True, {"rangeValue": position}) if success else (False, {})
         except Exception as e:
-            SinricProLogger.error(f"Error in open/close callback: {e}")
+            SinricProLogger.error("Error in open/close callback: %s", e)
             return False, {}
 
     async def handle_adjust_open_close_request(self, position_delta: int, device: "SinricProDevice") -> tuple[bool, dict[str, Any]]:
         """Handle adjustRangeValue request (used for relative open/close adjustments)."""
         if not self._adjust_open_close_callback:
-            SinricProLogger.error(f"No adjust open/close callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No adjust open/close callback registered for %s", device.get_device_id()
+            )
             return False, {}
         try:
             success = await self._adjust_open_close_callback(position_delta)
             return (True, {"rangeValue": position_delta}) if success else (False, {})
         except Exception as e:
-            SinricProLogger.error(f"Error in adjust open/close callback: {e}")
+            SinricProLogger.error("Error in adjust open/close callback: %s", e)
             return False, {}
 
     async def send_open_close_event(self, position: int, cause: str = "PHYSICAL_INTERACTION") -> bool:
         """Send open/close position event (0=closed, 100=open)."""
         if not 0 <= position <= 100:
             return False
-        if not self._open_close_limiter.can_send_event():
-            return False
         if not hasattr(self, "send_event"):
             return False
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_SET_RANGE_VALUE, value={"rangeValue": position}, cause=cause)
-        if success:
-            self._open_close_limiter.event_sent()
-        return success
+        return await device.send_event(
+            action=ACTION_SET_RANGE_VALUE,
+            value={"rangeValue": position},
+            cause=cause,
+            limiter=self._open_close_limiter,
+        )
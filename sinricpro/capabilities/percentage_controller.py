@@ -7,6 +7,7 @@ Provides percentage-based control (0-100%) for devices like blinds.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_PERCENTAGE
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -34,6 +35,12 @@ class PercentageController:
         >>> blinds.on_percentage(on_percentage)
     """
 
+    _actions = {
+        ACTION_SET_PERCENTAGE: ActionSpec("handle_percentage_request", request_value("percentage", 0)),
+    }
+
+    _events = {ACTION_SET_PERCENTAGE: EventSpec("_percentage_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize PercentageController mixin."""
         super().__init__(*args, **kwargs)
@@ -71,12 +78,14 @@ class PercentageController:
             Tuple of (success, response_value)
         """
         if not self._percentage_callback:
-            SinricProLogger.error(f"No percentage callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No percentage callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         # Validate percentage range
         if not 0 <= percentage <= 100:
-            SinricProLogger.error(f"Invalid percentage value: {percentage} (must be 0-100)")
+            SinricProLogger.error("Invalid percentage value: %s (must be 0-100)", percentage)
             return False, {}
 
         try:
@@ -86,7 +95,7 @@ class PercentageController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in percentage callback: {e}")
+            SinricProLogger.error("Error in percentage callback: %s", e)
             return False, {}
 
     async def handle_adjust_percentage_request(
@@ -103,7 +112,9 @@ class PercentageController:
             Tuple of (success, response_value)
         """
         if not self._percentage_callback:
-            SinricProLogger.error(f"No percentage callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No percentage callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -114,7 +125,7 @@ class PercentageController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in adjust percentage callback: {e}")
+            SinricProLogger.error("Error in adjust percentage callback: %s", e)
             return False, {}
 
     async def send_percentage_event(
@@ -136,12 +147,7 @@ class PercentageController:
         """
         # Validate percentage range
         if not 0 <= percentage <= 100:
-            SinricProLogger.error(f"Invalid percentage value: {percentage} (must be 0-100)")
-            return False
-
-        # Check rate limiting
-        if not self._percentage_limiter.can_send_event():
-            SinricProLogger.warn("Percentage event rate limited")
+            SinricProLogger.error("Invalid percentage value: %s (must be 0-100)", percentage)
             return False
 
         # Type check - ensure self is a SinricProDevice
@@ -150,13 +156,9 @@ class PercentageController:
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_PERCENTAGE,
             value={"percentage": percentage},
             cause=cause,
+            limiter=self._percentage_limiter,
         )
-
-        if success:
-            self._percentage_limiter.event_sent()
-
-        return success
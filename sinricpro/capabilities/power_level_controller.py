@@ -7,6 +7,7 @@ Provides power level control functionality (0-100 scale) for dimmable devices.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_POWER_LEVEL, ACTION_ADJUST_POWER_LEVEL
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -36,6 +37,18 @@ class PowerLevelController:
         >>> device.on_power_level(on_power_level)
     """
 
+    _actions = {
+        ACTION_SET_POWER_LEVEL: ActionSpec("handle_power_level_request", request_value("powerLevel", 0)),
+        ACTION_ADJUST_POWER_LEVEL: ActionSpec(
+            "handle_adjust_power_level_request",
+            request_value("powerLevelDelta", 0),
+            state=ACTION_SET_POWER_LEVEL,
+            relative=True,
+        ),
+    }
+
+    _events = {ACTION_SET_POWER_LEVEL: EventSpec("_power_level_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize PowerLevelController mixin."""
         super().__init__(*args, **kwargs)
@@ -92,12 +105,14 @@ class PowerLevelController:
             Tuple of (success, response_value)
         """
         if not self._power_level_callback:
-            SinricProLogger.error(f"No power level callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No power level callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         # Validate power level range
         if not 0 <= power_level <= 100:
-            SinricProLogger.error(f"Invalid power level: {power_level} (must be 0-100)")
+            SinricProLogger.error("Invalid power level: %s (must be 0-100)", power_level)
             return False, {}
 
         try:
@@ -107,7 +122,7 @@ class PowerLevelController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in power level callback: {e}")
+            SinricProLogger.error("Error in power level callback: %s", e)
             return False, {}
 
     async def handle_adjust_power_level_request(
@@ -124,12 +139,16 @@ class PowerLevelController:
             Tuple of (success, response_value)
         """
         if not self._adjust_power_level_callback:
-            SinricProLogger.error(f"No adjust power level callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No adjust power level callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         # Validate delta range
         if not -100 <= power_level_delta <= 100:
-            SinricProLogger.error(f"Invalid power level delta: {power_level_delta} (must be -100 to +100)")
+            SinricProLogger.error(
+                "Invalid power level delta: %s (must be -100 to +100)", power_level_delta
+            )
             return False, {}
 
         try:
@@ -141,7 +160,7 @@ class PowerLevelController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in adjust power level callback: {e}")
+            SinricProLogger.error("Error in adjust power level callback: %s", e)
             return False, {}
 
     async def send_power_level_event(
@@ -163,12 +182,7 @@ class PowerLevelController:
         """
         # Validate power level range
         if not 0 <= power_level <= 100:
-            SinricProLogger.error(f"Invalid power level: {power_level} (must be 0-100)")
-            return False
-
-        # Check rate limiting
-        if not self._power_level_limiter.can_send_event():
-            SinricProLogger.warn("Power level event rate limited")
+            SinricProLogger.error("Invalid power level: %s (must be 0-100)", power_level)
             return False
 
         # Type check - ensure self is a SinricProDevice
@@ -177,13 +191,9 @@ class PowerLevelController:
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_POWER_LEVEL,
             value={"powerLevel": power_level},
             cause=cause,
+            limiter=self._power_level_limiter,
         )
-
-        if success:
-            self._power_level_limiter.event_sent()
-
-        return success
@@ -4,9 +4,11 @@ PowerSensor Capability
 Provides power consumption monitoring functionality with energy tracking.
 """
 
-import time
 from typing import Any, TYPE_CHECKING
 
+from sinricpro.core.action_dispatch import EventSpec
+from sinricpro.core.deadband import Deadband
+from sinricpro.core.energy_meter import EnergyMeter
 from sinricpro.core.event_limiter import EventLimiter
 from sinricpro.core.actions import ACTION_POWER_USAGE
 from sinricpro.core.types import EVENT_LIMIT_SENSOR_VALUE
@@ -30,33 +32,37 @@ class PowerSensor:
         >>> await sensor.send_power_sensor_event(voltage=120.0, current=2.5, power=300.0)
     """
 
+    _events = {
+        ACTION_POWER_USAGE: EventSpec(
+            "_power_sensor_limiter", "_power_sensor_deadband", "_energy_meter"
+        ),
+    }
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize PowerSensor mixin."""
         super().__init__(*args, **kwargs)
         self._power_sensor_limiter = EventLimiter(EVENT_LIMIT_SENSOR_VALUE)
-        self._start_time: int = 0  # Timestamp when last event was sent
-        self._last_power: float = 0.0  # Last power reading in watts
+        self._energy_meter = EnergyMeter()
+        self._power_sensor_deadband: Deadband | None = None
 
-    def _get_watt_hours(self, current_timestamp: int) -> float:
+    def set_power_sensor_deadband(self, deadband: Deadband | None) -> None:
         """
-        Calculate energy consumption (wattHours) since last event.
+        Filter power readings through a deadband before the rate limiter.
+
+        The measurements of a reading (voltage, current, power, apparent and
+        reactive power, factor) are compared with the last reported reading.
+        Readings that do not differ enough are not sent (their send call
+        returns True), except for the deadband's max_silence heartbeat; the
+        energy of the skipped interval is included in the wattHours of the
+        next reported reading.
 
         Args:
-            current_timestamp: Current Unix timestamp in seconds
+            deadband: Deadband to apply, or None to send every reading
 
-        Returns:
-            Energy consumption in watt-hours (Wh)
+        Example:
+            >>> sensor.set_power_sensor_deadband(Deadband(relative=0.05, max_silence=600))
         """
-        if self._start_time == 0:
-            return 0.0
-
-        # Calculate time difference in hours
-        time_hours = (current_timestamp - self._start_time) / 3600.0
-
-        # Energy = Power × Time
-        watt_hours = self._last_power * time_hours
-
-        return watt_hours
+        self._power_sensor_deadband = deadband
 
     async def send_power_sensor_event(
         self,
@@ -89,11 +95,6 @@ class PowerSensor:
             >>> await sensor.send_power_sensor_event(120.0, 2.5, 300.0, 310.0, 50.0, 0.97)
             True
         """
-        # Check rate limiting
-        if not self._power_sensor_limiter.can_send_event():
-            SinricProLogger.warn("Power sensor event rate limited")
-            return False
-
         # Type check - ensure self is a SinricProDevice
         if not hasattr(self, "send_event"):
             SinricProLogger.error("PowerSensor must be mixed with SinricProDevice")
@@ -107,35 +108,21 @@ class PowerSensor:
         if factor is None and apparent_power is not None and apparent_power > 0:
             factor = power / apparent_power
 
-        # Get current timestamp
-        current_timestamp = int(time.time())
-
-        # Calculate wattHours
-        watt_hours = self._get_watt_hours(current_timestamp)
-
-        # Build value dict
+        # startTime and wattHours are added when the event is sent
         value: dict[str, Any] = {
-            "startTime": self._start_time,
             "voltage": voltage,
             "current": current,
             "power": power,
             "apparentPower": apparent_power if apparent_power is not None else -1,
             "reactivePower": reactive_power if reactive_power is not None else -1,
             "factor": factor if factor is not None else -1,
-            "wattHours": watt_hours,
         }
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_POWER_USAGE,
             value=value,
             cause=cause,
+            limiter=self._power_sensor_limiter,
+            deadband=self._power_sensor_deadband,
         )
-
-        if success:
-            self._power_sensor_limiter.event_sent()
-            # Update tracking variables for next calculation
-            self._start_time = current_timestamp
-            self._last_power = power
-
-        return success
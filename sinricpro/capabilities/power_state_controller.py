@@ -7,6 +7,7 @@ Provides power state control (On/Off) functionality for devices.
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_POWER_STATE
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -34,6 +35,15 @@ class PowerStateController:
         >>> device.on_power_state(on_power_state)
     """
 
+    _actions = {
+        ACTION_SET_POWER_STATE: ActionSpec(
+            "handle_power_state_request",
+            request_value("state", "Off", lambda state: state.lower() == "on"),
+        ),
+    }
+
+    _events = {ACTION_SET_POWER_STATE: EventSpec("_power_state_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize PowerStateController mixin."""
         super().__init__(*args, **kwargs)
@@ -74,7 +84,9 @@ class PowerStateController:
             Tuple of (success, response_value)
         """
         if not self._power_state_callback:
-            SinricProLogger.error(f"No power state callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No power state callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -84,7 +96,7 @@ class PowerStateController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in power state callback: {e}")
+            SinricProLogger.error("Error in power state callback: %s", e)
             return False, {}
 
     async def send_power_state_event(
@@ -104,24 +116,15 @@ class PowerStateController:
             >>> await device.send_power_state_event(True)  # Device turned on
             True
         """
-        # Check rate limiting
-        if not self._power_state_limiter.can_send_event():
-            SinricProLogger.warn("Power state event rate limited")
-            return False
-
         # Type check - ensure self is a SinricProDevice
         if not hasattr(self, "send_event"):
             SinricProLogger.error("PowerStateController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_POWER_STATE,
             value={"state": "On" if state else "Off"},
             cause=cause,
+            limiter=self._power_state_limiter,
         )
-
-        if success:
-            self._power_state_limiter.event_sent()
-
-        return success
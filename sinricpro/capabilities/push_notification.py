@@ -6,6 +6,7 @@ Provides push notification functionality.
 
 from typing import Any, TYPE_CHECKING
 
+from sinricpro.core.action_dispatch import EventSpec
 from sinricpro.core.event_limiter import EventLimiter
 from sinricpro.core.actions import ACTION_PUSH_NOTIFICATION
 from sinricpro.core.types import EVENT_LIMIT_STATE
@@ -28,6 +29,8 @@ class PushNotification:
         >>> await device.send_push_notification("Door opened!")
     """
 
+    _events = {ACTION_PUSH_NOTIFICATION: EventSpec("_push_notification_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize PushNotification mixin."""
         super().__init__(*args, **kwargs)
@@ -50,24 +53,15 @@ class PushNotification:
             >>> await device.send_push_notification("Motion detected at front door!")
             True
         """
-        # Check rate limiting
-        if not self._push_notification_limiter.can_send_event():
-            SinricProLogger.warn("Push notification event rate limited")
-            return False
-
         # Type check - ensure self is a SinricProDevice
         if not hasattr(self, "send_event"):
             SinricProLogger.error("PushNotification must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_PUSH_NOTIFICATION,
             value={"alert": notification},
             cause=cause,
+            limiter=self._push_notification_limiter,
         )
-
-        if success:
-            self._push_notification_limiter.event_sent()
-
-        return success
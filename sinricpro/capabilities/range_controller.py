@@ -1,7 +1,8 @@
 """RangeController Capability - Generic range value control."""
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 from sinricpro.core.event_limiter import EventLimiter
-from sinricpro.core.actions import ACTION_SET_RANGE_VALUE
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
+from sinricpro.core.actions import ACTION_SET_RANGE_VALUE, ACTION_ADJUST_RANGE_VALUE
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
 
@@ -16,6 +17,20 @@ AdjustRangeValueCallback = Callable[[int, str], Awaitable[bool]]
 class RangeController:
     """Mixin providing range value control capability."""
 
+    _actions = {
+        ACTION_SET_RANGE_VALUE: ActionSpec(
+            "handle_range_value_request", request_value("rangeValue", 0, with_instance=True)
+        ),
+        ACTION_ADJUST_RANGE_VALUE: ActionSpec(
+            "handle_adjust_range_value_request",
+            request_value("rangeValueDelta", 0, with_instance=True),
+            state=ACTION_SET_RANGE_VALUE,
+            relative=True,
+        ),
+    }
+
+    _events = {ACTION_SET_RANGE_VALUE: EventSpec("_range_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._range_value_callback: RangeValueCallback | None = None
@@ -50,7 +65,7 @@ class RangeController:
             success = await self._range_value_callback(range_value, instance_id)
             return (True, {"rangeValue": range_value}) if success else (False, {})
         except Exception as e:
-            SinricProLogger.error(f"Error in range value callback: {e}")
+            SinricProLogger.error("Error in range value callback: %s", e)
             return False, {}
 
     async def handle_adjust_range_value_request(
@@ -63,7 +78,7 @@ class RangeController:
             success = await self._adjust_range_value_callback(range_value_delta, instance_id)
             return (True, {"rangeValue": range_value_delta}) if success else (False, {})
         except Exception as e:
-            SinricProLogger.error(f"Error in adjust range value callback: {e}")
+            SinricProLogger.error("Error in adjust range value callback: %s", e)
             return False, {}
 
     async def send_range_value_event(
@@ -76,17 +91,13 @@ class RangeController:
             instance_id: Optional instance ID for multi-instance range control
             cause: Cause of the event
         """
-        if not self._range_limiter.can_send_event():
-            return False
         if not hasattr(self, "send_event"):
             return False
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_SET_RANGE_VALUE,
             value={"rangeValue": range_value},
             cause=cause,
-            instance_id=instance_id
+            instance_id=instance_id,
+            limiter=self._range_limiter,
         )
-        if success:
-            self._range_limiter.event_sent()
-        return success
@@ -2,6 +2,8 @@
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 from sinricpro.utils.logger import SinricProLogger
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec
+from sinricpro.core.actions import ACTION_SET_SETTING
 from sinricpro.core.types import EVENT_LIMIT_STATE, PHYSICAL_INTERACTION
 
 if TYPE_CHECKING:
@@ -11,6 +13,15 @@ SettingCallback = Callable[[str, Any], Awaitable[bool]]
 
 class SettingController:
     """Mixin providing settings management capability."""
+    _actions = {
+        ACTION_SET_SETTING: ActionSpec(
+            "handle_setting_request",
+            lambda request: (request.request_value.get("id", ""), request.request_value.get("value")),
+            state=None,  # Settings are keyed by their id, not tracked in the state shadow
+        ),
+    }
+    _events = {ACTION_SET_SETTING: EventSpec("_setting_event_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._setting_callback: SettingCallback | None = None
@@ -47,11 +58,11 @@ class SettingController:
     async def handle_setting_request(self, setting_id: str, value: Any, device: "SinricProDevice") -> tuple[bool, dict[str, Any]]:
         """Handle setSetting request."""
         if not self._setting_callback:
-            SinricProLogger.error(f"No setting callback registered for {device.get_device_id()}")
+            SinricProLogger.error("No setting callback registered for %s", device.get_device_id())
             return False, {}
         try:
             success = await self._setting_callback(setting_id, value)
             return (True, {"id": setting_id, "value": value}) if success else (False, {})
         except Exception as e:
-            SinricProLogger.error(f"Error in setting callback: {e}")
+            SinricProLogger.error("Error in setting callback: %s", e)
             return False, {}
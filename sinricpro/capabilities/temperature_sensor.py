@@ -6,6 +6,8 @@ Provides temperature and humidity sensing functionality.
 
 from typing import Any, TYPE_CHECKING
 
+from sinricpro.core.action_dispatch import EventSpec
+from sinricpro.core.deadband import Deadband
 from sinricpro.core.event_limiter import EventLimiter
 from sinricpro.core.actions import ACTION_CURRENT_TEMPERATURE
 from sinricpro.core.types import EVENT_LIMIT_SENSOR_VALUE
@@ -28,10 +30,31 @@ class TemperatureSensor:
         >>> await sensor.send_temperature_event(22.5, 65.0)  # 22.5°C, 65% humidity
     """
 
+    _events = {
+        ACTION_CURRENT_TEMPERATURE: EventSpec("_temperature_limiter", "_temperature_deadband"),
+    }
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize TemperatureSensor mixin."""
         super().__init__(*args, **kwargs)
         self._temperature_limiter = EventLimiter(EVENT_LIMIT_SENSOR_VALUE)
+        self._temperature_deadband: Deadband | None = None
+
+    def set_temperature_deadband(self, deadband: Deadband | None) -> None:
+        """
+        Filter temperature readings through a deadband before the rate limiter.
+
+        Temperature and humidity are both compared with the last reported
+        reading. Readings within the deadband are not sent (their send call
+        returns True) unless the deadband's max_silence heartbeat is due.
+
+        Args:
+            deadband: Deadband to apply, or None to send every reading
+
+        Example:
+            >>> sensor.set_temperature_deadband(Deadband(absolute=0.5, max_silence=900))
+        """
+        self._temperature_deadband = deadband
 
     async def send_temperature_event(
         self,
@@ -56,11 +79,6 @@ class TemperatureSensor:
             >>> await sensor.send_temperature_event(22.5, 65.0)  # Temperature + humidity
             True
         """
-        # Check rate limiting
-        if not self._temperature_limiter.can_send_event():
-            SinricProLogger.warn("Temperature event rate limited")
-            return False
-
         # Type check - ensure self is a SinricProDevice
         if not hasattr(self, "send_event"):
             SinricProLogger.error("TemperatureSensor must be mixed with SinricProDevice")
@@ -72,13 +90,10 @@ class TemperatureSensor:
             value["humidity"] = humidity
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(
+        return await device.send_event(
             action=ACTION_CURRENT_TEMPERATURE,
             value=value,
             cause=cause,
+            limiter=self._temperature_limiter,
+            deadband=self._temperature_deadband,
         )
-
-        if success:
-            self._temperature_limiter.event_sent()
-
-        return success
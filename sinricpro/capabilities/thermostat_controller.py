@@ -1,6 +1,7 @@
 """ThermostatController Capability - Provides thermostat control."""
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_THERMOSTAT_MODE, ACTION_TARGET_TEMPERATURE
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -13,6 +14,20 @@ TargetTemperatureCallback = Callable[[float], Awaitable[bool]]
 
 class ThermostatController:
     """Mixin providing thermostat control capability."""
+    _actions = {
+        ACTION_SET_THERMOSTAT_MODE: ActionSpec(
+            "handle_thermostat_mode_request", request_value("thermostatMode", "AUTO")
+        ),
+        ACTION_TARGET_TEMPERATURE: ActionSpec(
+            "handle_target_temperature_request", request_value("temperature", 20.0)
+        ),
+    }
+
+    _events = {
+        ACTION_SET_THERMOSTAT_MODE: EventSpec("_thermostat_limiter"),
+        ACTION_TARGET_TEMPERATURE: EventSpec("_thermostat_limiter"),
+    }
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._thermostat_mode_callback: ThermostatModeCallback | None = None
@@ -30,47 +45,47 @@ class ThermostatController:
     async def handle_thermostat_mode_request(self, mode: str, device: "SinricProDevice") -> tuple[bool, dict[str, Any]]:
         """Handle setThermostatMode request."""
         if not self._thermostat_mode_callback:
-            SinricProLogger.error(f"No thermostat mode callback for {device.get_device_id()}")
+            SinricProLogger.error("No thermostat mode callback for %s", device.get_device_id())
             return False, {}
         try:
             success = await self._thermostat_mode_callback(mode)
             return (True, {"thermostatMode": mode}) if success else (False, {})
         except Exception as e:
-            SinricProLogger.error(f"Error in thermostat mode callback: {e}")
+            SinricProLogger.error("Error in thermostat mode callback: %s", e)
             return False, {}
 
     async def handle_target_temperature_request(self, temperature: float, device: "SinricProDevice") -> tuple[bool, dict[str, Any]]:
         """Handle setTargetTemperature request."""
         if not self._target_temperature_callback:
-            SinricProLogger.error(f"No target temperature callback for {device.get_device_id()}")
+            SinricProLogger.error("No target temperature callback for %s", device.get_device_id())
             return False, {}
         try:
             success = await self._target_temperature_callback(temperature)
             return (True, {"temperature": temperature}) if success else (False, {})
         except Exception as e:
-            SinricProLogger.error(f"Error in target temperature callback: {e}")
+            SinricProLogger.error("Error in target temperature callback: %s", e)
             return False, {}
 
     async def send_thermostat_mode_event(self, mode: str, cause: str = "PHYSICAL_INTERACTION") -> bool:
         """Send thermostat mode event."""
-        if not self._thermostat_limiter.can_send_event():
-            return False
         if not hasattr(self, "send_event"):
             return False
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_SET_THERMOSTAT_MODE, value={"thermostatMode": mode}, cause=cause)
-        if success:
-            self._thermostat_limiter.event_sent()
-        return success
+        return await device.send_event(
+            action=ACTION_SET_THERMOSTAT_MODE,
+            value={"thermostatMode": mode},
+            cause=cause,
+            limiter=self._thermostat_limiter,
+        )
 
     async def send_target_temperature_event(self, temperature: float, cause: str = "PHYSICAL_INTERACTION") -> bool:
         """Send target temperature event."""
-        if not self._thermostat_limiter.can_send_event():
-            return False
         if not hasattr(self, "send_event"):
             return False
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_TARGET_TEMPERATURE, value={"temperature": temperature}, cause=cause)
-        if success:
-            self._thermostat_limiter.event_sent()
-        return success
+        return await device.send_event(
+            action=ACTION_TARGET_TEMPERATURE,
+            value={"temperature": temperature},
+            cause=cause,
+            limiter=self._thermostat_limiter,
+        )
@@ -7,6 +7,7 @@ Provides volume control functionality for speakers, TVs, and other audio devices
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.action_dispatch import ActionSpec, EventSpec, request_value
 from sinricpro.core.actions import ACTION_SET_VOLUME, ACTION_ADJUST_VOLUME
 from sinricpro.core.types import EVENT_LIMIT_STATE
 from sinricpro.utils.logger import SinricProLogger
@@ -21,6 +22,18 @@ AdjustVolumeCallback = Callable[[int], Awaitable[bool]]
 class VolumeController:
     """Mixin providing volume control capability."""
 
+    _actions = {
+        ACTION_SET_VOLUME: ActionSpec("handle_volume_request", request_value("volume", 0)),
+        ACTION_ADJUST_VOLUME: ActionSpec(
+            "handle_adjust_volume_request",
+            request_value("volumeDelta", 0),
+            state=ACTION_SET_VOLUME,
+            relative=True,
+        ),
+    }
+
+    _events = {ACTION_SET_VOLUME: EventSpec("_volume_limiter")}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize VolumeController mixin."""
         super().__init__(*args, **kwargs)
@@ -49,7 +62,7 @@ class VolumeController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle setVolume request."""
         if not self._volume_callback:
-            SinricProLogger.error(f"No volume callback registered for {device.get_device_id()}")
+            SinricProLogger.error("No volume callback registered for %s", device.get_device_id())
             return False, {}
 
         try:
@@ -59,7 +72,7 @@ class VolumeController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in volume callback: {e}")
+            SinricProLogger.error("Error in volume callback: %s", e)
             return False, {}
 
     async def handle_adjust_volume_request(
@@ -67,7 +80,9 @@ class VolumeController:
     ) -> tuple[bool, dict[str, Any]]:
         """Handle adjustVolume request."""
         if not self._adjust_volume_callback:
-            SinricProLogger.error(f"No adjust volume callback registered for {device.get_device_id()}")
+            SinricProLogger.error(
+                "No adjust volume callback registered for %s", device.get_device_id()
+            )
             return False, {}
 
         try:
@@ -77,7 +92,7 @@ class VolumeController:
             else:
                 return False, {}
         except Exception as e:
-            SinricProLogger.error(f"Error in adjust volume callback: {e}")
+            SinricProLogger.error("Error in adjust volume callback: %s", e)
             return False, {}
 
     async def send_volume_event(self, volume: int, cause: str = "PHYSICAL_INTERACTION") -> bool:
@@ -90,18 +105,14 @@ class VolumeController:
         Returns:
             True if event was sent successfully
         """
-        if not self._volume_limiter.can_send_event():
-            SinricProLogger.warn("Volume event rate limited")
-            return False
-
         if not hasattr(self, "send_event"):
             SinricProLogger.error("VolumeController must be mixed with SinricProDevice")
             return False
 
         device: SinricProDevice = self  # type: ignore
-        success = await device.send_event(action=ACTION_SET_VOLUME, value={"volume": volume}, cause=cause)
-
-        if success:
-            self._volume_limiter.event_sent()
-
-        return success
+        return await device.send_event(
+            action=ACTION_SET_VOLUME,
+            value={"volume": volume},
+            cause=cause,
+            limiter=self._volume_limiter,
+        )
@@ -1,20 +1,100 @@
 """Core SinricPro SDK components."""
 
-from sinricpro.core.exceptions import (
-    SinricProError,
-    SinricProConnectionError,
-    SinricProConfigurationError,
-    SinricProDeviceError,
-    SinricProSignatureError,
-    SinricProTimeoutError,
-)
-from sinricpro.core.sinric_pro import SinricPro, SinricProConfig
-from sinricpro.core.sinric_pro_device import SinricProDevice
+from typing import TYPE_CHECKING
+
+from sinricpro.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from sinricpro.core.codec import JsonCodec, OrjsonCodec, get_codec
+    from sinricpro.core.exceptions import (
+        SinricProError,
+        SinricProConnectionError,
+        SinricProConfigurationError,
+        SinricProDeviceError,
+        SinricProSignatureError,
+        SinricProTimeoutError,
+    )
+    from sinricpro.core.deadband import Deadband
+    from sinricpro.core.event_spool import EventSpool, FsyncPolicy
+    from sinricpro.core.message_builder import MessageBuilder
+    from sinricpro.core.message_queue import (
+        MessagePriority,
+        MessageQueue,
+        OverflowPolicy,
+        QueuedMessage,
+        SchedulingPolicy,
+    )
+    from sinricpro.core.metrics import MetricsRegistry, MetricsServer
+    from sinricpro.core.sharded_gateway import ShardedGateway
+    from sinricpro.core.sinric_pro import SinricPro, SinricProConfig
+    from sinricpro.core.sinric_pro_device import SinricProDevice
+    from sinricpro.core.state_shadow import StateShadow
+    from sinricpro.core.token_bucket import TokenBucket
+    from sinricpro.core.tracing import CallbackTracer, OpenTelemetryTracer, Span, Tracer
+    from sinricpro.core.types import BulkEvent
+
+# Public name -> defining module, imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "JsonCodec": "sinricpro.core.codec",
+    "OrjsonCodec": "sinricpro.core.codec",
+    "get_codec": "sinricpro.core.codec",
+    "SinricProError": "sinricpro.core.exceptions",
+    "SinricProConnectionError": "sinricpro.core.exceptions",
+    "SinricProConfigurationError": "sinricpro.core.exceptions",
+    "SinricProDeviceError": "sinricpro.core.exceptions",
+    "SinricProSignatureError": "sinricpro.core.exceptions",
+    "SinricProTimeoutError": "sinricpro.core.exceptions",
+    "Deadband": "sinricpro.core.deadband",
+    "EventSpool": "sinricpro.core.event_spool",
+    "FsyncPolicy": "sinricpro.core.event_spool",
+    "MessageBuilder": "sinricpro.core.message_builder",
+    "MessagePriority": "sinricpro.core.message_queue",
+    "MessageQueue": "sinricpro.core.message_queue",
+    "OverflowPolicy": "sinricpro.core.message_queue",
+    "SchedulingPolicy": "sinricpro.core.message_queue",
+    "QueuedMessage": "sinricpro.core.message_queue",
+    "MetricsRegistry": "sinricpro.core.metrics",
+    "MetricsServer": "sinricpro.core.metrics",
+    "ShardedGateway": "sinricpro.core.sharded_gateway",
+    "SinricPro": "sinricpro.core.sinric_pro",
+    "SinricProConfig": "sinricpro.core.sinric_pro",
+    "SinricProDevice": "sinricpro.core.sinric_pro_device",
+    "StateShadow": "sinricpro.core.state_shadow",
+    "TokenBucket": "sinricpro.core.token_bucket",
+    "CallbackTracer": "sinricpro.core.tracing",
+    "OpenTelemetryTracer": "sinricpro.core.tracing",
+    "Span": "sinricpro.core.tracing",
+    "Tracer": "sinricpro.core.tracing",
+    "BulkEvent": "sinricpro.core.types",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 __all__ = [
     "SinricPro",
     "SinricProConfig",
     "SinricProDevice",
+    "BulkEvent",
+    "StateShadow",
+    "TokenBucket",
+    "ShardedGateway",
+    "MessageQueue",
+    "MessageBuilder",
+    "MetricsRegistry",
+    "MetricsServer",
+    "Tracer",
+    "CallbackTracer",
+    "OpenTelemetryTracer",
+    "Span",
+    "JsonCodec",
+    "OrjsonCodec",
+    "get_codec",
+    "Deadband",
+    "EventSpool",
+    "FsyncPolicy",
+    "MessagePriority",
+    "OverflowPolicy",
+    "SchedulingPolicy",
     "SinricProError",
     "SinricProConnectionError",
     "SinricProConfigurationError",
@@ -0,0 +1,148 @@
+"""
+Action Dispatch
+
+Table-driven routing of device requests to capability handlers.
+
+Capabilities declare the actions they handle in an `_actions` class
+attribute, mapping each action to the name of its request handler and an
+argument extractor. SinricProDevice compiles the declarations of all its
+capabilities into one dict per device class when the class is created.
+
+The events a capability sends are declared the same way in an `_events`
+class attribute, naming the event limiter and deadband attributes that guard
+each event action, so events can be sent by action name (e.g. in bulk).
+"""
+
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from sinricpro.core.types import SinricProRequest
+
+# Builds the handler arguments (the device is appended) from a request
+ArgumentExtractor = Callable[[SinricProRequest], tuple[Any, ...]]
+
+# Unbound capability request handler: (self, *args, device) -> (success, response_value)
+ActionHandler = Callable[..., Awaitable[tuple[bool, dict[str, Any]]]]
+
+
+def no_arguments(request: SinricProRequest) -> tuple[Any, ...]:
+    """Argument extractor for actions whose handler only takes the device."""
+    return ()
+
+
+def request_value(
+    key: str,
+    default: Any = None,
+    convert: Callable[[Any], Any] | None = None,
+    with_instance: bool = False,
+) -> ArgumentExtractor:
+    """
+    Create an extractor passing one request value to the handler.
+
+    Args:
+        key: Key in the request value
+        default: Value used when the key is missing
+        convert: Optional conversion applied to the value
+        with_instance: Also pass the request's instance ID
+
+    Returns:
+        The argument extractor
+
+    Example:
+        >>> extract = request_value("state", "Off", lambda state: state.lower() == "on")
+        >>> extract(SinricProRequest(action="setPowerState", request_value={"state": "On"}))
+        (True,)
+    """
+
+    def extract(request: SinricProRequest) -> tuple[Any, ...]:
+        value = request.request_value.get(key, default)
+        if convert is not None:
+            value = convert(value)
+        return (value, request.instance) if with_instance else (value,)
+
+    return extract
+
+
+class ActionSpec(NamedTuple):
+    """
+    Declaration of one action a capability handles.
+
+    The state fields tell the device's state shadow what a successful
+    request changed: the response value of an absolute action (such as
+    setBrightness) becomes the shadowed state of its state action, while a
+    relative action (such as adjustBrightness, whose response may only echo
+    the delta) makes the shadow forget that state.
+    """
+
+    handler: str  # Name of the capability's request handler method
+    extract: ArgumentExtractor = no_arguments
+    state: str | None = ""  # State action the request changes ("": this action, None: no state)
+    relative: bool = False  # True if the response does not report the absolute state
+
+
+class CompiledAction(NamedTuple):
+    """An action resolved for a device class."""
+
+    handler: ActionHandler
+    extract: ArgumentExtractor
+    state: str | None = None  # State action the request changes (None: no state)
+    relative: bool = False
+
+
+def compile_actions(cls: type) -> dict[str, CompiledAction]:
+    """
+    Compile the action declarations of a class and its bases.
+
+    Declarations are merged along the method resolution order, so when two
+    capabilities declare the same action, the one listed first among the
+    class bases wins (e.g. RangeController before OpenCloseController).
+
+    Args:
+        cls: The device class
+
+    Returns:
+        Dict mapping action names to resolved handlers
+
+    Raises:
+        TypeError: If a declared handler method does not exist
+    """
+    specs: dict[str, ActionSpec] = {}
+    for klass in reversed(cls.__mro__):
+        specs.update(klass.__dict__.get("_actions", {}))
+
+    table: dict[str, CompiledAction] = {}
+    for action, spec in specs.items():
+        handler = getattr(cls, spec.handler, None)
+        if handler is None:
+            raise TypeError(
+                f"{cls.__name__} declares action {action!r} but has no method {spec.handler!r}"
+            )
+        state = action if spec.state == "" else spec.state
+        table[action] = CompiledAction(handler, spec.extract, state, spec.relative)
+    return table
+
+
+class EventSpec(NamedTuple):
+    """Declaration of one event a capability sends."""
+
+    limiter: str | None  # Name of the capability's EventLimiter attribute (None: not limited)
+    deadband: str | None = None  # Name of the capability's Deadband attribute
+    meter: str | None = None  # Name of the capability's EnergyMeter attribute
+
+
+def compile_events(cls: type) -> dict[str, EventSpec]:
+    """
+    Compile the event declarations of a class and its bases.
+
+    Declarations are merged along the method resolution order like the
+    action declarations (see compile_actions()).
+
+    Args:
+        cls: The device class
+
+    Returns:
+        Dict mapping event actions to their declarations
+    """
+    specs: dict[str, EventSpec] = {}
+    for klass in reversed(cls.__mro__):
+        specs.update(klass.__dict__.get("_events", {}))
+    return specs
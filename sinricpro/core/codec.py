@@ -0,0 +1,213 @@
+"""
+JSON Codec
+
+Pluggable JSON encoding/decoding for the message path.
+
+The stdlib codec is always available. When orjson is installed it is used
+for encoding; its output is checked for the few constructs where it differs
+from the stdlib encoder (non-ASCII text, exponent and tiny floats,
+NaN/Infinity) and re-encoded with the stdlib in that case, so signatures are
+byte-identical whichever codec is active. Incoming messages are always parsed
+by parse_message(), which locates the signed payload text with the stdlib
+scanner.
+"""
+
+import functools
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+CODEC_AUTO = "auto"
+CODEC_ORJSON = "orjson"
+CODEC_JSON = "json"
+
+
+def _matches_stdlib(data: bytes) -> bool:
+    """
+    Check whether orjson output is byte-identical to the stdlib encoder's.
+
+    orjson writes non-ASCII text and DEL unescaped, exponent floats without
+    a "+" (1e16 vs 1e+16), floats below 1e-4 in positional notation and
+    NaN/Infinity as null. Outside of strings the output only contains
+    structure, numbers and true/false/null, so any remaining "e", "n" or
+    "0.0000" there marks a number (or null) the stdlib would write differently.
+    """
+    if not data.isascii() or b"\x7f" in data or b'\\"' in data:
+        return False
+    outside = b"".join(data.split(b'"')[::2]).replace(b"true", b"").replace(b"false", b"")
+    return b"e" not in outside and b"n" not in outside and b"0.0000" not in outside
+
+
+class JsonCodec:
+    """
+    Stdlib JSON codec.
+
+    Encodes compactly (no whitespace, keys in insertion order, ASCII only),
+    which is the canonical form used for message signatures.
+
+    Example:
+        >>> codec = JsonCodec()
+        >>> codec.dumps({"a": 1, "b": [1, 2]})
+        '{"a":1,"b":[1,2]}'
+    """
+
+    name = CODEC_JSON
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Serialize an object to compact JSON.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            JSON text
+        """
+        return json.dumps(obj, separators=(",", ":"), sort_keys=False)
+
+    def dumps_many(self, objs: list[Any]) -> list[str]:
+        """
+        Serialize a batch of objects to compact JSON.
+
+        Args:
+            objs: JSON-serializable objects
+
+        Returns:
+            JSON texts, in the order of the objects
+        """
+        dumps = self.dumps
+        return [dumps(obj) for obj in objs]
+
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Deserialize JSON text.
+
+        Args:
+            data: JSON text
+
+        Returns:
+            The decoded object
+
+        Raises:
+            ValueError: If the text is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    orjson-backed codec producing the same text as JsonCodec.
+
+    Example:
+        >>> codec = OrjsonCodec()  # raises ImportError without orjson
+    """
+
+    name = CODEC_ORJSON
+
+    def __init__(self) -> None:
+        """Initialize the codec."""
+        if _orjson is None:
+            raise ImportError("orjson is not installed")
+        self._dumps = _orjson.dumps
+        self._loads = _orjson.loads
+        self._encode_error = _orjson.JSONEncodeError
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Serialize an object to compact JSON, byte-identical to JsonCodec.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            JSON text
+        """
+        try:
+            data = self._dumps(obj)
+        except self._encode_error:
+            # Unsupported types, integers beyond 64 bit: let the stdlib decide
+            return super().dumps(obj)
+        if not _matches_stdlib(data):
+            return super().dumps(obj)
+        return data.decode("ascii")
+
+    def dumps_many(self, objs: list[Any]) -> list[str]:
+        """
+        Serialize a batch of objects, byte-identical to JsonCodec.
+
+        The stdlib compatibility check runs once over the whole batch; only
+        if it fails are the objects checked (and re-encoded) one by one.
+
+        Args:
+            objs: JSON-serializable objects
+
+        Returns:
+            JSON texts, in the order of the objects
+        """
+        dumps = self._dumps
+        try:
+            datas = [dumps(obj) for obj in objs]
+        except self._encode_error:
+            return super().dumps_many(objs)
+        if not _matches_stdlib(b"".join(datas)):
+            return super().dumps_many(objs)
+        return [data.decode("ascii") for data in datas]
+
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Deserialize JSON text.
+
+        Args:
+            data: JSON text
+
+        Returns:
+            The decoded object
+
+        Raises:
+            ValueError: If the text is not valid JSON
+        """
+        return self._loads(data)
+
+
+@functools.cache
+def get_codec(name: str = CODEC_AUTO) -> JsonCodec:
+    """
+    Get a JSON codec by name.
+
+    Codecs are stateless; all clients in a process share one instance per name.
+
+    Args:
+        name: "auto" (orjson if installed, else stdlib), "orjson" or "json"
+
+    Returns:
+        The codec instance
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If "orjson" is requested but not installed
+
+    Example:
+        >>> get_codec().name
+        'orjson'
+    """
+    if name == CODEC_AUTO:
+        return OrjsonCodec() if _orjson is not None else JsonCodec()
+    if name == CODEC_ORJSON:
+        return OrjsonCodec()
+    if name == CODEC_JSON:
+        return JsonCodec()
+    raise ValueError(f"Unknown JSON codec: {name}")
+
+
+def orjson_available() -> bool:
+    """
+    Check whether orjson is installed.
+
+    Returns:
+        True if the orjson codec can be used
+    """
+    return _orjson is not None
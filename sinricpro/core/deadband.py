@@ -0,0 +1,132 @@
+"""
+Deadband
+
+Filters sensor readings that do not differ enough from the last reported
+reading, so sensors can sample often while sending only significant changes.
+
+A reading is reported when, for any of its fields, the change from the last
+reported value reaches the absolute or the relative threshold. A change that
+reverses the direction of the last reported change must also exceed the
+hysteresis, so a value oscillating around a threshold is not reported on every
+swing. A heartbeat is reported when nothing was reported for max_silence
+seconds, so the server keeps receiving periodic liveness reports.
+"""
+
+import time
+
+from sinricpro.core.exceptions import SinricProConfigurationError
+
+# Default heartbeat interval in seconds
+DEFAULT_MAX_SILENCE = 3600.0
+
+
+class Deadband:
+    """
+    Deadband and hysteresis filter for numeric sensor readings.
+
+    Readings are dicts of numeric fields (e.g. {"temperature": 21.5,
+    "humidity": 40}). Without thresholds any change is significant.
+
+    Example:
+        >>> deadband = Deadband(absolute=0.5, hysteresis=0.2, max_silence=900)
+        >>> sensor.set_temperature_deadband(deadband)
+    """
+
+    def __init__(
+        self,
+        absolute: float | None = None,
+        relative: float | None = None,
+        hysteresis: float = 0.0,
+        max_silence: float | None = DEFAULT_MAX_SILENCE,
+    ) -> None:
+        """
+        Initialize a deadband.
+
+        Args:
+            absolute: Minimum absolute change of a field (in the field's unit)
+            relative: Minimum change of a field as a fraction of the last
+                reported value (e.g. 0.05 for 5%)
+            hysteresis: Extra change required to reverse the direction of the
+                last reported change of a field
+            max_silence: Report a reading after this many seconds without a
+                report, even if it did not change (None: no heartbeat)
+
+        Raises:
+            SinricProConfigurationError: If a threshold is negative or max_silence is not positive
+        """
+        for name, threshold in (("absolute", absolute), ("relative", relative)):
+            if threshold is not None and threshold < 0:
+                raise SinricProConfigurationError(f"{name} must be non-negative or None")
+        if hysteresis < 0:
+            raise SinricProConfigurationError("hysteresis must be non-negative")
+        if max_silence is not None and max_silence <= 0:
+            raise SinricProConfigurationError("max_silence must be positive or None")
+
+        self.absolute = absolute
+        self.relative = relative
+        self.hysteresis = hysteresis
+        self.max_silence = max_silence
+        self._last: dict[str, float] | None = None
+        self._last_time = 0.0
+        self._directions: dict[str, int] = {}  # Sign of the last reported change per field
+        self.suppressed_count = 0  # Readings filtered so far (exported as a metric)
+
+    def _threshold(self, last: float) -> float:
+        """Get the change of a field that is significant (0: any change)."""
+        thresholds = []
+        if self.absolute is not None:
+            thresholds.append(self.absolute)
+        if self.relative is not None:
+            thresholds.append(self.relative * abs(last))
+        return min(thresholds) if thresholds else 0.0
+
+    def should_report(self, values: dict[str, float], now: float | None = None) -> bool:
+        """
+        Check whether a reading should be reported, counting it if not.
+
+        Args:
+            values: The reading's numeric fields
+            now: Current time.monotonic() value (default: now)
+
+        Returns:
+            True if the reading is significant or a heartbeat is due
+        """
+        now = time.monotonic() if now is None else now
+        if self._last is None or values.keys() != self._last.keys():
+            return True
+        if self.max_silence is not None and now - self._last_time >= self.max_silence:
+            return True
+
+        for field, value in values.items():
+            change = value - self._last[field]
+            if not change:
+                continue
+            threshold = self._threshold(self._last[field])
+            if change * self._directions.get(field, 0) < 0:
+                threshold += self.hysteresis
+            if abs(change) >= threshold:
+                return True
+
+        self.suppressed_count += 1
+        return False
+
+    def update(self, values: dict[str, float], now: float | None = None) -> None:
+        """
+        Record a reported reading.
+
+        Args:
+            values: The reading's numeric fields
+            now: Current time.monotonic() value (default: now)
+        """
+        if self._last is not None:
+            for field, value in values.items():
+                last = self._last.get(field, value)
+                if value != last:
+                    self._directions[field] = 1 if value > last else -1
+        self._last = dict(values)
+        self._last_time = time.monotonic() if now is None else now
+
+    def reset(self) -> None:
+        """Forget the last reported reading, so the next reading is reported."""
+        self._last = None
+        self._directions.clear()
@@ -0,0 +1,64 @@
+"""
+Energy Meter
+
+Integrates power readings over time into the energy consumption (wattHours)
+reported with each power usage event.
+
+The energy of an event is the power of the last queued reading multiplied by
+the time since that reading was queued. It is computed when the event message
+is built, so readings skipped by a deadband or superseded by event coalescing
+are accounted for in the next reading that is sent.
+"""
+
+from typing import Any
+
+
+class EnergyMeter:
+    """
+    Energy accounting of a power sensor.
+
+    Example:
+        >>> meter = EnergyMeter()
+        >>> value = meter.stamp({"voltage": 230.0, "current": 1.0, "power": 230.0}, 1700000000)
+        >>> meter.commit()  # once the event was queued
+    """
+
+    def __init__(self) -> None:
+        """Initialize an energy meter with no reading."""
+        self.start_time = 0  # Timestamp of the last queued reading (0: none yet)
+        self.last_power = 0.0  # Power of the last queued reading in watts
+        self._pending: tuple[int, float] | None = None  # (timestamp, power) of the built event
+
+    def watt_hours(self, timestamp: int) -> float:
+        """
+        Calculate the energy consumption since the last queued reading.
+
+        Args:
+            timestamp: Current Unix timestamp in seconds
+
+        Returns:
+            Energy consumption in watt-hours (Wh)
+        """
+        if self.start_time == 0:
+            return 0.0
+        return self.last_power * (timestamp - self.start_time) / 3600.0
+
+    def stamp(self, value: dict[str, Any], timestamp: int) -> dict[str, Any]:
+        """
+        Add the startTime and wattHours of a reading that is about to be sent.
+
+        Args:
+            value: The reading (must have a "power" field in watts)
+            timestamp: Creation time of the event (Unix timestamp in seconds)
+
+        Returns:
+            A copy of the value with startTime and wattHours
+        """
+        self._pending = (timestamp, value["power"])
+        return {**value, "startTime": self.start_time, "wattHours": self.watt_hours(timestamp)}
+
+    def commit(self) -> None:
+        """Start the next interval at the reading last stamped, after it was queued."""
+        if self._pending is not None:
+            self.start_time, self.last_power = self._pending
+            self._pending = None
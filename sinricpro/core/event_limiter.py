@@ -2,9 +2,16 @@
 Event Rate Limiter
 
 Prevents excessive event sending with adaptive backoff.
+
+A limiter can also hold rate-limited events instead of dropping them: the
+latest value per (action, instance ID) is kept pending and sent when the
+window reopens, so the server always ends up with the final state.
 """
 
+import asyncio
 import time
+from typing import Any, Awaitable, Callable, Hashable
+
 from sinricpro.utils.logger import SinricProLogger
 
 
@@ -26,6 +33,10 @@ class EventLimiter:
         self.next_event: int = 0
         self.extra_distance: int = 0
         self.fail_counter: int = 0
+        self.limited_count: int = 0  # Events blocked so far (never reset, exported as a metric)
+        self.coalesced_count: int = 0  # Pending events replaced by a newer value (never reset)
+        self._pending: dict[Hashable, Callable[[], Awaitable[Any]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
 
     def is_limited(self) -> bool:
         """
@@ -51,8 +62,8 @@ class EventLimiter:
                 self.extra_distance += self.minimum_distance
                 self.fail_counter = 0
                 SinricProLogger.warn(
-                    f"Event limiter: Too many events detected. "
-                    f"Adding {self.extra_distance}ms delay."
+                    "Event limiter: Too many events detected. Adding %sms delay.",
+                    self.extra_distance,
                 )
             else:
                 # Reset extra distance
@@ -63,12 +74,14 @@ class EventLimiter:
 
         # Event is blocked
         self.fail_counter += 1
+        self.limited_count += 1
 
         if self.fail_counter == fail_threshold:
             SinricProLogger.warn(
-                f"WARNING: YOUR CODE SENDS EXCESSIVE EVENTS! "
-                f"Events will be limited by an additional {self.extra_distance / 1000}s delay. "
-                f"Please check your code!"
+                "WARNING: YOUR CODE SENDS EXCESSIVE EVENTS! "
+                "Events will be limited by an additional %ss delay. "
+                "Please check your code!",
+                self.extra_distance / 1000,
             )
 
         return True
@@ -97,11 +110,78 @@ class EventLimiter:
         """
         pass
 
+    @property
+    def pending_count(self) -> int:
+        """Number of events waiting for the window to reopen."""
+        return len(self._pending)
+
+    def defer(self, key: Hashable, send: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Hold a rate-limited event until the window reopens.
+
+        Only the latest event per key is kept: a pending event with the same
+        key is replaced. Pending events are sent one per window, oldest key
+        first, each taking the window like an allowed event. Must be called
+        from a running event loop.
+
+        Args:
+            key: Identity of the state the event reports, e.g. (action, instance ID)
+            send: Coroutine function sending the event (called without the limiter)
+        """
+        if self._pending.pop(key, None) is not None:
+            self.coalesced_count += 1
+        self._pending[key] = send
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    def discard(self, key: Hashable) -> bool:
+        """
+        Drop the pending event of a key, e.g. when a newer value is sent directly.
+
+        Args:
+            key: Key passed to defer()
+
+        Returns:
+            True if an event was pending for the key
+        """
+        if self._pending.pop(key, None) is None:
+            return False
+        self.coalesced_count += 1
+        return True
+
+    def clear_pending(self) -> None:
+        """Drop all pending events and stop the flush task."""
+        self._pending.clear()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    async def _flush(self) -> None:
+        """Send the pending events as the window reopens."""
+        try:
+            while self._pending:
+                delay = self.next_event - int(time.time() * 1000)
+                if delay > 0:
+                    await asyncio.sleep(delay / 1000)
+                    continue
+                if self.is_limited():
+                    continue
+                key = next(iter(self._pending))
+                send = self._pending.pop(key)
+                try:
+                    await send()
+                except Exception as e:
+                    SinricProLogger.error("Failed to send deferred event: %s", e)
+        finally:
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+
     def reset(self) -> None:
         """
         Reset the limiter state.
 
-        Clears all counters and allows the next event immediately.
+        Clears the backoff state and allows the next event immediately
+        (limited_count keeps counting, pending events stay pending).
         """
         self.next_event = 0
         self.extra_distance = 0
@@ -0,0 +1,349 @@
+"""
+Event Spool
+
+Durable, append-only disk spool for outgoing events.
+
+Signed events are appended to segment files before they are queued for
+sending and acknowledged once written to the WebSocket. Events that were
+never acknowledged (because the SDK was stopped or the process crashed) are
+replayed in order the next time the spool is opened. Delivery is
+at-least-once: an event acknowledged shortly before a crash may be replayed.
+"""
+
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from enum import Enum
+from pathlib import Path
+
+from sinricpro.utils.logger import SinricProLogger
+
+# Record header: sequence number, payload length, CRC32 of the payload
+_RECORD_HEADER = struct.Struct("<QII")
+_CURSOR = struct.Struct("<Q")
+_SEGMENT_SUFFIX = ".seg"
+_CURSOR_FILE = "cursor"
+
+DEFAULT_SEGMENT_SIZE = 4 * 1024 * 1024  # 4 MiB
+DEFAULT_FSYNC_INTERVAL = 1000  # milliseconds
+
+
+class FsyncPolicy(str, Enum):
+    """When the spool forces appended events to stable storage."""
+
+    ALWAYS = "always"  # fsync after every append (survives power loss, slowest)
+    INTERVAL = "interval"  # fsync at most once per fsync interval
+    NEVER = "never"  # leave it to the OS (survives process crashes only)
+
+
+class EventSpool:
+    """
+    Append-only, segmented event spool.
+
+    Records are written to segment files named after their first sequence
+    number. A cursor file stores the lowest unacknowledged sequence number,
+    followed by the sequence numbers acknowledged above it (which are not
+    replayed); segments that lie entirely below the cursor are deleted on
+    compaction.
+
+    Example:
+        >>> spool = EventSpool("/var/lib/myapp/spool")
+        >>> for seq, message in spool.open():
+        ...     queue.push_sync(message, spool_seq=seq)
+        >>> seq = spool.append(message)
+        >>> spool.ack(seq)  # once the message was sent
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        fsync_policy: FsyncPolicy | str = FsyncPolicy.INTERVAL,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        fsync_interval: int = DEFAULT_FSYNC_INTERVAL,
+    ) -> None:
+        """
+        Initialize the spool (call open() before use).
+
+        Args:
+            directory: Directory holding the segment and cursor files
+            fsync_policy: When to fsync appended records
+            segment_size: Size in bytes after which a new segment is started
+            fsync_interval: Minimum time between fsyncs in milliseconds (INTERVAL policy)
+        """
+        self.directory = Path(directory)
+        self.fsync_policy = FsyncPolicy(fsync_policy)
+        self.segment_size = segment_size
+        self.fsync_interval = fsync_interval
+        self._fd: int | None = None
+        self._segment_bytes = 0
+        self._segments: list[int] = []  # first sequence number of each segment, ascending
+        self._next_seq = 0
+        self._cursor = 0
+        self._unacked: deque[int] = deque()
+        self._acked_ahead: set[int] = set()
+        self._last_fsync = 0.0
+        self._dirty = False
+
+    def _segment_path(self, first_seq: int) -> Path:
+        """Get the path of the segment starting at the given sequence number."""
+        return self.directory / f"{first_seq:020d}{_SEGMENT_SUFFIX}"
+
+    def open(self) -> list[tuple[int, str]]:
+        """
+        Open the spool and recover unacknowledged events.
+
+        Returns:
+            (sequence number, message) pairs not yet acknowledged, in append order
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        acked_ahead: set[int] = set()
+        cursor_path = self.directory / _CURSOR_FILE
+        if cursor_path.exists():
+            data = cursor_path.read_bytes()
+            if len(data) >= _CURSOR.size and len(data) % _CURSOR.size == 0:
+                self._cursor = _CURSOR.unpack_from(data)[0]
+                acked_ahead = {seq for (seq,) in _CURSOR.iter_unpack(data[_CURSOR.size :])}
+
+        self._segments = sorted(
+            int(path.name[: -len(_SEGMENT_SUFFIX)])
+            for path in self.directory.glob(f"*{_SEGMENT_SUFFIX}")
+            if path.name[: -len(_SEGMENT_SUFFIX)].isdigit()
+        )
+
+        pending: list[tuple[int, str]] = []
+        self._next_seq = self._cursor
+        for index, first_seq in enumerate(self._segments):
+            is_last = index == len(self._segments) - 1
+            for seq, message in self._read_segment(first_seq, truncate_tail=is_last):
+                self._next_seq = max(self._next_seq, seq + 1)
+                if seq >= self._cursor and seq not in acked_ahead:
+                    pending.append((seq, message))
+
+        self._unacked = deque(seq for seq, _ in pending)
+        self._acked_ahead.clear()
+        self._cursor = self._unacked[0] if self._unacked else self._next_seq
+        self.compact()
+        self._open_segment()
+
+        if pending:
+            SinricProLogger.info("Event spool: replaying %s unsent event(s)", len(pending))
+        return pending
+
+    def _read_segment(self, first_seq: int, truncate_tail: bool) -> list[tuple[int, str]]:
+        """
+        Read all valid records of a segment.
+
+        Reading stops at the first torn or corrupt record. For the last segment
+        the file is truncated there so new records are appended after valid data.
+        """
+        path = self._segment_path(first_seq)
+        records: list[tuple[int, str]] = []
+        valid_end = 0
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return records
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                offset = 0
+                while offset + _RECORD_HEADER.size <= size:
+                    seq, length, crc = _RECORD_HEADER.unpack_from(view, offset)
+                    start = offset + _RECORD_HEADER.size
+                    end = start + length
+                    if end > size:
+                        break
+                    data = view[start:end]
+                    if zlib.crc32(data) != crc:
+                        break
+                    records.append((seq, data.decode("utf-8")))
+                    offset = valid_end = end
+
+        if valid_end < size:
+            SinricProLogger.warn(
+                "Event spool: discarding %s corrupt byte(s) in %s", size - valid_end, path.name
+            )
+            if truncate_tail:
+                os.truncate(path, valid_end)
+        return records
+
+    def _open_segment(self) -> None:
+        """Open the newest segment for appending, creating one if needed."""
+        if not self._segments:
+            self._segments.append(self._next_seq)
+        path = self._segment_path(self._segments[-1])
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self._segment_bytes = os.fstat(self._fd).st_size
+
+    def _roll_segment(self) -> None:
+        """Close the current segment and start a new one at the next sequence number."""
+        self._close_segment()
+        self._segments.append(self._next_seq)
+        self._open_segment()
+        self.compact()
+
+    def _close_segment(self) -> None:
+        """Flush and close the current segment."""
+        if self._fd is not None:
+            if self.fsync_policy != FsyncPolicy.NEVER:
+                os.fsync(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+    def append(self, message: str) -> int:
+        """
+        Append a message to the spool.
+
+        Args:
+            message: Serialized, signed message
+
+        Returns:
+            Sequence number to pass to ack() once the message was sent
+        """
+        if self._fd is None:
+            raise RuntimeError("Event spool is not open")
+
+        if self._segment_bytes >= self.segment_size:
+            self._roll_segment()
+
+        data = message.encode("utf-8")
+        seq = self._next_seq
+        record = _RECORD_HEADER.pack(seq, len(data), zlib.crc32(data)) + data
+        os.write(self._fd, record)
+        self._segment_bytes += len(record)
+        self._next_seq += 1
+        self._unacked.append(seq)
+        self._dirty = True
+
+        if self.fsync_policy == FsyncPolicy.ALWAYS:
+            os.fsync(self._fd)
+            self._dirty = False
+        else:
+            self._maybe_sync()
+
+        return seq
+
+    def append_many(self, messages: list[str]) -> list[int]:
+        """
+        Append a batch of messages to the spool with a single write.
+
+        Under the ALWAYS fsync policy the batch is synced once, after all of
+        its records were written.
+
+        Args:
+            messages: Serialized, signed messages
+
+        Returns:
+            Sequence numbers of the messages, in order
+        """
+        if self._fd is None:
+            raise RuntimeError("Event spool is not open")
+        if not messages:
+            return []
+
+        if self._segment_bytes >= self.segment_size:
+            self._roll_segment()
+
+        first_seq = self._next_seq
+        records = []
+        for seq, message in enumerate(messages, first_seq):
+            data = message.encode("utf-8")
+            records.append(_RECORD_HEADER.pack(seq, len(data), zlib.crc32(data)) + data)
+        block = b"".join(records)
+        os.write(self._fd, block)
+        self._segment_bytes += len(block)
+        self._next_seq = first_seq + len(messages)
+        seqs = list(range(first_seq, self._next_seq))
+        self._unacked.extend(seqs)
+        self._dirty = True
+
+        if self.fsync_policy == FsyncPolicy.ALWAYS:
+            os.fsync(self._fd)
+            self._dirty = False
+        else:
+            self._maybe_sync()
+
+        return seqs
+
+    def ack(self, seq: int) -> None:
+        """
+        Mark a message as sent.
+
+        Args:
+            seq: Sequence number returned by append() or open()
+        """
+        if self._unacked and self._unacked[0] == seq:
+            self._unacked.popleft()
+            while self._unacked and self._unacked[0] in self._acked_ahead:
+                self._acked_ahead.discard(self._unacked.popleft())
+        elif self._unacked and seq > self._unacked[0]:
+            self._acked_ahead.add(seq)
+        self._cursor = self._unacked[0] if self._unacked else self._next_seq
+        self._maybe_sync()
+
+    def _maybe_sync(self) -> None:
+        """Persist the cursor (and fsync under the INTERVAL policy) once per interval."""
+        if (time.monotonic() - self._last_fsync) * 1000 < self.fsync_interval:
+            return
+        if self.fsync_policy == FsyncPolicy.INTERVAL and self._fd is not None and self._dirty:
+            os.fsync(self._fd)
+            self._dirty = False
+        self._write_cursor()
+        self._last_fsync = time.monotonic()
+
+    def sync(self) -> None:
+        """Force appended records and the cursor to stable storage."""
+        if self._fd is not None and self._dirty:
+            os.fsync(self._fd)
+            self._dirty = False
+        self._write_cursor()
+        self._last_fsync = time.monotonic()
+
+    def _write_cursor(self) -> None:
+        """Atomically persist the cursor and the sequence numbers acknowledged above it."""
+        path = self.directory / _CURSOR_FILE
+        tmp_path = path.with_suffix(".tmp")
+        data = b"".join(_CURSOR.pack(seq) for seq in (self._cursor, *sorted(self._acked_ahead)))
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if self.fsync_policy != FsyncPolicy.NEVER:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def compact(self) -> None:
+        """Delete segments whose records have all been acknowledged."""
+        self._write_cursor()
+        # A segment is fully acknowledged if the next segment starts at or below the cursor
+        while len(self._segments) > 1 and self._segments[1] <= self._cursor:
+            first_seq = self._segments.pop(0)
+            try:
+                self._segment_path(first_seq).unlink()
+            except FileNotFoundError:
+                pass
+
+    def pending_count(self) -> int:
+        """
+        Get the number of unacknowledged messages.
+
+        Returns:
+            Number of appended messages not yet acknowledged
+        """
+        return len(self._unacked) - len(self._acked_ahead)
+
+    def close(self) -> None:
+        """Persist the cursor, compact and close the spool."""
+        if self._fd is None:
+            return
+        self.sync()
+        self._close_segment()
+        self.compact()
+
+        # Nothing left to replay: drop the last segment as well
+        if self._cursor >= self._next_seq:
+            for first_seq in self._segments:
+                self._segment_path(first_seq).unlink(missing_ok=True)
+            self._segments.clear()
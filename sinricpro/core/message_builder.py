@@ -0,0 +1,84 @@
+"""
+Message Builder
+
+Builds signed, serialized outgoing messages.
+"""
+
+from typing import Any, Iterable
+
+from sinricpro.core.codec import JsonCodec
+from sinricpro.core.signature import Signature
+
+# Header of every message the SDK sends
+MESSAGE_HEADER: dict[str, Any] = {"payloadVersion": 2, "signatureVersion": 1}
+
+
+class MessageBuilder:
+    """
+    Serialize-once builder for outgoing messages.
+
+    The payload is serialized exactly once; the signature is computed over
+    that text and both are spliced into a pre-rendered envelope. The result
+    is byte-identical to signing the message dict and serializing it whole.
+
+    Example:
+        >>> builder = MessageBuilder(signature, codec)
+        >>> builder.build({"action": "setPowerState", "value": {"state": "On"}})
+        '{"header":{...},"payload":{...},"signature":{"HMAC":"..."}}'
+    """
+
+    def __init__(self, signature: Signature, codec: JsonCodec | None = None) -> None:
+        """
+        Initialize the builder.
+
+        Args:
+            signature: Signature handler used to sign payloads
+            codec: JSON codec (default: the signature's codec)
+        """
+        self.signature = signature
+        self.codec = codec or signature.codec
+        self._prefix = self._render_prefix(MESSAGE_HEADER)
+
+    def _render_prefix(self, header: dict[str, Any]) -> str:
+        """Render the envelope up to the payload for a header."""
+        return '{"header":' + self.codec.dumps(header) + ',"payload":'
+
+    def build(self, payload: dict[str, Any], header: dict[str, Any] | None = None) -> str:
+        """
+        Build a signed, serialized message.
+
+        Args:
+            payload: Message payload
+            header: Message header (default: MESSAGE_HEADER)
+
+        Returns:
+            The message text, ready to be queued
+        """
+        prefix = self._prefix
+        if header is not None and header != MESSAGE_HEADER:
+            prefix = self._render_prefix(header)
+
+        payload_str = self.codec.dumps(payload)
+        signature_b64 = self.signature.sign_text(payload_str)
+        return f'{prefix}{payload_str},"signature":{{"HMAC":"{signature_b64}"}}}}'
+
+    def build_many(self, payloads: Iterable[dict[str, Any]]) -> list[str]:
+        """
+        Build signed, serialized messages with the default header.
+
+        Args:
+            payloads: Message payloads
+
+        Returns:
+            The message texts, in the order of the payloads
+
+        Example:
+            >>> builder.build_many(event_payloads)
+            ['{"header":{...},"payload":{...},"signature":{"HMAC":"..."}}', ...]
+        """
+        prefix = self._prefix
+        sign_text = self.signature.sign_text
+        return [
+            f'{prefix}{payload_str},"signature":{{"HMAC":"{sign_text(payload_str)}"}}}}'
+            for payload_str in self.codec.dumps_many(list(payloads))
+        ]
@@ -1,81 +1,479 @@
 """
 Message Queue
 
-FIFO queue for message processing using asyncio.
+Message queue for message processing using asyncio, with one FIFO lane per
+message priority.
 """
 
 import asyncio
+import time
 from collections import deque
+from enum import Enum, IntEnum
+from typing import Callable, Iterable, NamedTuple
+
+from sinricpro.utils.logger import SinricProLogger
+
+
+class OverflowPolicy(str, Enum):
+    """What a bounded MessageQueue does when a push would exceed its limits."""
+
+    BLOCK = "block"  # Wait until the consumer makes room (push_sync rejects instead)
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued messages
+    DROP_NEWEST = "drop_newest"  # Reject the message being pushed
+    DROP_LOWEST_PRIORITY = "drop_lowest_priority"  # Evict the oldest lowest-priority messages
+
+
+class MessagePriority(IntEnum):
+    """
+    Priority of a queued message, which selects its lane in the queue.
+
+    Higher priorities are dequeued first (see SchedulingPolicy) and evicted
+    last by DROP_LOWEST_PRIORITY.
+    """
+
+    NOTIFICATION = 0  # Push notifications
+    TELEMETRY = 1  # Periodic sensor readings
+    STATE_EVENT = 2  # State changes and other device events
+    RESPONSE = 3  # Responses to requests
+    EVENT = 2  # Alias of STATE_EVENT
+
+
+class SchedulingPolicy(str, Enum):
+    """How a MessageQueue chooses the lane of the next dequeued message."""
+
+    STRICT = "strict"  # Always the highest-priority non-empty lane
+    WEIGHTED = "weighted"  # Non-empty lanes share the dequeues in proportion to their weights
+
+
+# Default lane weights of the WEIGHTED policy
+DEFAULT_LANE_WEIGHTS: dict[int, int] = {
+    MessagePriority.RESPONSE: 8,
+    MessagePriority.STATE_EVENT: 4,
+    MessagePriority.TELEMETRY: 2,
+    MessagePriority.NOTIFICATION: 1,
+}
+
+
+class QueuedMessage(NamedTuple):
+    """A message together with the metadata the queue keeps for it."""
+
+    message: str
+    priority: int
+    size: int
+    spool_seq: int | None = None  # Sequence number in the event spool, if spooled
+    enqueued_ns: int = 0  # time.time_ns() when the message was first pushed
+    correlation_id: str | None = None  # replyToken of the request a response answers
+
+
+def _message_size(message: str) -> int:
+    """Return the UTF-8 encoded size of a message in bytes."""
+    return len(message) if message.isascii() else len(message.encode("utf-8"))
 
 
 class MessageQueue:
     """
-    Thread-safe FIFO message queue.
+    Awaitable message queue with priority lanes.
+
+    Each MessagePriority has its own FIFO lane (a deque). With the STRICT
+    scheduling policy messages are dequeued from the highest-priority
+    non-empty lane, so a response never waits behind queued events; with
+    WEIGHTED the non-empty lanes take turns in proportion to their weights,
+    so lower lanes keep moving under sustained high-priority traffic.
+    Messages of one priority stay in FIFO order either way. An asyncio.Event
+    wakes consumers blocked in get() as soon as a message is pushed, so idle
+    consumers do not have to poll.
 
-    Uses a deque for efficient push/pop operations.
+    The queue is unbounded by default. When max_messages and/or max_bytes are
+    set, pushes that would exceed a limit are resolved by the overflow policy
+    and counted in get_stats(). Dropped entries are passed to the optional
+    on_drop callback.
+
+    Example:
+        >>> queue = MessageQueue(max_messages=100, overflow_policy=OverflowPolicy.DROP_OLDEST)
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty message queue."""
-        self._queue: deque[str] = deque()
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        max_messages: int | None = None,
+        max_bytes: int | None = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        scheduling: SchedulingPolicy = SchedulingPolicy.STRICT,
+        lane_weights: dict[int, int] | None = None,
+    ) -> None:
+        """
+        Initialize an empty message queue.
 
-    async def push(self, message: str) -> None:
+        Args:
+            max_messages: Maximum number of queued messages (None for unbounded)
+            max_bytes: Maximum total size of queued messages in bytes (None for unbounded)
+            overflow_policy: How to handle pushes that would exceed a limit
+            scheduling: How to choose the lane of the next dequeued message
+            lane_weights: Weight of each priority for WEIGHTED scheduling
+                (default: DEFAULT_LANE_WEIGHTS)
+        """
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.scheduling = SchedulingPolicy(scheduling)
+        self._weights = {**DEFAULT_LANE_WEIGHTS, **(lane_weights or {})}
+        # Lanes from the highest priority down
+        self._lanes: dict[int, deque[QueuedMessage]] = {
+            priority: deque() for priority in sorted(MessagePriority, reverse=True)
+        }
+        self._credits = dict.fromkeys(self._lanes, 0)
+        self._count = 0
+        self._bytes = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self.on_drop: Callable[[QueuedMessage], None] | None = None
+        self._stats: dict[str, int] = {
+            "pushed": 0,
+            "dropped_oldest": 0,
+            "dropped_newest": 0,
+            "dropped_lowest_priority": 0,
+            "blocked": 0,
+        }
+
+    def _fits(self, size: int, count: int | None = None, total: int | None = None) -> bool:
+        """Check whether a message of the given size fits without evicting anything."""
+        count = self._count if count is None else count
+        total = self._bytes if total is None else total
+        if self.max_messages is not None and count >= self.max_messages:
+            return False
+        if self.max_bytes is not None and total + size > self.max_bytes:
+            return False
+        return True
+
+    def _can_ever_fit(self, size: int) -> bool:
+        """Check whether a message of the given size fits into an empty queue."""
+        if self.max_messages is not None and self.max_messages <= 0:
+            return False
+        return self.max_bytes is None or size <= self.max_bytes
+
+    def _append(self, entry: QueuedMessage) -> None:
+        """Append an entry to its lane and wake up waiting consumers."""
+        self._lanes[entry.priority].append(entry)
+        self._count += 1
+        self._bytes += entry.size
+        self._stats["pushed"] += 1
+        self._not_empty.set()
+
+    def _drop(self, entry: QueuedMessage, counter: str) -> None:
+        """Count a dropped entry and notify the on_drop callback."""
+        self._stats[counter] += 1
+        if self.on_drop:
+            self.on_drop(entry)
+
+    def _evict_first(self, lane: deque[QueuedMessage], counter: str) -> None:
+        """Evict the oldest entry of a lane."""
+        entry = lane.popleft()
+        self._count -= 1
+        self._bytes -= entry.size
+        self._drop(entry, counter)
+
+    def _evict_oldest(self) -> None:
+        """Evict the oldest entry of all lanes."""
+        lane = min(
+            (lane for lane in self._lanes.values() if lane), key=lambda lane: lane[0].enqueued_ns
+        )
+        self._evict_first(lane, "dropped_oldest")
+
+    def _evict_lowest_priority(self, priority: int, size: int) -> bool:
+        """
+        Make room by evicting the oldest entries of the lowest priorities.
+
+        Only entries with a priority not above the new message are considered;
+        nothing is evicted unless enough room can be made.
+
+        Returns:
+            True if the message now fits, False if queued entries outrank it
+        """
+        count = self._count
+        total = self._bytes
+        victims: list[tuple[deque[QueuedMessage], int]] = []
+        for lane_priority in sorted(self._lanes):
+            if lane_priority > priority or self._fits(size, count, total):
+                break
+            lane = self._lanes[lane_priority]
+            evicted = 0
+            for entry in lane:
+                if self._fits(size, count, total):
+                    break
+                evicted += 1
+                count -= 1
+                total -= entry.size
+            victims.append((lane, evicted))
+
+        if not self._fits(size, count, total):
+            return False
+
+        for lane, evicted in victims:
+            for _ in range(evicted):
+                self._evict_first(lane, "dropped_lowest_priority")
+        return True
+
+    def _push_with_overflow(self, entry: QueuedMessage) -> bool:
+        """Push applying a dropping overflow policy; BLOCK rejects like DROP_NEWEST."""
+        size = entry.size
+        if self._fits(size):
+            self._append(entry)
+            return True
+
+        policy = self.overflow_policy
+        if self._can_ever_fit(size):
+            if policy == OverflowPolicy.DROP_OLDEST:
+                while not self._fits(size):
+                    self._evict_oldest()
+                self._append(entry)
+                return True
+
+            if policy == OverflowPolicy.DROP_LOWEST_PRIORITY:
+                if self._evict_lowest_priority(entry.priority, size):
+                    self._append(entry)
+                    return True
+                # Everything queued outranks the new message
+                SinricProLogger.debug("Message queue full, dropped lowest priority message")
+                self._drop(entry, "dropped_lowest_priority")
+                return False
+
+        SinricProLogger.debug("Message queue full, dropped newest message")
+        self._drop(entry, "dropped_newest")
+        return False
+
+    async def push(
+        self,
+        message: str,
+        priority: int = MessagePriority.EVENT,
+        spool_seq: int | None = None,
+        correlation_id: str | None = None,
+    ) -> bool:
         """
         Add a message to the queue.
 
+        With the BLOCK overflow policy this waits until the consumer has made
+        enough room for the message.
+
         Args:
             message: The message string to add
+            priority: Message priority (selects the lane)
+            spool_seq: Event spool sequence number, if the message was spooled
+            correlation_id: Request correlation ID (for tracing)
+
+        Returns:
+            True if the message was queued, False if it was dropped
 
         Example:
             >>> queue = MessageQueue()
             >>> await queue.push('{"type": "request"}')
+            True
+        """
+        entry = QueuedMessage(
+            message, priority, _message_size(message), spool_seq, time.time_ns(), correlation_id
+        )
+        if self.overflow_policy == OverflowPolicy.BLOCK:
+            await self._wait_for_room(entry.size)
+        return self._push_with_overflow(entry)
+
+    async def push_many(self, messages: Iterable[tuple[str, int, int | None]]) -> list[bool]:
+        """
+        Add a batch of messages to the queue.
+
+        Equivalent to pushing the messages one by one, but the batch shares
+        one enqueue timestamp and only waits (with the BLOCK overflow policy)
+        when a message does not fit.
+
+        Args:
+            messages: (message, priority, spool sequence number or None) tuples
+
+        Returns:
+            Per message, True if it was queued, False if it was dropped
+
+        Example:
+            >>> await queue.push_many([(event, MessagePriority.STATE_EVENT, None)])
+            [True]
         """
-        async with self._lock:
-            self._queue.append(message)
+        enqueued_ns = time.time_ns()
+        entries = [
+            QueuedMessage(message, priority, _message_size(message), spool_seq, enqueued_ns)
+            for message, priority, spool_seq in messages
+        ]
+        if self.max_messages is None and self.max_bytes is None:
+            # Unbounded: nothing can overflow, append the batch lane by lane
+            lanes = self._lanes
+            for entry in entries:
+                lanes[entry.priority].append(entry)
+            self._count += len(entries)
+            self._bytes += sum(entry.size for entry in entries)
+            self._stats["pushed"] += len(entries)
+            if entries:
+                self._not_empty.set()
+            return [True] * len(entries)
 
-    def push_sync(self, message: str) -> None:
+        block = self.overflow_policy == OverflowPolicy.BLOCK
+        results: list[bool] = []
+        for entry in entries:
+            if block:
+                await self._wait_for_room(entry.size)
+            results.append(self._push_with_overflow(entry))
+        return results
+
+    async def _wait_for_room(self, size: int) -> None:
+        """Wait until a message of the given size fits (unless it never can)."""
+        if not self._fits(size) and self._can_ever_fit(size):
+            self._stats["blocked"] += 1
+            while not self._fits(size):
+                self._not_full.clear()
+                await self._not_full.wait()
+
+    def push_sync(
+        self,
+        message: str,
+        priority: int = MessagePriority.EVENT,
+        spool_seq: int | None = None,
+        correlation_id: str | None = None,
+    ) -> bool:
         """
         Add a message to the queue synchronously.
 
         Args:
             message: The message string to add
+            priority: Message priority (selects the lane)
+            spool_seq: Event spool sequence number, if the message was spooled
+            correlation_id: Request correlation ID (for tracing)
+
+        Returns:
+            True if the message was queued, False if it was dropped
 
         Note:
-            This is a synchronous version for use in callbacks.
+            This is a synchronous version for use in callbacks. It must be
+            called from the event loop thread that owns the queue. It cannot
+            wait, so with the BLOCK policy a full queue rejects the message.
         """
-        self._queue.append(message)
+        return self._push_with_overflow(
+            QueuedMessage(
+                message, priority, _message_size(message), spool_seq, time.time_ns(), correlation_id
+            )
+        )
+
+    def _next_lane(self) -> deque[QueuedMessage]:
+        """Choose the lane of the next dequeued message (the queue must not be empty)."""
+        if self.scheduling == SchedulingPolicy.STRICT:
+            return next(lane for lane in self._lanes.values() if lane)
+
+        # Smooth weighted round-robin over the non-empty lanes
+        chosen = -1
+        total = 0
+        for priority, lane in self._lanes.items():
+            if not lane:
+                self._credits[priority] = 0
+                continue
+            weight = self._weights[priority]
+            self._credits[priority] += weight
+            total += weight
+            if chosen < 0 or self._credits[priority] > self._credits[chosen]:
+                chosen = priority
+        self._credits[chosen] -= total
+        return self._lanes[chosen]
+
+    def _popleft(self) -> QueuedMessage:
+        """Remove the next entry and wake up blocked producers."""
+        entry = self._next_lane().popleft()
+        self._count -= 1
+        self._bytes -= entry.size
+        self._not_full.set()
+        return entry
+
+    async def get(self) -> str:
+        """
+        Remove and return the next message, waiting until one is available.
+
+        Returns:
+            The next message in the queue
+
+        Example:
+            >>> queue = MessageQueue()
+            >>> queue.push_sync("message1")
+            True
+            >>> await queue.get()
+            'message1'
+        """
+        return (await self.get_entry()).message
+
+    async def get_entry(self) -> QueuedMessage:
+        """
+        Remove and return the next entry, waiting until one is available.
+
+        Unlike get(), the returned entry keeps the message metadata so it can
+        be handed back with requeue_sync() if delivery fails.
+
+        Returns:
+            The next queued entry
+        """
+        while not self._count:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._popleft()
+
+    def restore_sync(self, message: str, priority: int, spool_seq: int | None = None) -> None:
+        """
+        Append a persisted message, e.g. an event replayed from the spool.
+
+        The message was admitted before a restart, so limits are not applied
+        and it is never rejected; until the queue drains below its limits, new
+        pushes are handled by the overflow policy (which may evict it).
+
+        Args:
+            message: The message string to add
+            priority: Message priority (selects the lane)
+            spool_seq: Event spool sequence number
+        """
+        self._append(
+            QueuedMessage(message, priority, _message_size(message), spool_seq, time.time_ns())
+        )
+
+    def requeue_sync(self, entry: QueuedMessage) -> None:
+        """
+        Put a previously removed entry back at the front of its lane.
+
+        The entry was already admitted once, so limits are not re-applied and
+        the original order is preserved for the retry.
+
+        Args:
+            entry: Entry returned by get_entry()
+        """
+        self._lanes[entry.priority].appendleft(entry)
+        self._count += 1
+        self._bytes += entry.size
+        self._not_empty.set()
 
     async def pop(self) -> str | None:
         """
-        Remove and return the first message from the queue.
+        Remove and return the next message from the queue without waiting.
 
         Returns:
-            The first message in the queue, or None if empty
+            The next message in the queue, or None if empty
 
         Example:
             >>> queue = MessageQueue()
             >>> await queue.push("message1")
+            True
             >>> await queue.pop()
             'message1'
         """
-        async with self._lock:
-            if self._queue:
-                return self._queue.popleft()
-            return None
+        return self.pop_sync()
 
     def pop_sync(self) -> str | None:
         """
-        Remove and return the first message from the queue synchronously.
+        Remove and return the next message from the queue synchronously.
 
         Returns:
-            The first message in the queue, or None if empty
+            The next message in the queue, or None if empty
 
         Note:
             This is a synchronous version for use in non-async contexts.
         """
-        if self._queue:
-            return self._queue.popleft()
+        if self._count:
+            return self._popleft().message
         return None
 
     def is_empty(self) -> bool:
@@ -85,11 +483,46 @@ class MessageQueue:
         Returns:
             True if queue is empty, False otherwise
         """
-        return len(self._queue) == 0
+        return self._count == 0
 
     def clear(self) -> None:
         """Clear all messages from the queue."""
-        self._queue.clear()
+        for lane in self._lanes.values():
+            lane.clear()
+        self._count = 0
+        self._bytes = 0
+        self._not_full.set()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get queue depth and overflow counters.
+
+        Returns:
+            Dict with current depth ("messages", "bytes"), total "pushed" count,
+            per-policy drop counters and the number of "blocked" producers
+
+        Example:
+            >>> sinric_pro.send_queue.get_stats()["dropped_oldest"]
+            0
+        """
+        return {"messages": self._count, "bytes": self._bytes, **self._stats}
+
+    def get_lane_depths(self) -> dict[str, int]:
+        """
+        Get the number of queued messages per lane.
+
+        Returns:
+            Dict mapping lane names ("response", "state_event", "telemetry",
+            "notification") to their depth
+
+        Example:
+            >>> sinric_pro.send_queue.get_lane_depths()["response"]
+            0
+        """
+        return {
+            MessagePriority(priority).name.lower(): len(lane)
+            for priority, lane in self._lanes.items()
+        }
 
     def __len__(self) -> int:
         """
@@ -98,4 +531,4 @@ class MessageQueue:
         Returns:
             Number of messages in the queue
         """
-        return len(self._queue)
+        return self._count
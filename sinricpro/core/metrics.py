@@ -0,0 +1,413 @@
+"""
+Metrics
+
+Lightweight metrics registry with Prometheus text-format export.
+
+Counters and histograms are updated on the hot paths only when metrics are
+enabled (SinricPro keeps no registry otherwise). Values that already exist
+elsewhere, such as queue depths and reconnect counters, are read by
+collectors when the metrics are rendered, so they cost nothing in between.
+"""
+
+import asyncio
+import math
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, NamedTuple
+
+from sinricpro.utils.logger import SinricProLogger
+
+# Request handler and pong latency buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = tuple[str, ...]
+
+
+class MetricFamily(NamedTuple):
+    """A metric with all of its samples, as rendered in one exposition block."""
+
+    name: str
+    type: str  # "counter", "gauge" or "histogram"
+    help: str
+    samples: list[tuple[str, dict[str, str], float]]  # (sample name, labels, value)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """Base class of metrics with a fixed set of label names."""
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        """
+        Initialize the metric.
+
+        Args:
+            name: Metric name
+            help: Help text
+            labelnames: Names of the labels, in the order values are passed
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def _labels(self, values: LabelValues) -> dict[str, str]:
+        """Map label values to their names."""
+        return dict(zip(self.labelnames, values))
+
+    def collect(self) -> MetricFamily:
+        """Get the current samples."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing counter.
+
+    Example:
+        >>> requests = registry.counter("requests_total", "Requests", ["action"])
+        >>> requests.inc("setPowerState")
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        """Initialize the counter (see _Metric)."""
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            *labelvalues: Label values in the order of labelnames
+            amount: Amount to add
+        """
+        self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def get(self, *labelvalues: str) -> float:
+        """Get the current value for the given label values."""
+        return self._values.get(labelvalues, 0.0)
+
+    def collect(self) -> MetricFamily:
+        """Get the current samples."""
+        samples = [
+            (self.name, self._labels(values), value) for values, value in self._values.items()
+        ]
+        return MetricFamily(self.name, self.type, self.help, samples)
+
+
+class Gauge(Counter):
+    """
+    Value that can go up and down.
+
+    Example:
+        >>> depth = registry.gauge("queue_depth", "Queued messages")
+        >>> depth.set(3)
+    """
+
+    type = "gauge"
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        """
+        Set the gauge.
+
+        Args:
+            value: New value
+            *labelvalues: Label values in the order of labelnames
+        """
+        self._values[labelvalues] = value
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values in cumulative buckets.
+
+    Example:
+        >>> latency = registry.histogram("latency_seconds", "Latency", ["action"])
+        >>> latency.observe(0.004, "setPowerState")
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name
+            help: Help text
+            labelnames: Names of the labels, in the order values are passed
+            buckets: Upper bounds of the buckets, ascending ("+Inf" is implied)
+        """
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (last is +Inf)..., sum]
+        self._values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value
+            *labelvalues: Label values in the order of labelnames
+        """
+        counts = self._values.get(labelvalues)
+        if counts is None:
+            counts = self._values[labelvalues] = [0.0] * (len(self.buckets) + 2)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def collect(self) -> MetricFamily:
+        """Get the current samples."""
+        samples = []
+        bounds = [*(_format_value(bound) for bound in self.buckets), "+Inf"]
+        for values, counts in self._values.items():
+            labels = self._labels(values)
+            cumulative = 0.0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", {**labels, "le": bound}, cumulative))
+            samples.append((f"{self.name}_sum", labels, counts[-1]))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return MetricFamily(self.name, self.type, self.help, samples)
+
+
+# Produces metric families when the metrics are rendered
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class MetricsRegistry:
+    """
+    Registry of metrics and collectors.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> events = registry.counter("sinricpro_events_total", "Events", ["action"])
+        >>> events.inc("setPowerState")
+        >>> print(registry.render())
+        # HELP sinricpro_events_total Events
+        # TYPE sinricpro_events_total counter
+        sinricpro_events_total{action="setPowerState"} 1
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Collector] = []
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        """Create and register a counter."""
+        metric = Counter(name, help, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        metric = Gauge(name, help, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Collector) -> None:
+        """
+        Register a collector called every time the metrics are rendered.
+
+        Args:
+            collector: Function returning metric families
+        """
+        self._collectors.append(collector)
+
+    def collect(self) -> list[MetricFamily]:
+        """
+        Get all metric families.
+
+        Returns:
+            Families of the registered metrics followed by those of the collectors
+        """
+        families = [metric.collect() for metric in self._metrics]
+        for collector in self._collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                SinricProLogger.error("Error in metrics collector: %s", e)
+        return families
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text
+        """
+        lines = []
+        for family in self.collect():
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for name, labels, value in family.samples:
+                if labels:
+                    label_str = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                    name = f"{name}{{{label_str}}}"
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    Minimal HTTP server exposing a registry at /metrics.
+
+    Built on asyncio streams, so it needs no extra dependency and runs on the
+    SDK's event loop.
+
+    Example:
+        >>> server = MetricsServer(registry, port=9464)
+        >>> await server.start()  # curl http://127.0.0.1:9464/metrics
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464
+    ) -> None:
+        """
+        Initialize the server (call start() to listen).
+
+        Args:
+            registry: Registry to expose
+            host: Interface to listen on
+            port: Port to listen on (0: pick a free port)
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: asyncio.base_events.Server | None = None
+
+    async def start(self) -> None:
+        """Start listening; self.port holds the actual port afterwards."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        SinricProLogger.info("Serving metrics on http://%s:%s/metrics", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one HTTP request."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=10)
+            # Skip the request headers
+            while (await asyncio.wait_for(reader.readline(), timeout=10)).strip():
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?", 1)[0] if len(parts) >= 2 else ""
+            if parts[:1] == ["GET"] and path in ("/metrics", "/"):
+                status, content_type = "200 OK", CONTENT_TYPE
+                body = self.registry.render().encode("utf-8")
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b"Not Found\n"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+                + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class SinricProMetrics:
+    """
+    Metrics updated by a SinricPro client on its hot paths.
+
+    Request and event metrics are labelled by device and action; with large
+    fleets this yields one series per device and action.
+    """
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """
+        Create the metrics in a registry.
+
+        Args:
+            registry: Registry to create the metrics in
+        """
+        self.registry = registry
+        self.messages_received = registry.counter(
+            "sinricpro_messages_received_total", "Messages received from the server"
+        )
+        self.invalid_signatures = registry.counter(
+            "sinricpro_invalid_signatures_total", "Received messages with an invalid signature"
+        )
+        self.requests = registry.counter(
+            "sinricpro_requests_total",
+            "Requests handled, by result (success or failure)",
+            ["device", "action", "result"],
+        )
+        self.request_duration = registry.histogram(
+            "sinricpro_request_duration_seconds",
+            "Time spent handling requests, including device callbacks",
+            ["device", "action"],
+        )
+        self.events = registry.counter(
+            "sinricpro_events_total",
+            "Events sent, by result (queued or dropped by the send queue)",
+            ["device", "action", "result"],
+        )
+        self.event_budget_wait = registry.histogram(
+            "sinricpro_event_budget_wait_seconds",
+            "Time events waited for the connection-wide event budget (event_rate_limit)",
+        )
+        self.pong_latency = registry.histogram(
+            "sinricpro_pong_latency_seconds", "WebSocket ping/pong round-trip time"
+        )
+
+    def request_handled(self, device_id: str, action: str, success: bool, seconds: float) -> None:
+        """Record a handled request."""
+        self.requests.inc(device_id, action, "success" if success else "failure")
+        self.request_duration.observe(seconds, device_id, action)
+
+    def event_sent(self, payload: dict[str, Any], queued: bool) -> None:
+        """Record an event passed to the send queue."""
+        self.events.inc(
+            str(payload.get("deviceId", "")),
+            str(payload.get("action", "")),
+            "queued" if queued else "dropped",
+        )
@@ -0,0 +1,93 @@
+"""
+Request Dispatcher
+
+Runs incoming requests concurrently across devices while preserving the
+arrival order of requests for the same device.
+"""
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable
+
+from sinricpro.utils.logger import SinricProLogger
+
+# A queued unit of work, e.g. handling one request and sending its response
+RequestJob = Callable[[], Awaitable[None]]
+
+
+class RequestDispatcher:
+    """
+    Concurrent request dispatcher with per-key ordering.
+
+    Jobs submitted under the same key (a device ID) run strictly one after
+    another in submission order. Jobs under different keys run concurrently,
+    with at most max_workers jobs running at the same time.
+
+    Example:
+        >>> dispatcher = RequestDispatcher(max_workers=8)
+        >>> dispatcher.submit(device_id, lambda: handle(message))
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_workers: Maximum number of jobs running concurrently
+        """
+        self.max_workers = max_workers
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._pending: dict[str, deque[RequestJob]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def submit(self, key: str, job: RequestJob) -> None:
+        """
+        Schedule a job.
+
+        Args:
+            key: Ordering key; jobs with the same key never overlap
+            job: Zero-argument coroutine function to run
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            # A worker is already draining this key, it will pick the job up in order
+            pending.append(job)
+            return
+
+        self._pending[key] = deque([job])
+        task = asyncio.create_task(self._drain(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self, key: str) -> None:
+        """Run all jobs queued for a key, one at a time."""
+        pending = self._pending[key]
+        try:
+            while pending:
+                job = pending.popleft()
+                async with self._semaphore:
+                    try:
+                        await job()
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        SinricProLogger.error("Error handling request for %s: %s", key, e)
+        finally:
+            if self._pending.get(key) is pending:
+                del self._pending[key]
+
+    def pending_count(self) -> int:
+        """
+        Get the number of jobs waiting to run (excluding running jobs).
+
+        Returns:
+            Number of queued jobs across all keys
+        """
+        return sum(len(pending) for pending in self._pending.values())
+
+    def cancel(self) -> None:
+        """Cancel all running and queued jobs."""
+        for task in list(self._tasks):
+            task.cancel()
+        self._tasks.clear()
+        self._pending.clear()
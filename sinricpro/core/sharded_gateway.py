@@ -0,0 +1,467 @@
+"""
+Sharded Gateway
+
+Supervisor that serves a large device fleet from several worker processes.
+
+Each worker process runs its own SinricPro client (WebSocket connection,
+receive loop and event loop) for one shard of the device list, so a single
+host can use all of its cores. The supervisor restarts crashed workers with
+exponential backoff and aggregates the status reports they send.
+
+Every worker talks to the supervisor over its own pipe (status reports up,
+the stop request down), so a killed worker cannot leave shared locks behind,
+and workers exit on their own when the supervisor dies (with the default
+"spawn" start method; forked workers inherit the supervisor's pipe ends).
+"""
+
+import asyncio
+import dataclasses
+import multiprocessing
+import os
+import random
+import time
+import zlib
+from contextlib import suppress
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+from sinricpro.core.exceptions import SinricProConfigurationError
+from sinricpro.core.sinric_pro import SinricPro
+from sinricpro.core.sinric_pro_device import SinricProDevice
+from sinricpro.core.types import SinricProConfig
+from sinricpro.utils.logger import SinricProLogger
+
+# Creates the fully configured device (callbacks registered) for a device ID.
+# Called inside the worker process, so it must be a picklable module-level function.
+DeviceFactory = Callable[[str], SinricProDevice]
+
+DEFAULT_STATUS_INTERVAL = 5.0  # seconds between worker status reports
+DEFAULT_RESTART_DELAY_MIN = 1.0  # seconds
+DEFAULT_RESTART_DELAY_MAX = 60.0  # seconds
+DEFAULT_STOP_TIMEOUT = 10.0  # seconds a worker gets to shut down before it is terminated
+
+_STOP = "stop"  # Sent by the supervisor to stop a worker
+
+_SUPERVISOR_POLL_INTERVAL = 0.5  # seconds
+
+
+def shard_for(device_id: str, shards: int) -> int:
+    """
+    Get the shard a device belongs to.
+
+    The assignment only depends on the device ID and the number of shards,
+    so a device stays on the same shard across restarts.
+
+    Args:
+        device_id: Device ID
+        shards: Number of shards
+
+    Returns:
+        Shard index in range(shards)
+
+    Example:
+        >>> shard_for("5dc1564130e5xxxxxxxxxxxx", 4)
+        1
+    """
+    return zlib.crc32(device_id.encode("utf-8")) % shards
+
+
+def partition_devices(device_ids: list[str], shards: int) -> list[list[str]]:
+    """
+    Partition device IDs into shards.
+
+    Args:
+        device_ids: Device IDs (duplicates are ignored)
+        shards: Number of shards
+
+    Returns:
+        One list of device IDs per shard, in input order
+    """
+    partitions: list[list[str]] = [[] for _ in range(shards)]
+    for device_id in dict.fromkeys(device_ids):
+        partitions[shard_for(device_id, shards)].append(device_id)
+    return partitions
+
+
+def _worker_main(
+    shard: int,
+    device_ids: list[str],
+    device_factory: DeviceFactory,
+    config: SinricProConfig,
+    conn: Connection,
+    status_interval: float,
+) -> None:
+    """Entry point of a worker process."""
+    try:
+        asyncio.run(
+            _run_worker(
+                shard, device_ids, device_factory, config, conn, status_interval
+            )
+        )
+    except KeyboardInterrupt:
+        # Ctrl+C reaches the whole process group; the supervisor handles shutdown
+        pass
+    finally:
+        conn.close()
+
+
+async def _run_worker(
+    shard: int,
+    device_ids: list[str],
+    device_factory: DeviceFactory,
+    config: SinricProConfig,
+    conn: Connection,
+    status_interval: float,
+) -> None:
+    """Serve one shard until the supervisor asks it to stop (or goes away)."""
+    client = SinricPro()
+    for device_id in device_ids:
+        client.add(device_factory(device_id))
+
+    loop = asyncio.get_running_loop()
+    try:
+        await client.begin(config)
+        while True:
+            conn.send(_worker_status(shard, client))
+            # Wait for the stop request in a thread so the event loop keeps running;
+            # poll() also returns when the supervisor's end of the pipe was closed
+            if await loop.run_in_executor(None, conn.poll, status_interval):
+                break
+    finally:
+        await client.stop()
+        with suppress(OSError):
+            conn.send(_worker_status(shard, client))
+
+
+def _worker_status(shard: int, client: SinricPro) -> dict[str, Any]:
+    """Build the status report a worker sends to the supervisor."""
+    return {
+        "shard": shard,
+        "pid": os.getpid(),
+        "time": time.time(),
+        "devices": len(client.devices),
+        "connected": client.is_connected(),
+        "send_queue": client.send_queue.get_stats(),
+        "reconnects": client.websocket.get_reconnect_stats() if client.websocket else {},
+        "metrics_port": client._metrics_server.port if client._metrics_server else None,
+    }
+
+
+class _Worker:
+    """Supervisor-side state of one shard."""
+
+    def __init__(self, shard: int, device_ids: list[str]) -> None:
+        """Initialize the state of a shard that has not been started yet."""
+        self.shard = shard
+        self.device_ids = device_ids
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self.conn: Connection | None = None  # Supervisor end of the worker's pipe
+        self.restarts = 0
+        self.crashes = 0  # Consecutive crashes, reset once the worker reports a connection
+        self.restart_at: float | None = None
+        self.last_status: dict[str, Any] = {}
+
+    def is_alive(self) -> bool:
+        """Check whether the worker process is running."""
+        return self.process is not None and self.process.is_alive()
+
+
+class ShardedGateway:
+    """
+    Serve a device fleet from several SinricPro worker processes.
+
+    Device IDs are partitioned across the workers by a stable hash. Every
+    worker creates its devices with the device factory, connects its own
+    SinricPro client and reports its status periodically. Crashed workers
+    are restarted after an exponential backoff with full jitter.
+
+    The device factory runs in the worker process and must be a picklable,
+    module-level function. When the config has a spool_dir, each shard
+    spools into its own subdirectory ("shard-<n>"). When it has a
+    metrics_port, shard n serves its metrics on metrics_port + n (with port
+    0 every shard picks a free port); the ports are listed in get_status().
+
+    Example:
+        >>> def make_device(device_id: str) -> SinricProDevice:
+        ...     switch = SinricProSwitch(device_id)
+        ...     switch.on_power_state(on_power_state)
+        ...     return switch
+        >>>
+        >>> gateway = ShardedGateway(config, device_ids, make_device, workers=4)
+        >>> await gateway.start()
+        >>> gateway.get_status()["connected"]
+        4
+        >>> await gateway.stop()
+    """
+
+    def __init__(
+        self,
+        config: SinricProConfig | dict[str, Any],
+        device_ids: list[str],
+        device_factory: DeviceFactory,
+        workers: int | None = None,
+        status_interval: float = DEFAULT_STATUS_INTERVAL,
+        restart_delay_min: float = DEFAULT_RESTART_DELAY_MIN,
+        restart_delay_max: float = DEFAULT_RESTART_DELAY_MAX,
+        start_method: str = "spawn",
+    ) -> None:
+        """
+        Initialize the gateway (call start() to launch the workers).
+
+        Args:
+            config: Configuration shared by all workers
+            device_ids: IDs of all devices to serve
+            device_factory: Creates a configured device for a device ID
+            workers: Number of worker processes (default: number of CPUs)
+            status_interval: Seconds between worker status reports
+            restart_delay_min: Base delay before restarting a crashed worker in seconds
+            restart_delay_max: Maximum delay before restarting a crashed worker in seconds
+            start_method: multiprocessing start method ("spawn", "forkserver", "fork")
+
+        Raises:
+            SinricProConfigurationError: If the configuration is invalid
+        """
+        if isinstance(config, dict):
+            config = SinricProConfig(**config)
+
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if not isinstance(workers, int) or workers <= 0:
+            raise SinricProConfigurationError("workers must be a positive integer")
+        if status_interval <= 0:
+            raise SinricProConfigurationError("status_interval must be positive")
+        if restart_delay_min < 0 or restart_delay_max < restart_delay_min:
+            raise SinricProConfigurationError(
+                "restart delays must satisfy 0 <= restart_delay_min <= restart_delay_max"
+            )
+        if config.metrics_port and config.metrics_port + workers - 1 > 65535:
+            raise SinricProConfigurationError(
+                "metrics_port + workers - 1 must not exceed 65535 (one port per shard)"
+            )
+
+        self.config = config
+        self.device_factory = device_factory
+        self.status_interval = status_interval
+        self.restart_delay_min = restart_delay_min
+        self.restart_delay_max = restart_delay_max
+        self._context = multiprocessing.get_context(start_method)
+        self._workers = [
+            _Worker(shard, shard_devices)
+            for shard, shard_devices in enumerate(partition_devices(device_ids, workers))
+        ]
+        self._monitor_task: asyncio.Task[None] | None = None
+        self._running = False
+
+    def get_shard(self, device_id: str) -> int:
+        """
+        Get the shard (worker index) serving a device.
+
+        Args:
+            device_id: Device ID
+
+        Returns:
+            Shard index
+        """
+        return shard_for(device_id, len(self._workers))
+
+    def _shard_config(self, shard: int) -> SinricProConfig:
+        """Get the config of a shard (with its own spool directory and metrics port)."""
+        changes: dict[str, Any] = {}
+        if self.config.spool_dir:
+            changes["spool_dir"] = os.path.join(self.config.spool_dir, f"shard-{shard}")
+        if self.config.metrics_port:
+            changes["metrics_port"] = self.config.metrics_port + shard
+        return dataclasses.replace(self.config, **changes) if changes else self.config
+
+    def _spawn(self, worker: _Worker) -> None:
+        """Start the process of a worker."""
+        if worker.conn is not None:
+            worker.conn.close()
+        worker.conn, child_conn = self._context.Pipe()
+        worker.process = self._context.Process(
+            target=_worker_main,
+            args=(
+                worker.shard,
+                worker.device_ids,
+                self.device_factory,
+                self._shard_config(worker.shard),
+                child_conn,
+                self.status_interval,
+            ),
+            name=f"sinricpro-shard-{worker.shard}",
+            daemon=True,
+        )
+        worker.process.start()
+        child_conn.close()
+        worker.restart_at = None
+        SinricProLogger.info(
+            "Started shard %s (pid %s, %s devices)",
+            worker.shard,
+            worker.process.pid,
+            len(worker.device_ids),
+        )
+
+    async def start(self) -> None:
+        """
+        Start all worker processes and the supervisor.
+
+        Example:
+            >>> await gateway.start()
+        """
+        if self._running:
+            SinricProLogger.warn("ShardedGateway already running")
+            return
+
+        self._running = True
+        for worker in self._workers:
+            if worker.device_ids:
+                self._spawn(worker)
+        self._monitor_task = asyncio.create_task(self._monitor())
+
+    def _restart_delay(self, crashes: int) -> float:
+        """Get the delay before restarting a worker ("full jitter" backoff)."""
+        ceiling = min(self.restart_delay_max, self.restart_delay_min * 2 ** min(crashes - 1, 32))
+        return random.uniform(0, ceiling)
+
+    def _drain_status(self) -> None:
+        """Apply all status reports received from the workers."""
+        for worker in self._workers:
+            if worker.conn is None:
+                continue
+            try:
+                while worker.conn.poll():
+                    worker.last_status = worker.conn.recv()
+                    if worker.last_status["connected"]:
+                        worker.crashes = 0
+            except (EOFError, OSError):
+                # The worker exited; _check_workers() takes care of it
+                worker.conn.close()
+                worker.conn = None
+
+    def _check_workers(self) -> None:
+        """Schedule restarts for crashed workers and start those that are due."""
+        now = time.monotonic()
+        for worker in self._workers:
+            if worker.process is None or worker.is_alive():
+                continue
+
+            if worker.restart_at is None:
+                worker.crashes += 1
+                delay = self._restart_delay(worker.crashes)
+                worker.restart_at = now + delay
+                SinricProLogger.error(
+                    "Shard %s exited with code %s, restarting in %.1fs",
+                    worker.shard,
+                    worker.process.exitcode,
+                    delay,
+                )
+            elif now >= worker.restart_at:
+                worker.restarts += 1
+                self._spawn(worker)
+
+    async def _monitor(self) -> None:
+        """Collect status reports and restart crashed workers until stopped."""
+        while self._running:
+            self._drain_status()
+            self._check_workers()
+            await asyncio.sleep(_SUPERVISOR_POLL_INTERVAL)
+
+    async def stop(self, timeout: float = DEFAULT_STOP_TIMEOUT) -> None:
+        """
+        Stop all workers.
+
+        Workers disconnect gracefully; those still running after the timeout
+        are terminated.
+
+        Args:
+            timeout: Seconds to wait for the workers to exit
+
+        Example:
+            >>> await gateway.stop()
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+
+        for worker in self._workers:
+            if worker.conn is not None:
+                with suppress(OSError):
+                    worker.conn.send(_STOP)
+        deadline = time.monotonic() + timeout
+        while any(worker.is_alive() for worker in self._workers):
+            if time.monotonic() >= deadline:
+                break
+            self._drain_status()
+            await asyncio.sleep(0.05)
+
+        for worker in self._workers:
+            if worker.is_alive():
+                SinricProLogger.warn("Shard %s did not stop in time, terminating", worker.shard)
+                worker.process.terminate()
+            if worker.process is not None:
+                worker.process.join()
+
+        self._drain_status()
+        for worker in self._workers:
+            if worker.conn is not None:
+                worker.conn.close()
+                worker.conn = None
+        SinricProLogger.info("ShardedGateway stopped")
+
+    def get_status(self) -> dict[str, Any]:
+        """
+        Get the aggregated status of all workers.
+
+        Totals are computed from the last report of every worker, so they
+        lag behind by at most the status interval.
+
+        Returns:
+            Dict with the number of "workers", "alive" and "connected" workers,
+            total "devices" and "restarts", summed "send_queue" and "reconnects"
+            counters, and per-worker details (including the port serving the
+            worker's metrics, if any) in "shards"
+
+        Example:
+            >>> gateway.get_status()["devices"]
+            10000
+        """
+        if self._running:
+            self._drain_status()
+
+        send_queue: dict[str, int] = {}
+        reconnects: dict[str, float] = {}
+        shards = []
+        for worker in self._workers:
+            status = worker.last_status
+            alive = worker.is_alive()
+            for key, value in status.get("send_queue", {}).items():
+                send_queue[key] = send_queue.get(key, 0) + value
+            for key, value in status.get("reconnects", {}).items():
+                if key != "last_reconnect_ms":
+                    reconnects[key] = reconnects.get(key, 0) + value
+            shards.append(
+                {
+                    "shard": worker.shard,
+                    "pid": worker.process.pid if worker.process else None,
+                    "alive": alive,
+                    "connected": alive and status.get("connected", False),
+                    "devices": len(worker.device_ids),
+                    "restarts": worker.restarts,
+                    "metrics_port": status.get("metrics_port"),
+                    "last_report": status.get("time"),
+                }
+            )
+
+        return {
+            "workers": len(shards),
+            "alive": sum(shard["alive"] for shard in shards),
+            "connected": sum(shard["connected"] for shard in shards),
+            "devices": sum(shard["devices"] for shard in shards),
+            "restarts": sum(shard["restarts"] for shard in shards),
+            "send_queue": send_queue,
+            "reconnects": reconnects,
+            "shards": shards,
+        }
@@ -9,26 +9,138 @@ import hashlib
 import hmac
 import json
 import re
+from json.decoder import scanstring
 from typing import Any
 
+from sinricpro.core.codec import JsonCodec
 from sinricpro.utils.logger import SinricProLogger
 
+_scan_once = json.JSONDecoder().scan_once
+_whitespace = re.compile(r"[ \t\n\r]*")
+_WHITESPACE_CHARS = " \t\n\r"
+
+
+def parse_message(raw_message: str) -> tuple[dict[str, Any], str | None]:
+    """
+    Parse a raw message and locate the exact text of its payload.
+
+    The top-level object is walked member by member with the C JSON scanner,
+    so the message is parsed exactly once and the payload span comes for free,
+    whichever JSON codec is configured for encoding.
+
+    Args:
+        raw_message: The message as received on the wire
+
+    Returns:
+        Tuple of (parsed message, payload text exactly as sent or None if the
+        message has no top-level "payload" object)
+
+    Raises:
+        json.JSONDecodeError: If the message is not valid JSON
+
+    Example:
+        >>> parse_message('{"payload":{"a":1.50},"signature":{"HMAC":"..."}}')
+        ({'payload': {'a': 1.5}, 'signature': {'HMAC': '...'}}, '{"a":1.50}')
+    """
+    raw = raw_message
+    index = _whitespace.match(raw).end()
+    if raw[index : index + 1] != "{":
+        return json.loads(raw), None
+
+    message: dict[str, Any] = {}
+    raw_payload: str | None = None
+
+    index += 1
+    if raw[index : index + 1] in _WHITESPACE_CHARS:
+        index = _whitespace.match(raw, index).end()
+
+    if raw[index : index + 1] == "}":
+        index += 1
+    else:
+        while True:
+            if raw[index : index + 1] != '"':
+                raise json.JSONDecodeError("Expecting property name", raw, index)
+            key, index = scanstring(raw, index + 1)
+
+            if raw[index : index + 1] != ":":
+                index = _whitespace.match(raw, index).end()
+                if raw[index : index + 1] != ":":
+                    raise json.JSONDecodeError("Expecting ':' delimiter", raw, index)
+            index += 1
+            if raw[index : index + 1] in _WHITESPACE_CHARS:
+                index = _whitespace.match(raw, index).end()
+
+            try:
+                value, end = _scan_once(raw, index)
+            except StopIteration as err:
+                raise json.JSONDecodeError("Expecting value", raw, err.value) from None
+
+            if key == "payload":
+                raw_payload = raw[index:end]
+            message[key] = value
+
+            if raw[end : end + 1] in _WHITESPACE_CHARS:
+                end = _whitespace.match(raw, end).end()
+            delimiter = raw[end : end + 1]
+            if delimiter == ",":
+                index = end + 1
+                if raw[index : index + 1] in _WHITESPACE_CHARS:
+                    index = _whitespace.match(raw, index).end()
+            elif delimiter == "}":
+                index = end + 1
+                break
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", raw, end)
+
+    if index != len(raw) and _whitespace.match(raw, index).end() != len(raw):
+        raise json.JSONDecodeError("Extra data", raw, index)
+
+    if not isinstance(message.get("payload"), dict):
+        raw_payload = None
+    return message, raw_payload
+
 
 class Signature:
     """
     Handles HMAC-SHA256 signature generation and validation.
 
     Signs outgoing messages and validates incoming messages from SinricPro.
+
+    The HMAC is keyed once; every signature copies the keyed state instead
+    of redoing the key setup.
     """
 
-    def __init__(self, app_secret: str) -> None:
+    def __init__(self, app_secret: str, codec: JsonCodec | None = None) -> None:
         """
         Initialize the Signature handler.
 
         Args:
             app_secret: The SinricPro app secret key
+            codec: JSON codec used to serialize payloads (default: stdlib)
         """
         self.app_secret = app_secret.encode("utf-8")
+        self.codec = codec or JsonCodec()
+        self._hmac = hmac.new(self.app_secret, digestmod=hashlib.sha256)
+
+    def sign_text(self, data: str) -> str:
+        """
+        Compute the Base64-encoded HMAC-SHA256 of a string.
+
+        Use this to sign a payload that has already been serialized.
+
+        Args:
+            data: The text to authenticate (UTF-8 encoded before hashing)
+
+        Returns:
+            Base64-encoded signature string
+
+        Example:
+            >>> sig = Signature("my-secret")
+            >>> signature = sig.sign_text('{"action":"setPowerState"}')
+        """
+        mac = self._hmac.copy()
+        mac.update(data.encode("utf-8"))
+        return base64.b64encode(mac.digest()).decode("ascii")
 
     def sign(self, message: dict[str, Any]) -> str:
         """
@@ -47,13 +159,10 @@ class Signature:
             >>> message["signature"] = {"HMAC": signature}
         """
         # Convert payload to JSON string without spaces
-        payload_str = json.dumps(message["payload"], separators=(",", ":"), sort_keys=False)
-
-        # Compute HMAC-SHA256
-        signature = hmac.new(self.app_secret, payload_str.encode("utf-8"), hashlib.sha256)
+        payload_str = self.codec.dumps(message["payload"])
 
-        # Base64 encode
-        signature_b64 = base64.b64encode(signature.digest()).decode("utf-8")
+        # Compute Base64-encoded HMAC-SHA256
+        signature_b64 = self.sign_text(payload_str)
 
         # Add signature to message
         if "signature" not in message:
@@ -62,24 +171,31 @@ class Signature:
 
         return signature_b64
 
-    def validate(self, message: dict[str, Any] | str) -> bool:
+    def validate(self, message: dict[str, Any] | str, raw_payload: str | None = None) -> bool:
         """
         Validate message signature.
 
+        The HMAC is computed over the payload text exactly as received whenever
+        it is available, so the result does not depend on how the payload would
+        be re-serialized (float formatting, unicode escaping).
+
         Args:
             message: Message dict or JSON string containing signature
+            raw_payload: Payload text as received (see parse_message()). If
+                omitted for a dict, the payload is re-serialized instead.
 
         Returns:
             True if signature is valid, False otherwise
 
         Example:
             >>> sig = Signature("my-secret")
-            >>> is_valid = sig.validate(message_dict)
+            >>> message, raw_payload = parse_message(raw)
+            >>> is_valid = sig.validate(message, raw_payload)
         """
         try:
             # Convert to dict if string
             if isinstance(message, str):
-                message = json.loads(message)
+                message, raw_payload = parse_message(message)
 
             # Extract signature from message
             if "signature" not in message or "HMAC" not in message["signature"]:
@@ -88,18 +204,15 @@ class Signature:
 
             received_signature = message["signature"]["HMAC"]
 
-            # Extract payload string from original message
-            payload_str = self._extract_payload(message)
+            # Use the payload text as it was signed, falling back to re-serializing
+            payload_str = raw_payload if raw_payload is not None else self._extract_payload(message)
 
             if not payload_str:
                 SinricProLogger.error("Failed to extract payload for signature validation")
                 return False
 
             # Compute expected signature
-            expected_signature = hmac.new(
-                self.app_secret, payload_str.encode("utf-8"), hashlib.sha256
-            )
-            expected_signature_b64 = base64.b64encode(expected_signature.digest()).decode("utf-8")
+            expected_signature_b64 = self.sign_text(payload_str)
 
             # Compare signatures
             is_valid = hmac.compare_digest(received_signature, expected_signature_b64)
@@ -110,7 +223,7 @@ class Signature:
             return is_valid
 
         except Exception as e:
-            SinricProLogger.error(f"Error validating signature: {e}")
+            SinricProLogger.error("Error validating signature: %s", e)
             return False
 
     def _extract_payload(self, message: dict[str, Any]) -> str:
@@ -126,7 +239,7 @@ class Signature:
         try:
             # For validation, we need to reconstruct the payload exactly as it was signed
             # This means using the same JSON serialization
-            return json.dumps(message["payload"], separators=(",", ":"), sort_keys=False)
+            return self.codec.dumps(message["payload"])
         except Exception as e:
-            SinricProLogger.error(f"Error extracting payload: {e}")
+            SinricProLogger.error("Error extracting payload: %s", e)
             return ""
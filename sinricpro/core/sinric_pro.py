@@ -5,19 +5,40 @@ Main SDK class managing connections, devices, and message routing.
 """
 
 import asyncio
-import json
 import re
 import time
-from typing import Any
+from typing import Any, Iterable
 
+from sinricpro.core.actions import ACTION_PUSH_NOTIFICATION
+from sinricpro.core.codec import JsonCodec, get_codec
+from sinricpro.core.deadband import Deadband
 from sinricpro.core.exceptions import (
     SinricProConfigurationError,
+    SinricProConnectionError,
     SinricProDeviceError,
 )
-from sinricpro.core.message_queue import MessageQueue
-from sinricpro.core.signature import Signature
+from sinricpro.core.event_spool import EventSpool
+from sinricpro.core.message_builder import MessageBuilder
+from sinricpro.core.message_queue import MessagePriority, MessageQueue, QueuedMessage
+from sinricpro.core.metrics import MetricFamily, MetricsRegistry, MetricsServer, SinricProMetrics
+from sinricpro.core.request_dispatcher import RequestDispatcher
+from sinricpro.core.signature import Signature, parse_message
 from sinricpro.core.sinric_pro_device import SinricProDevice
+from sinricpro.core.state_shadow import EVENT_ONLY_ACTIONS, TELEMETRY_ACTIONS
+from sinricpro.core.token_bucket import TokenBucket
+from sinricpro.core.tracing import (
+    SPAN_DISPATCH_QUEUE,
+    SPAN_RECEIVE_PARSE,
+    SPAN_RECEIVE_QUEUE,
+    SPAN_RECEIVE_VALIDATE,
+    SPAN_REQUEST_HANDLE,
+    SPAN_RESPONSE_BUILD,
+    SPAN_SEND_QUEUE,
+    SPAN_SEND_WRITE,
+    Tracer,
+)
 from sinricpro.core.types import (
+    BulkEvent,
     SinricProConfig,
     SinricProRequest,
     ConnectedCallback,
@@ -31,34 +52,54 @@ from sinricpro.core.event_limiter import EventLimiter
 from sinricpro.core.websocket_client import WebSocketClient, WebSocketConfig
 from sinricpro.utils.logger import SinricProLogger, LogLevel
 
+# Send queue lane of event actions; other events are state events
+_EVENT_PRIORITIES: dict[str, MessagePriority] = {
+    **dict.fromkeys(TELEMETRY_ACTIONS, MessagePriority.TELEMETRY),
+    ACTION_PUSH_NOTIFICATION: MessagePriority.NOTIFICATION,
+}
+
 
 class SinricPro:
     """
     Main SinricPro SDK class.
 
-    Singleton class managing WebSocket connection, device registration,
-    and message routing.
+    Manages the WebSocket connection, device registration and message
+    routing for one app key. Every instance is an independent client with
+    its own connection, queues, signature and devices, so one process (and
+    one event loop) can serve many accounts. get_instance() returns a
+    process-wide default client for single-account applications.
 
     Example:
         >>> sinric_pro = SinricPro.get_instance()
         >>> await sinric_pro.begin(config)
+        >>>
+        >>> # Several accounts in one process
+        >>> clients = [SinricPro() for _ in configs]
+        >>> await asyncio.gather(*(c.begin(cfg) for c, cfg in zip(clients, configs)))
     """
 
     _instance: "SinricPro | None" = None
 
     def __init__(self) -> None:
-        """Initialize SinricPro (use get_instance() instead)."""
-        if SinricPro._instance is not None:
-            raise RuntimeError("Use SinricPro.get_instance() instead of constructor")
-
+        """Initialize an independent SinricPro client."""
         self.config: SinricProConfig | None = None
         self.devices: dict[str, SinricProDevice] = {}
         self.websocket: WebSocketClient | None = None
         self.receive_queue = MessageQueue()
         self.send_queue = MessageQueue()
         self.signature: Signature | None = None
+        self._codec: JsonCodec = JsonCodec()
+        self._message_builder: MessageBuilder | None = None
+        self._dispatcher = RequestDispatcher()
+        self._spool: EventSpool | None = None
+        self._event_budget: TokenBucket | None = None
+        self.metrics: MetricsRegistry | None = None  # Set by begin() when metrics are enabled
+        self._metrics: SinricProMetrics | None = None
+        self._metrics_server: MetricsServer | None = None
+        self._tracer: Tracer | None = None
         self.is_initialized = False
         self._processing_tasks: list[asyncio.Task[None]] = []
+        self._connected_event = asyncio.Event()
         self._connected_callbacks: list[ConnectedCallback] = []
         self._disconnected_callbacks: list[DisconnectedCallback] = []
         self._pong_callbacks: list[PongCallback] = []
@@ -68,10 +109,10 @@ class SinricPro:
     @classmethod
     def get_instance(cls) -> "SinricPro":
         """
-        Get the singleton instance of SinricPro.
+        Get the process-wide default SinricPro client.
 
         Returns:
-            The SinricPro singleton instance
+            The default SinricPro instance (created on first use)
 
         Example:
             >>> sinric_pro = SinricPro.get_instance()
@@ -117,7 +158,32 @@ class SinricPro:
         SinricProLogger.info("Initializing SinricPro SDK...")
 
         # Initialize signature handler
-        self.signature = Signature(self.config.app_secret)
+        self._codec = get_codec(self.config.json_codec)
+        self.signature = Signature(self.config.app_secret, self._codec)
+        self._message_builder = MessageBuilder(self.signature, self._codec)
+        SinricProLogger.debug("JSON codec: %s", self._codec.name)
+
+        # Apply send queue limits (nothing can be queued before a signature exists)
+        self.send_queue = MessageQueue(
+            max_messages=self.config.send_queue_max_messages,
+            max_bytes=self.config.send_queue_max_bytes,
+            overflow_policy=self.config.send_queue_overflow_policy,
+            scheduling=self.config.send_queue_scheduling,
+        )
+        self.send_queue.on_drop = self._handle_dropped_message
+        self._dispatcher = RequestDispatcher(self.config.max_concurrent_requests)
+        if self.config.event_rate_limit:
+            self._event_budget = TokenBucket(self.config.event_rate_limit, self.config.event_burst)
+
+        # Replay events that were not sent before the last stop or crash
+        if self.config.spool_dir:
+            self._spool = EventSpool(self.config.spool_dir, self.config.spool_fsync_policy)
+            for spool_seq, message_str in self._spool.open():
+                priority = self._spooled_priority(message_str)
+                self.send_queue.restore_sync(message_str, priority, spool_seq)
+
+        if self.config.metrics_enabled:
+            await self._start_metrics()
 
         # Initialize WebSocket
         try:
@@ -125,6 +191,8 @@ class SinricPro:
                 server_url=self.config.server_url,
                 app_key=self.config.app_key,
                 device_ids=list(self.devices.keys()),
+                server_port=self.config.server_port,
+                use_ssl=self.config.use_ssl,
             )
 
             self.websocket = WebSocketClient(ws_config)
@@ -142,7 +210,7 @@ class SinricPro:
             SinricProLogger.info("SinricPro SDK initialized successfully")
 
         except Exception as e:
-            SinricProLogger.error(f"Failed to initialize SinricPro: {e}")
+            SinricProLogger.error("Failed to initialize SinricPro: %s", e)
             raise
 
     def add(self, device: SinricProDevice) -> SinricProDevice:
@@ -174,13 +242,18 @@ class SinricPro:
             )
 
         if device_id in self.devices:
-            SinricProLogger.warn(f"Device {device_id} already exists, returning existing instance")
+            SinricProLogger.warn("Device %s already exists, returning existing instance", device_id)
             return self.devices[device_id]
 
+        if device.get_sinric_pro() not in (None, self):
+            raise SinricProDeviceError(
+                f"Device {device_id} is already added to another SinricPro client"
+            )
+
         device.set_sinric_pro(self)
         self.devices[device_id] = device
 
-        SinricProLogger.info(f"Device added: {device_id} ({device.get_product_type()})")
+        SinricProLogger.info("Device added: %s (%s)", device_id, device.get_product_type())
 
         # Update WebSocket device list if already connected
         if self.is_initialized and self.websocket:
@@ -253,6 +326,24 @@ class SinricPro:
         """
         self._module_setting_callback = callback
 
+    def set_tracer(self, tracer: Tracer | None) -> None:
+        """
+        Report the stages of every request and outgoing message to a tracer.
+
+        Requests are traced from the receive queue to the WebSocket write of
+        their response, one span per stage, correlated by the replyToken (see
+        sinricpro.core.tracing). Without a tracer (the default) nothing is
+        recorded.
+
+        Args:
+            tracer: Tracer to report to, or None to stop tracing
+
+        Example:
+            >>> from sinricpro.core import CallbackTracer
+            >>> sinric_pro.set_tracer(CallbackTracer(on_end=lambda span: print(span)))
+        """
+        self._tracer = tracer
+
     async def send_setting_event(
         self,
         setting_id: str,
@@ -302,11 +393,12 @@ class SinricPro:
         }
 
         try:
-            await self.send_message(event_message)
-            SinricProLogger.debug(f"Module setting event sent: {setting_id} = {value}")
+            if not await self.send_message(event_message):
+                return False
+            SinricProLogger.debug("Module setting event sent: %s = %s", setting_id, value)
             return True
         except Exception as e:
-            SinricProLogger.error(f"Failed to send module setting event {setting_id}: {e}")
+            SinricProLogger.error("Failed to send module setting event %s: %s", setting_id, e)
             return False
 
     def _generate_message_id(self) -> str:
@@ -341,33 +433,211 @@ class SinricPro:
         for task in self._processing_tasks:
             task.cancel()
         self._processing_tasks.clear()
+        self._dispatcher.cancel()
+
+        # Drop events deferred by event coalescing
+        for device in self.devices.values():
+            for value in vars(device).values():
+                if isinstance(value, EventLimiter):
+                    value.clear_pending()
 
         # Disconnect WebSocket
         if self.websocket:
             await self.websocket.disconnect()
 
-        # Clear queues
+        self._connected_event.clear()
+
+        # Clear queues (spooled events stay on disk and are replayed by the next begin())
         self.receive_queue.clear()
         self.send_queue.clear()
 
+        if self._spool:
+            self._spool.close()
+            self._spool = None
+
+        # The registry stays readable after stop()
+        if self._metrics_server:
+            await self._metrics_server.stop()
+            self._metrics_server = None
+
         SinricProLogger.info("SinricPro SDK stopped")
 
-    async def send_message(self, message: dict[str, Any]) -> None:
+    async def send_message(self, message: dict[str, Any]) -> bool:
         """
         Send a message to SinricPro (for internal use by devices).
 
         Args:
             message: Message dictionary to send
+
+        Returns:
+            True if the message was queued, False if it was dropped
         """
-        if not self.signature:
+        if not self._message_builder:
             SinricProLogger.error("Signature handler not initialized")
-            return
+            return False
+
+        payload = message["payload"]
+        if self._event_budget:
+            await self._acquire_event_budget(payload)
 
-        # Sign the message
-        self.signature.sign(message)
+        # Serialize the payload once, sign that text and frame it
+        message_str = self._message_builder.build(payload, message.get("header"))
+        priority = _EVENT_PRIORITIES.get(payload["action"], MessagePriority.STATE_EVENT)
+        queued = await self._enqueue_event(message_str, priority)
+        if self._metrics:
+            self._metrics.event_sent(payload, queued)
+        return queued
 
-        # Add to send queue
-        self.send_queue.push_sync(json.dumps(message, separators=(",", ":"), sort_keys=False))
+    async def send_events_bulk(self, events: Iterable[BulkEvent | tuple[Any, ...]]) -> list[bool]:
+        """
+        Send events of many devices in one pass.
+
+        Each event goes through the same deadband, duplicate suppression,
+        rate limiting and event coalescing as the capability's send_*_event()
+        method, using the limiter and deadband the capability declares for
+        the action. When the batch holds several events for the same state
+        of a device, only the last one is sent and the earlier ones count as
+        coalesced. The admitted events share one timestamp, are signed and
+        serialized in a tight loop and then queued together, which is cheaper
+        than one send_event() call per device.
+
+        Args:
+            events: BulkEvent tuples (device or device ID, action, value,
+                optional instance ID, optional cause)
+
+        Returns:
+            One result per event, as send_event() would return it: True if
+            the event was queued, deferred or suppressed, False if it was
+            rate limited, dropped or cannot be sent (unknown device, or an
+            action the device's capabilities do not declare)
+
+        Example:
+            >>> results = await client.send_events_bulk(
+            ...     (device_id, "setPowerState", {"state": "On"}) for device_id in fleet
+            ... )
+            >>> results.count(True)
+            1000
+        """
+        events = list(events)
+        if not self._message_builder:
+            SinricProLogger.error("Signature handler not initialized")
+            return [False] * len(events)
+
+        # Resolve the events; a later event for the same state supersedes an earlier one
+        resolved: list[tuple[SinricProDevice, str, dict[str, Any], str, str] | None] = []
+        latest: dict[tuple[str, str, str], int] = {}
+        for event in events:
+            if len(event) == 3:
+                device, action, value = event
+                instance_id, cause = "", PHYSICAL_INTERACTION
+            else:
+                device, action, value, instance_id, cause = BulkEvent(*event)
+                instance_id = instance_id or ""
+            if isinstance(device, str):
+                device = self.devices.get(device)
+            if device is None or device._sinric_pro is not self:
+                SinricProLogger.warn("%s event for a device not added to this client", action)
+                resolved.append(None)
+                continue
+            if action not in EVENT_ONLY_ACTIONS:
+                latest[(device._device_id, action, instance_id)] = len(resolved)
+            resolved.append((device, action, value, instance_id, cause))
+
+        results: list[bool] = []
+        # (result index, device, deadband, value, payload) of the events to send
+        admitted: list[
+            tuple[int, SinricProDevice, Deadband | None, dict[str, Any], dict[str, Any]]
+        ] = []
+        created_at = self.get_timestamp()
+        for index, entry in enumerate(resolved):
+            if entry is None:
+                results.append(False)
+                continue
+            device, action, value, instance_id, cause = entry
+            filters = device._event_filters(action)
+            if filters is None:
+                SinricProLogger.warn(
+                    "%s events cannot be sent in bulk", action, device=device._device_id
+                )
+                results.append(False)
+                continue
+            limiter, deadband = filters
+            if latest.get((device._device_id, action, instance_id), index) != index:
+                if limiter is not None:
+                    limiter.coalesced_count += 1
+                results.append(True)
+                continue
+
+            outcome = device._admit_event(action, value, cause, instance_id, limiter, deadband)
+            if outcome is not None:
+                results.append(outcome)
+                continue
+
+            payload = device._event_payload(action, value, cause, instance_id, created_at)
+            admitted.append((index, device, deadband, value, payload))
+            results.append(False)
+
+        # Sign and serialize all admitted events, then queue them together
+        payloads = [entry[4] for entry in admitted]
+        messages = self._message_builder.build_many(payloads)
+        priorities = [
+            _EVENT_PRIORITIES.get(payload["action"], MessagePriority.STATE_EVENT)
+            for payload in payloads
+        ]
+        if self._event_budget is None:
+            queued = await self._enqueue_events(messages, priorities)
+        else:
+            # The budget paces the events one at a time
+            queued = []
+            for payload, message_str, priority in zip(payloads, messages, priorities):
+                await self._acquire_event_budget(payload)
+                queued.append(await self._enqueue_event(message_str, priority))
+
+        metrics = self._metrics
+        for (index, device, deadband, value, payload), sent in zip(admitted, queued):
+            if metrics:
+                metrics.event_sent(payload, sent)
+            if sent:
+                device._event_queued(
+                    payload["action"], value, payload.get("instanceId", ""), deadband
+                )
+                results[index] = True
+        return results
+
+    async def _acquire_event_budget(self, payload: dict[str, Any]) -> None:
+        """Wait for the connection-wide event budget, taking turns with the other devices."""
+        assert self._event_budget is not None
+        waited = await self._event_budget.acquire(payload.get("deviceId"))
+        if self._metrics:
+            self._metrics.event_budget_wait.observe(waited)
+
+    def _spooled_priority(self, message_str: str) -> int:
+        """Get the send queue lane of an event replayed from the spool."""
+        try:
+            action = parse_message(message_str)[0]["payload"]["action"]
+        except Exception:
+            return MessagePriority.STATE_EVENT
+        return _EVENT_PRIORITIES.get(action, MessagePriority.STATE_EVENT)
+
+    async def _enqueue_event(self, message_str: str, priority: int) -> bool:
+        """Spool (if enabled) and queue a signed, serialized event in its lane."""
+        # Persist before queueing so the event survives a stop or crash
+        spool_seq = self._spool.append(message_str) if self._spool else None
+
+        # Add to send queue (waits for room if the queue is bounded and blocking)
+        if not await self.send_queue.push(message_str, priority, spool_seq):
+            SinricProLogger.warn("Send queue full, message dropped")
+            return False
+        return True
+
+    async def _enqueue_events(self, messages: list[str], priorities: list[int]) -> list[bool]:
+        """Spool (if enabled) and queue a batch of signed, serialized events in their lanes."""
+        spool_seqs = self._spool.append_many(messages) if self._spool else [None] * len(messages)
+        queued = await self.send_queue.push_many(zip(messages, priorities, spool_seqs))
+        dropped = queued.count(False)
+        if dropped:
+            SinricProLogger.warn("Send queue full, %d messages dropped", dropped)
+        return queued
 
     def get_timestamp(self) -> int:
         """
@@ -391,31 +661,38 @@ class SinricPro:
 
         self.websocket.on_pong(lambda latency: self._handle_pong(latency))
 
-        self.websocket.on_error(lambda error: SinricProLogger.error(f"WebSocket error: {error}"))
+        self.websocket.on_error(lambda error: SinricProLogger.error("WebSocket error: %s", error))
 
     def _handle_connected(self) -> None:
         """Handle WebSocket connected event."""
+        self._connected_event.set()
         for callback in self._connected_callbacks:
             try:
                 callback()
             except Exception as e:
-                SinricProLogger.error(f"Error in connected callback: {e}")
+                SinricProLogger.error("Error in connected callback: %s", e)
 
     def _handle_disconnected(self) -> None:
         """Handle WebSocket disconnected event."""
+        self._connected_event.clear()
+        # The server may miss state changes until reconnected: stop suppressing duplicates
+        for device in self.devices.values():
+            device.get_state_shadow().invalidate()
         for callback in self._disconnected_callbacks:
             try:
                 callback()
             except Exception as e:
-                SinricProLogger.error(f"Error in disconnected callback: {e}")
+                SinricProLogger.error("Error in disconnected callback: %s", e)
 
     def _handle_pong(self, latency: int) -> None:
         """Handle WebSocket pong event."""
+        if self._metrics:
+            self._metrics.pong_latency.observe(latency / 1000)
         for callback in self._pong_callbacks:
             try:
                 callback(latency)
             except Exception as e:
-                SinricProLogger.error(f"Error in pong callback: {e}")
+                SinricProLogger.error("Error in pong callback: %s", e)
 
     def _start_message_processor(self) -> None:
         """Start message processing tasks."""
@@ -424,57 +701,86 @@ class SinricPro:
         self._processing_tasks.extend([receive_task, send_task])
 
     async def _process_receive_queue(self) -> None:
-        """Process received messages."""
+        """
+        Process received messages.
+
+        Messages are parsed and validated here in arrival order; requests are
+        then handed to the dispatcher so a slow device callback does not delay
+        requests for other devices.
+        """
         while self.is_initialized:
             try:
-                message_str = await self.receive_queue.pop()
-                if message_str:
-                    await self._handle_message(message_str)
-                else:
-                    await asyncio.sleep(0.01)  # Small delay if queue is empty
+                entry = await self.receive_queue.get_entry()
+                await self._handle_message(entry.message, entry.enqueued_ns)
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                SinricProLogger.error(f"Error processing received message: {e}")
+                SinricProLogger.error("Error processing received message: %s", e)
 
-    async def _handle_message(self, message_str: str) -> None:
-        """Handle a received message."""
+    async def _handle_message(self, message_str: str, enqueued_ns: int = 0) -> None:
+        """Handle a received message, reporting its receive stages to the tracer if set."""
+        tracer = self._tracer
+        parse_start = time.time_ns() if tracer else 0
         try:
-            message = json.loads(message_str)
+            # Parse once, keeping the payload text exactly as it was signed
+            message, raw_payload = parse_message(message_str)
+            if self._metrics:
+                self._metrics.messages_received.inc()
 
             # Handle timestamp message
             if "timestamp" in message:
                 return
 
+            if tracer:
+                payload = message.get("payload") or {}
+                reply_token = payload.get("replyToken")
+                attributes = {
+                    "device": payload.get("deviceId", ""),
+                    "action": payload.get("action"),
+                }
+                if enqueued_ns:
+                    tracer.record(SPAN_RECEIVE_QUEUE, reply_token, enqueued_ns, **attributes)
+                tracer.record(SPAN_RECEIVE_PARSE, reply_token, parse_start, **attributes)
+                validate_start = time.time_ns()
+
             # Validate signature
-            if not self.signature or not self.signature.validate(message):
+            valid = bool(self.signature and self.signature.validate(message, raw_payload))
+            if tracer:
+                tracer.record(SPAN_RECEIVE_VALIDATE, reply_token, validate_start, **attributes)
+            if not valid:
                 SinricProLogger.error("Invalid message signature")
-                self._send_invalid_signature_response(message)
+                if self._metrics:
+                    self._metrics.invalid_signatures.inc()
+                await self._send_invalid_signature_response(message)
                 return
 
             # Route message
-            if message["payload"]["type"] == "request":
+            payload = message["payload"]
+            if payload["type"] == "request":
+                submitted_ns = time.time_ns() if tracer else 0
                 # Check scope to determine if this is a module or device request
-                scope = message["payload"].get("scope", "device")
-                if scope == "module":
-                    await self._handle_module_request(message)
+                if payload.get("scope", "device") == "module":
+                    self._dispatcher.submit("module", lambda: self._handle_module_request(message))
                 else:
-                    await self._handle_request(message)
-            elif message["payload"]["type"] == "response":
+                    self._dispatcher.submit(
+                        str(payload.get("deviceId")),
+                        lambda: self._handle_request(message, submitted_ns),
+                    )
+            elif payload["type"] == "response":
                 # Response messages (not typically used in device SDK)
                 pass
 
         except Exception as e:
-            SinricProLogger.error(f"Error handling message: {e}")
+            SinricProLogger.error("Error handling message: %s", e)
 
-    async def _handle_request(self, message: dict[str, Any]) -> None:
+    async def _handle_request(self, message: dict[str, Any], submitted_ns: int = 0) -> None:
         """Handle an incoming request."""
         device_id = message["payload"].get("deviceId")
         device = self.devices.get(device_id) if device_id else None
 
         if not device:
-            SinricProLogger.error(f"Device not found: {device_id}")
-            self._send_error_response(message, f"Device {device_id} not found")
+            SinricProLogger.error("Device not found: %s", device_id)
+            await self._send_error_response(message, f"Device {device_id} not found")
             return
 
         request = SinricProRequest(
@@ -483,8 +789,27 @@ class SinricPro:
             request_value=message["payload"].get("value", {}),
         )
 
-        success = await device.handle_request(request)
-        self._send_response(message, success, request.response_value, request.error_message)
+        span = None
+        if self._tracer:
+            reply_token = message["payload"].get("replyToken")
+            attributes = {"device": device_id, "action": request.action}
+            if submitted_ns:
+                self._tracer.record(SPAN_DISPATCH_QUEUE, reply_token, submitted_ns, **attributes)
+            span = self._tracer.start(SPAN_REQUEST_HANDLE, reply_token, **attributes)
+
+        start = time.perf_counter()
+        try:
+            success = await device.handle_request(request)
+        except BaseException as e:
+            if span and self._tracer:
+                self._tracer.end(span, e)
+            raise
+        if span and self._tracer:
+            self._tracer.end(span)
+        if self._metrics:
+            elapsed = time.perf_counter() - start
+            self._metrics.request_handled(device_id, request.action, success, elapsed)
+        await self._send_response(message, success, request.response_value, request.error_message)
 
     async def _handle_module_request(self, message: dict[str, Any]) -> None:
         """Handle an incoming module-level request."""
@@ -494,7 +819,7 @@ class SinricPro:
         if action == "setSetting":
             if not self._module_setting_callback:
                 SinricProLogger.error("No module setting callback registered")
-                self._send_module_response(message, False, {}, "No module setting callback registered")
+                await self._send_module_response(message, False, {}, "No module setting callback registered")
                 return
 
             setting_id = request_value.get("id", "")
@@ -503,15 +828,15 @@ class SinricPro:
             try:
                 success = await self._module_setting_callback(setting_id, value)
                 response_value = {"id": setting_id, "value": value} if success else {}
-                self._send_module_response(message, success, response_value)
+                await self._send_module_response(message, success, response_value)
             except Exception as e:
-                SinricProLogger.error(f"Error in module setting callback: {e}")
-                self._send_module_response(message, False, {}, str(e))
+                SinricProLogger.error("Error in module setting callback: %s", e)
+                await self._send_module_response(message, False, {}, str(e))
         else:
-            SinricProLogger.error(f"Unknown module action: {action}")
-            self._send_module_response(message, False, {}, f"Unknown module action: {action}")
+            SinricProLogger.error("Unknown module action: %s", action)
+            await self._send_module_response(message, False, {}, f"Unknown module action: {action}")
 
-    def _send_module_response(
+    async def _send_module_response(
         self,
         request_message: dict[str, Any],
         success: bool,
@@ -519,30 +844,26 @@ class SinricPro:
         error_message: str | None = None,
     ) -> None:
         """Send a module-level response message (without deviceId)."""
-        response_message: dict[str, Any] = {
-            "header": {
-                "payloadVersion": 2,
-                "signatureVersion": 1,
-            },
-            "payload": {
-                "action": request_message["payload"]["action"],
-                "clientId": request_message["payload"]["clientId"],
-                "createdAt": self.get_timestamp(),
-                "message": error_message if error_message else ("OK" if success else "Request failed"),
-                "replyToken": request_message["payload"]["replyToken"],
-                "scope": "module",
-                "success": success,
-                "type": "response",
-                "value": value,
-            },
-        }
+        if not self._message_builder:
+            return
 
-        if self.signature:
-            self.signature.sign(response_message)
+        payload: dict[str, Any] = {
+            "action": request_message["payload"]["action"],
+            "clientId": request_message["payload"]["clientId"],
+            "createdAt": self.get_timestamp(),
+            "message": error_message if error_message else ("OK" if success else "Request failed"),
+            "replyToken": request_message["payload"]["replyToken"],
+            "scope": "module",
+            "success": success,
+            "type": "response",
+            "value": value,
+        }
 
-        self.send_queue.push_sync(json.dumps(response_message, separators=(",", ":"), sort_keys=False))
+        if self._metrics:
+            self._metrics.requests.inc("", payload["action"], "success" if success else "failure")
+        await self.send_queue.push(self._message_builder.build(payload), MessagePriority.RESPONSE)
 
-    def _send_response(
+    async def _send_response(
         self,
         request_message: dict[str, Any],
         success: bool,
@@ -550,62 +871,270 @@ class SinricPro:
         error_message: str | None = None,
     ) -> None:
         """Send a response message."""
-        response_message: dict[str, Any] = {
-            "header": {
-                "payloadVersion": 2,
-                "signatureVersion": 1,
-            },
-            "payload": {
-                "action": request_message["payload"]["action"],
-                "clientId": request_message["payload"]["clientId"],
-                "createdAt": self.get_timestamp(),
-                "deviceId": request_message["payload"]["deviceId"],
-                "message": error_message if error_message else ("OK" if success else "Request failed"),
-                "replyToken": request_message["payload"]["replyToken"],
-                "scope": "device",
-                "success": success,
-                "type": "response",
-                "value": value,
-            },
+        if not self._message_builder:
+            return
+
+        payload: dict[str, Any] = {
+            "action": request_message["payload"]["action"],
+            "clientId": request_message["payload"]["clientId"],
+            "createdAt": self.get_timestamp(),
+            "deviceId": request_message["payload"]["deviceId"],
+            "message": error_message if error_message else ("OK" if success else "Request failed"),
+            "replyToken": request_message["payload"]["replyToken"],
+            "scope": "device",
+            "success": success,
+            "type": "response",
+            "value": value,
         }
 
         if "instanceId" in request_message["payload"]:
-            response_message["payload"]["instanceId"] = request_message["payload"]["instanceId"]
+            payload["instanceId"] = request_message["payload"]["instanceId"]
 
-        if self.signature:
-            self.signature.sign(response_message)
-
-        self.send_queue.push_sync(json.dumps(response_message, separators=(",", ":"), sort_keys=False))
+        if self._tracer:
+            build_start = time.time_ns()
+            message_str = self._message_builder.build(payload)
+            self._tracer.record(
+                SPAN_RESPONSE_BUILD, payload["replyToken"], build_start, device=payload["deviceId"]
+            )
+            await self.send_queue.push(
+                message_str, MessagePriority.RESPONSE, correlation_id=payload["replyToken"]
+            )
+            return
+        await self.send_queue.push(self._message_builder.build(payload), MessagePriority.RESPONSE)
 
-    def _send_error_response(self, message: dict[str, Any], error_message: str) -> None:
+    async def _send_error_response(self, message: dict[str, Any], error_message: str) -> None:
         """Send an error response."""
-        self._send_response(message, False, {"error": error_message}, error_message)
+        await self._send_response(message, False, {"error": error_message}, error_message)
 
-    def _send_invalid_signature_response(self, message: dict[str, Any]) -> None:
+    async def _send_invalid_signature_response(self, message: dict[str, Any]) -> None:
         """Send invalid signature response."""
-        self._send_error_response(message, "Invalid signature")
+        await self._send_error_response(message, "Invalid signature")
+
+    async def _start_metrics(self) -> None:
+        """Create the metrics registry and start the HTTP endpoint if configured."""
+        assert self.config is not None
+        if self.metrics is None:
+            self.metrics = MetricsRegistry()
+            self._metrics = SinricProMetrics(self.metrics)
+            self.metrics.add_collector(self._collect_metrics)
+
+        if self.config.metrics_port is not None:
+            self._metrics_server = MetricsServer(
+                self.metrics, self.config.metrics_host, self.config.metrics_port
+            )
+            await self._metrics_server.start()
+
+    def _collect_metrics(self) -> list[MetricFamily]:
+        """Read queue, connection and rate limiter state when the metrics are rendered."""
+        queue = self.send_queue.get_stats()
+        reconnects = self.websocket.get_reconnect_stats() if self.websocket else {}
+
+        scalars: list[tuple[str, str, str, float]] = [
+            ("sinricpro_devices", "gauge", "Registered devices", len(self.devices)),
+            ("sinricpro_connected", "gauge", "1 if connected to the server", self.is_connected()),
+            (
+                "sinricpro_receive_queue_messages",
+                "gauge",
+                "Received messages waiting to be handled",
+                len(self.receive_queue),
+            ),
+            ("sinricpro_send_queue_messages", "gauge", "Queued messages", queue["messages"]),
+            ("sinricpro_send_queue_bytes", "gauge", "Queued outgoing bytes", queue["bytes"]),
+            (
+                "sinricpro_send_queue_blocked_total",
+                "counter",
+                "Producers that waited for room in the send queue",
+                queue["blocked"],
+            ),
+            (
+                "sinricpro_reconnect_attempts_total",
+                "counter",
+                "Reconnect attempts",
+                reconnects.get("attempts", 0),
+            ),
+            (
+                "sinricpro_reconnects_total",
+                "counter",
+                "Successful reconnects",
+                reconnects.get("reconnects", 0),
+            ),
+            (
+                "sinricpro_last_reconnect_seconds",
+                "gauge",
+                "Duration of the last outage until the connection was restored",
+                reconnects.get("last_reconnect_ms", 0) / 1000,
+            ),
+            (
+                "sinricpro_pong_timeouts_total",
+                "counter",
+                "WebSocket pings without a pong in time",
+                reconnects.get("pong_timeouts", 0),
+            ),
+        ]
+        if self._event_budget:
+            scalars.append(
+                (
+                    "sinricpro_event_budget_waiting",
+                    "gauge",
+                    "Events waiting for the connection-wide event budget",
+                    self._event_budget.waiting,
+                )
+            )
+        families = [
+            MetricFamily(name, kind, text, [(name, {}, value)])
+            for name, kind, text, value in scalars
+        ]
+
+        lanes = "sinricpro_send_queue_lane_messages"
+        families.append(
+            MetricFamily(
+                lanes,
+                "gauge",
+                "Queued messages per priority lane",
+                [
+                    (lanes, {"lane": lane}, depth)
+                    for lane, depth in self.send_queue.get_lane_depths().items()
+                ],
+            )
+        )
+
+        dropped = "sinricpro_send_queue_dropped_total"
+        families.append(
+            MetricFamily(
+                dropped,
+                "counter",
+                "Messages dropped by the send queue overflow policy",
+                [
+                    (dropped, {"policy": policy}, queue[f"dropped_{policy}"])
+                    for policy in ("oldest", "newest", "lowest_priority")
+                ],
+            )
+        )
+
+        # Events suppressed (or deferred and then superseded) by the per-capability event limiters
+        limited_name = "sinricpro_events_rate_limited_total"
+        coalesced_name = "sinricpro_events_coalesced_total"
+        deadband_name = "sinricpro_events_deadband_total"
+        limited, coalesced, deadbanded = [], [], []
+        for device_id, device in self.devices.items():
+            for attribute, value in vars(device).items():
+                if isinstance(value, Deadband) and value.suppressed_count:
+                    deadband = attribute.strip("_").removesuffix("_deadband")
+                    labels = {"device": device_id, "deadband": deadband}
+                    deadbanded.append((deadband_name, labels, value.suppressed_count))
+                if not isinstance(value, EventLimiter):
+                    continue
+                limiter = attribute.strip("_").removesuffix("_limiter").removesuffix("_event")
+                labels = {"device": device_id, "limiter": limiter}
+                if value.limited_count:
+                    limited.append((limited_name, labels, value.limited_count))
+                if value.coalesced_count:
+                    coalesced.append((coalesced_name, labels, value.coalesced_count))
+        families.append(
+            MetricFamily(limited_name, "counter", "Events suppressed by event limiters", limited)
+        )
+        families.append(
+            MetricFamily(
+                coalesced_name,
+                "counter",
+                "Deferred events replaced by a newer value before being sent",
+                coalesced,
+            )
+        )
+        families.append(
+            MetricFamily(
+                deadband_name, "counter", "Sensor readings filtered by deadbands", deadbanded
+            )
+        )
+
+        duplicate_name = "sinricpro_events_duplicate_total"
+        duplicates = [
+            (duplicate_name, {"device": device_id}, device.get_state_shadow().suppressed_count)
+            for device_id, device in self.devices.items()
+            if device.get_state_shadow().suppressed_count
+        ]
+        families.append(
+            MetricFamily(
+                duplicate_name,
+                "counter",
+                "Events suppressed because they repeated the reported state",
+                duplicates,
+            )
+        )
+        return families
+
+    def _handle_dropped_message(self, entry: QueuedMessage) -> None:
+        """
+        Handle a message shed by the bounded send queue.
+
+        A spooled message is acknowledged, since the overflow policy dropped
+        it on purpose: the spool only replays events left unsent by a stop or
+        crash, and keeps compacting. If it was an event, the state it
+        reported is marked as unknown to the server so the next event for
+        that state is not suppressed as a duplicate or by a deadband.
+        """
+        if entry.spool_seq is not None and self._spool:
+            self._spool.ack(entry.spool_seq)
+        if entry.priority != MessagePriority.RESPONSE:
+            try:
+                payload = parse_message(entry.message)[0]["payload"]
+                device = self.devices.get(payload.get("deviceId", ""))
+                if device:
+                    device.get_state_shadow().invalidate(
+                        payload.get("action", ""), payload.get("instanceId", "")
+                    )
+                    # Report the next reading of this sensor even if it is within the deadband
+                    filters = device._event_filters(payload.get("action", ""))
+                    if filters is not None and filters[1] is not None:
+                        filters[1].reset()
+            except Exception as e:
+                SinricProLogger.error("Error handling dropped message: %s", e)
 
     async def _process_send_queue(self) -> None:
-        """Process outgoing messages."""
+        """
+        Process outgoing messages.
+
+        Each message is handed to the WebSocket writer and awaited until it has
+        been written; messages whose write fails are put back at the front of
+        the queue and retried in their original order.
+        """
         while self.is_initialized:
             try:
-                if not self.is_connected():
-                    await asyncio.sleep(0.1)
-                    continue
-
-                message_str = self.send_queue.pop_sync()
-                if message_str and self.websocket:
-                    try:
-                        self.websocket.send(message_str)
-                    except Exception as e:
-                        # If send fails, put message back in queue
-                        self.send_queue.push_sync(message_str)
-                        SinricProLogger.error(f"Failed to send message, will retry later: {e}")
+                # Block until connected, then until there is something to send
+                await self._connected_event.wait()
+                entry = await self.send_queue.get_entry()
+
+                try:
+                    if not self.websocket:
+                        raise SinricProConnectionError("WebSocket not initialized")
+                    # Wait until the writer has put the frame on the socket
+                    if self._tracer:
+                        await self._send_traced(self._tracer, entry)
+                    else:
+                        await self.websocket.send(entry.message)
+                    if entry.spool_seq is not None and self._spool:
+                        self._spool.ack(entry.spool_seq)
+                except SinricProConnectionError as e:
+                    # Put the message back at the front so it is retried first
+                    self.send_queue.requeue_sync(entry)
+                    SinricProLogger.error("Failed to send message, will retry later: %s", e)
+                    if self.is_connected():
                         await asyncio.sleep(1)
-                else:
-                    await asyncio.sleep(0.01)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                SinricProLogger.error(f"Error processing send queue: {e}")
+                SinricProLogger.error("Error processing send queue: %s", e)
+
+    async def _send_traced(self, tracer: Tracer, entry: QueuedMessage) -> None:
+        """Write a queued message, reporting its send stages to the tracer."""
+        assert self.websocket is not None
+        kind = "response" if entry.priority == MessagePriority.RESPONSE else "event"
+        tracer.record(SPAN_SEND_QUEUE, entry.correlation_id, entry.enqueued_ns, kind=kind)
+        span = tracer.start(SPAN_SEND_WRITE, entry.correlation_id, kind=kind, bytes=entry.size)
+        try:
+            await self.websocket.send(entry.message)
+        except BaseException as e:
+            tracer.end(span, e)
+            raise
+        tracer.end(span)
@@ -6,8 +6,18 @@ Abstract base class for all SinricPro device types.
 
 import time
 from abc import ABC
-from typing import Any, TYPE_CHECKING
-
+from functools import partial
+from typing import Any, ClassVar, TYPE_CHECKING
+
+from sinricpro.core.action_dispatch import (
+    CompiledAction,
+    EventSpec,
+    compile_actions,
+    compile_events,
+)
+from sinricpro.core.deadband import Deadband
+from sinricpro.core.event_limiter import EventLimiter
+from sinricpro.core.state_shadow import EVENT_ONLY_ACTIONS, TELEMETRY_ACTIONS, StateShadow
 from sinricpro.core.types import SinricProRequest, RequestHandler
 from sinricpro.utils.logger import SinricProLogger
 
@@ -21,8 +31,30 @@ class SinricProDevice(ABC):
 
     Provides common functionality for device communication,
     request handling, and event sending.
+
+    Requests are routed by a per-class action table compiled from the
+    `_actions` declarations of the capability mixins when the class is
+    created, so device classes need no dispatch code of their own.
+
+    The device's last known state is kept in a state shadow, updated by
+    successful requests and sent events (see get_state()). Events repeating
+    the state the server last received are suppressed unless the client is
+    configured with suppress_duplicate_events=False; sensor readings are
+    always sent (use a Deadband to filter them).
+
+    Events rate limited by a capability's event limiter are dropped, unless
+    event coalescing is enabled (see set_event_coalescing()).
     """
 
+    _action_table: ClassVar[dict[str, CompiledAction]] = {}
+    _event_table: ClassVar[dict[str, EventSpec]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the action and event tables of a new device class."""
+        super().__init_subclass__(**kwargs)
+        cls._action_table = compile_actions(cls)
+        cls._event_table = compile_events(cls)
+
     def __init__(self, device_id: str, product_type: str, **kwargs: Any) -> None:
         """
         Initialize a SinricPro device.
@@ -37,6 +69,8 @@ class SinricProDevice(ABC):
         self._product_type = product_type
         self._sinric_pro: "SinricPro | None" = None
         self._request_handlers: list[RequestHandler] = []
+        self._state_shadow = StateShadow()
+        self._event_coalescing = False
 
     def get_device_id(self) -> str:
         """
@@ -56,6 +90,70 @@ class SinricProDevice(ABC):
         """
         return self._product_type
 
+    def get_sinric_pro(self) -> "SinricPro | None":
+        """
+        Get the SinricPro client this device was added to.
+
+        Returns:
+            The SinricPro instance, or None if the device was not added yet
+        """
+        return self._sinric_pro
+
+    def get_state(self, action: str, instance_id: str = "") -> dict[str, Any] | None:
+        """
+        Get the last known value of a state, without touching the hardware.
+
+        States are keyed by the action reporting them and hold the value of
+        the last successful request or sent event. Relative requests (such
+        as adjustBrightness) make the state unknown until the next absolute
+        value is reported.
+
+        Args:
+            action: Action reporting the state (e.g. "setPowerState")
+            instance_id: Instance ID for multi-instance capabilities
+
+        Returns:
+            The state value (do not modify it), or None if unknown
+
+        Example:
+            >>> device.get_state("setPowerState")
+            {'state': 'On'}
+            >>> device.get_state("setRangeValue", "fan_speed")
+            {'rangeValue': 3}
+        """
+        return self._state_shadow.get(action, instance_id)
+
+    def get_state_shadow(self) -> StateShadow:
+        """
+        Get the state shadow of this device.
+
+        Returns:
+            The device's StateShadow
+        """
+        return self._state_shadow
+
+    def set_event_coalescing(self, enabled: bool) -> None:
+        """
+        Defer rate-limited events instead of dropping them.
+
+        With coalescing enabled, an event rate limited by its capability's
+        event limiter is held as the pending latest value of its state
+        (per action and instance ID) and sent when the limiter's window
+        reopens. A slider reporting many values per second then ends with
+        the final value on the server, at no more than the limiter's rate.
+        Events reporting occurrences (doorbell presses, notifications,
+        media controls) are still dropped.
+
+        Args:
+            enabled: True to coalesce rate-limited events, False to drop them
+
+        Example:
+            >>> light.set_event_coalescing(True)
+            >>> for brightness in range(0, 101, 5):
+            ...     await light.send_brightness_event(brightness)  # 100 is sent last
+        """
+        self._event_coalescing = enabled
+
     def set_sinric_pro(self, sinric_pro: "SinricPro") -> None:
         """
         Set the parent SinricPro instance.
@@ -79,9 +177,25 @@ class SinricProDevice(ABC):
         """
         self._request_handlers.append(handler)
 
+    def supports_action(self, action: str) -> bool:
+        """
+        Check whether the device's capabilities handle an action.
+
+        Args:
+            action: The action name (e.g., "setPowerState")
+
+        Returns:
+            True if a capability of this device handles the action
+        """
+        return action in self._action_table
+
     async def handle_request(self, request: SinricProRequest) -> bool:
         """
-        Handle an incoming request by calling all registered handlers.
+        Handle an incoming request.
+
+        The action is looked up in the class's action table and passed to the
+        capability handler. Actions no capability declares are handed to the
+        registered request handlers, or rejected if there are none.
 
         Args:
             request: The request to handle
@@ -89,6 +203,27 @@ class SinricProDevice(ABC):
         Returns:
             True if request was handled successfully, False otherwise
         """
+        action = self._action_table.get(request.action)
+        if action is not None:
+            try:
+                success, response_value = await action.handler(
+                    self, *action.extract(request), self
+                )
+            except Exception as e:
+                SinricProLogger.error("Error handling %s request: %s", request.action, e)
+                return False
+            request.response_value = response_value
+            if success and action.state is not None:
+                if action.relative:
+                    self._state_shadow.forget(action.state, request.instance)
+                else:
+                    self._state_shadow.update(action.state, response_value, request.instance)
+            return success
+
+        if not self._request_handlers:
+            request.error_message = f"Missing callback function: {request.action}"
+            return False
+
         try:
             for handler in self._request_handlers:
                 success = await handler(request.__dict__)
@@ -96,7 +231,7 @@ class SinricProDevice(ABC):
                     return False
             return True
         except Exception as e:
-            SinricProLogger.error(f"Error handling request: {e}")
+            SinricProLogger.error("Error handling request: %s", e)
             return False
 
     async def send_event(
@@ -105,6 +240,8 @@ class SinricProDevice(ABC):
         value: dict[str, Any],
         cause: str = "PHYSICAL_INTERACTION",
         instance_id: str = "",
+        limiter: EventLimiter | None = None,
+        deadband: Deadband | None = None,
     ) -> bool:
         """
         Send an event to SinricPro.
@@ -114,9 +251,15 @@ class SinricProDevice(ABC):
             value: Event data
             cause: Cause of the event (PHYSICAL_INTERACTION or APP_INTERACTION)
             instance_id: Optional instance ID for multi-instance capabilities
+            limiter: Event limiter of the capability sending the event
+            deadband: Deadband of the capability sending the event; it is
+                applied before the limiter and replaces the duplicate check
 
         Returns:
-            True if event was sent successfully, False if rate limited
+            True if event was queued successfully (or deferred by event
+            coalescing, or suppressed because it repeats the state the server
+            last received or is within the deadband), False otherwise (e.g.
+            rate limited)
 
         Example:
             >>> await device.send_event("setPowerState", {"state": "On"})
@@ -126,33 +269,125 @@ class SinricProDevice(ABC):
             SinricProLogger.error("Device not added to SinricPro instance")
             return False
 
-        payload: dict[str, Any] = {
-            "action": action,
-            "cause": {"type": cause},
-            "createdAt": self._sinric_pro.get_timestamp(),
-            "deviceId": self._device_id,
-            "type": "event",
-            "value": value,
-        }
-
-        # Include instanceId if provided
-        if instance_id:
-            payload["instanceId"] = instance_id
+        instance_id = instance_id or ""
+        admitted = self._admit_event(action, value, cause, instance_id, limiter, deadband)
+        if admitted is not None:
+            return admitted
 
         message = {
             "header": {
                 "payloadVersion": 2,
                 "signatureVersion": 1,
             },
-            "payload": payload,
+            "payload": self._event_payload(
+                action, value, cause, instance_id, self._sinric_pro.get_timestamp()
+            ),
         }
 
         try:
-            await self._sinric_pro.send_message(message)
-            return True
+            queued = await self._sinric_pro.send_message(message)
         except Exception as e:
-            SinricProLogger.error(f"Failed to send event: {e}")
+            SinricProLogger.error("Failed to send event: %s", e)
             return False
+        if queued:
+            self._event_queued(action, value, instance_id, deadband)
+        return queued
+
+    def _event_filters(self, action: str) -> tuple[EventLimiter | None, Deadband | None] | None:
+        """Get the limiter and deadband declared for an event (None: not declared)."""
+        spec = self._event_table.get(action)
+        if spec is None:
+            return None
+        limiter = getattr(self, spec.limiter) if spec.limiter else None
+        deadband = getattr(self, spec.deadband) if spec.deadband else None
+        return limiter, deadband
+
+    def _admit_event(
+        self,
+        action: str,
+        value: dict[str, Any],
+        cause: str,
+        instance_id: str,
+        limiter: EventLimiter | None,
+        deadband: Deadband | None,
+    ) -> bool | None:
+        """
+        Apply the deadband, duplicate suppression and rate limiting to an event.
+
+        Returns:
+            None if the event should be sent, else the result of send_event()
+            for an event that was suppressed, deferred or rate limited
+        """
+        shadowed = action not in EVENT_ONLY_ACTIONS
+        if limiter is not None:
+            # A newer value supersedes the deferred one
+            limiter.discard((action, instance_id))
+
+        if deadband is not None:
+            # The deadband decides which readings are redundant and when a heartbeat is due
+            if not deadband.should_report(value):
+                SinricProLogger.debug("%s event within deadband", action, device=self._device_id)
+                return True
+        elif (
+            shadowed
+            and action not in TELEMETRY_ACTIONS
+            and self._state_shadow.is_reported(action, value, instance_id)
+        ):
+            config = self._sinric_pro.config if self._sinric_pro else None
+            if config is None or config.suppress_duplicate_events:
+                self._state_shadow.suppressed_count += 1
+                SinricProLogger.debug(
+                    "Duplicate %s event suppressed", action, device=self._device_id
+                )
+                return True
+
+        if limiter is not None and limiter.is_limited():
+            if self._event_coalescing and shadowed:
+                limiter.defer(
+                    (action, instance_id),
+                    partial(self.send_event, action, value, cause, instance_id),
+                )
+                SinricProLogger.debug("%s event deferred", action, device=self._device_id)
+                if deadband is not None:
+                    deadband.update(value)
+                return True
+            SinricProLogger.warn("%s event rate limited", action, device=self._device_id)
+            return False
+        return None
+
+    def _event_payload(
+        self, action: str, value: dict[str, Any], cause: str, instance_id: str, created_at: int
+    ) -> dict[str, Any]:
+        """Build the payload of an event message."""
+        spec = self._event_table.get(action)
+        if spec is not None and spec.meter:
+            # Metered readings carry the energy consumed since the last queued one
+            value = getattr(self, spec.meter).stamp(value, created_at)
+        payload: dict[str, Any] = {
+            "action": action,
+            "cause": {"type": cause},
+            "createdAt": created_at,
+            "deviceId": self._device_id,
+            "type": "event",
+            "value": value,
+        }
+
+        # Include instanceId if provided
+        if instance_id:
+            payload["instanceId"] = instance_id
+        return payload
+
+    def _event_queued(
+        self, action: str, value: dict[str, Any], instance_id: str, deadband: Deadband | None
+    ) -> None:
+        """Record a queued event in the state shadow, deadband and energy meter."""
+        if action not in EVENT_ONLY_ACTIONS:
+            self._state_shadow.update(action, value, instance_id)
+        if deadband is not None:
+            deadband.update(value)
+        spec = self._event_table.get(action)
+        if spec is not None and spec.meter:
+            getattr(self, spec.meter).commit()
 
     def generate_message_id(self) -> str:
         """
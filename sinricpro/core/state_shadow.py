@@ -0,0 +1,135 @@
+"""
+State Shadow
+
+Last known state of a device, kept by the SDK so applications can query it
+locally and redundant events can be suppressed.
+
+States are keyed by the action that reports them (e.g. "setPowerState") and
+the instance ID, and hold the value last confirmed in a request response or
+sent in an event. Each state also remembers whether that value has reached
+the server; after a disconnect or a dropped event it may not have, so the
+next event is sent even if it repeats the value.
+"""
+
+from typing import Any
+
+from sinricpro.core.actions import (
+    ACTION_AIR_QUALITY,
+    ACTION_CURRENT_TEMPERATURE,
+    ACTION_DOORBELL_PRESS,
+    ACTION_MEDIA_CONTROL,
+    ACTION_POWER_USAGE,
+    ACTION_PUSH_NOTIFICATION,
+)
+
+# Events reporting an occurrence rather than a state; never shadowed or suppressed
+EVENT_ONLY_ACTIONS = frozenset(
+    {ACTION_DOORBELL_PRESS, ACTION_MEDIA_CONTROL, ACTION_PUSH_NOTIFICATION}
+)
+
+# Periodic sensor readings; shadowed, but never suppressed as duplicates since a
+# repeated reading tells the server the sensor is alive (filter with a Deadband)
+TELEMETRY_ACTIONS = frozenset({ACTION_CURRENT_TEMPERATURE, ACTION_AIR_QUALITY, ACTION_POWER_USAGE})
+
+StateKey = tuple[str, str]  # (action, instance ID)
+
+
+class StateShadow:
+    """
+    Last known state of one device.
+
+    Example:
+        >>> shadow = StateShadow()
+        >>> shadow.update("setPowerState", {"state": "On"})
+        >>> shadow.get("setPowerState")
+        {'state': 'On'}
+        >>> shadow.is_reported("setPowerState", {"state": "On"})
+        True
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty shadow."""
+        self._values: dict[StateKey, dict[str, Any]] = {}
+        self._reported: set[StateKey] = set()
+        self.suppressed_count = 0  # Duplicate events suppressed so far (exported as a metric)
+
+    def get(self, action: str, instance_id: str = "") -> dict[str, Any] | None:
+        """
+        Get the last known value of a state.
+
+        Args:
+            action: Action reporting the state (e.g. "setPowerState")
+            instance_id: Instance ID for multi-instance capabilities
+
+        Returns:
+            The state value (do not modify it), or None if unknown
+        """
+        return self._values.get((action, instance_id))
+
+    def get_all(self) -> dict[StateKey, dict[str, Any]]:
+        """
+        Get all known states.
+
+        Returns:
+            Dict mapping (action, instance ID) to a copy of the state value
+        """
+        return {key: dict(value) for key, value in self._values.items()}
+
+    def update(
+        self, action: str, value: dict[str, Any], instance_id: str = "", reported: bool = True
+    ) -> None:
+        """
+        Record the value of a state.
+
+        Args:
+            action: Action reporting the state
+            value: The state value
+            instance_id: Instance ID for multi-instance capabilities
+            reported: Whether the value was sent to the server
+        """
+        key = (action, instance_id)
+        self._values[key] = dict(value)
+        if reported:
+            self._reported.add(key)
+        else:
+            self._reported.discard(key)
+
+    def forget(self, action: str, instance_id: str = "") -> None:
+        """
+        Forget a state whose value is no longer known.
+
+        Args:
+            action: Action reporting the state
+            instance_id: Instance ID for multi-instance capabilities
+        """
+        key = (action, instance_id)
+        self._values.pop(key, None)
+        self._reported.discard(key)
+
+    def is_reported(self, action: str, value: dict[str, Any], instance_id: str = "") -> bool:
+        """
+        Check whether a value is the one the server last received for a state.
+
+        Args:
+            action: Action reporting the state
+            value: The state value
+            instance_id: Instance ID for multi-instance capabilities
+
+        Returns:
+            True if an event with this value would be redundant
+        """
+        key = (action, instance_id)
+        return key in self._reported and self._values.get(key) == value
+
+    def invalidate(self, action: str | None = None, instance_id: str = "") -> None:
+        """
+        Mark states as possibly not known to the server (their values are kept).
+
+        Args:
+            action: State to invalidate (None: all states)
+            instance_id: Instance ID of the state
+        """
+        if action is None:
+            self._reported.clear()
+        else:
+            self._reported.discard((action, instance_id))
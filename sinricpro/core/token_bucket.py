@@ -0,0 +1,117 @@
+"""
+Token Bucket
+
+Connection-wide event budget shared by all devices of a SinricPro client.
+
+The per-capability event limiters bound how often one device reports one
+state, but a gateway with hundreds of devices can still send hundreds of
+events in the same second. The token bucket bounds the aggregate rate: up to
+`burst` events pass at once, then `rate` events per second. Devices waiting
+for a token are served round-robin, so one chatty device cannot starve the
+others.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Hashable
+
+
+class TokenBucket:
+    """
+    Token bucket granting tokens fairly across keys (e.g. device IDs).
+
+    Waiters are queued per key; when tokens become available the keys take
+    turns, one token per turn, each key's waiters in FIFO order.
+
+    Example:
+        >>> bucket = TokenBucket(rate=10, burst=20)
+        >>> waited = await bucket.acquire(device_id)  # seconds spent waiting
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second (sustained rate)
+            burst: Bucket capacity (tokens available at once)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: dict[Hashable, deque[asyncio.Future[None]]] = {}
+        self._grant_task: asyncio.Task[None] | None = None
+        self.delayed_count = 0  # Acquisitions that had to wait
+        self.wait_seconds = 0.0  # Total time spent waiting
+
+    @property
+    def waiting(self) -> int:
+        """Number of acquisitions waiting for a token."""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, key: Hashable = None) -> float:
+        """
+        Take one token, waiting for it if the bucket is empty.
+
+        Args:
+            key: Fairness key of the caller (e.g. device ID)
+
+        Returns:
+            Seconds spent waiting (0.0 if a token was available)
+        """
+        # Fast path: tokens available and nobody queued ahead
+        if not self._waiters:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        future: asyncio.Future[None] = loop.create_future()
+        self._waiters.setdefault(key, deque()).append(future)
+        if self._grant_task is None:
+            self._grant_task = loop.create_task(self._grant())
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted but not used: give the token back
+                self._tokens = min(self.burst, self._tokens + 1)
+            raise
+
+        waited = time.monotonic() - start
+        self.delayed_count += 1
+        self.wait_seconds += waited
+        return waited
+
+    async def _grant(self) -> None:
+        """Hand out tokens to the waiters as they accrue, round-robin by key."""
+        try:
+            while self._waiters:
+                self._refill()
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    continue
+
+                # Serve the first key, then move it to the end of the rotation
+                key = next(iter(self._waiters))
+                waiters = self._waiters.pop(key)
+                future = waiters.popleft()
+                if waiters:
+                    self._waiters[key] = waiters
+                if future.done():  # the waiter was cancelled
+                    continue
+                self._tokens -= 1
+                future.set_result(None)
+        finally:
+            self._grant_task = None
@@ -0,0 +1,249 @@
+"""
+Tracing
+
+Pluggable tracing hooks for the message path.
+
+SinricPro reports one span per stage of every request, correlated by the
+request's replyToken, so the time between receiving a request and writing
+its response can be attributed to each stage:
+
+    receive.queue     waiting in the receive queue
+    receive.parse     JSON parsing
+    receive.validate  signature validation
+    dispatch.queue    waiting for the device's request worker
+    request.handle    device handle_request, including the user callback
+    response.build    building and signing the response
+    send.queue        waiting in the send queue
+    send.write        writing the frame to the WebSocket
+
+Spans of events only cover the send stages and carry no correlation ID.
+Without a tracer none of this is recorded.
+"""
+
+import time
+from typing import Any, Callable
+
+# Span names
+SPAN_RECEIVE_QUEUE = "receive.queue"
+SPAN_RECEIVE_PARSE = "receive.parse"
+SPAN_RECEIVE_VALIDATE = "receive.validate"
+SPAN_DISPATCH_QUEUE = "dispatch.queue"
+SPAN_REQUEST_HANDLE = "request.handle"
+SPAN_RESPONSE_BUILD = "response.build"
+SPAN_SEND_QUEUE = "send.queue"
+SPAN_SEND_WRITE = "send.write"
+
+
+class Span:
+    """
+    One traced stage.
+
+    Timestamps are nanoseconds since the epoch (time.time_ns()).
+
+    Attributes:
+        name: Stage name (one of the SPAN_* constants)
+        correlation_id: replyToken of the request (None for events)
+        attributes: Additional attributes (device ID, action, ...)
+        start_ns: Start of the stage
+        end_ns: End of the stage (0 until ended)
+        error: Exception raised by the stage, if any
+        context: Free slot for tracer implementations
+    """
+
+    __slots__ = ("name", "correlation_id", "attributes", "start_ns", "end_ns", "error", "context")
+
+    def __init__(
+        self,
+        name: str,
+        correlation_id: str | None = None,
+        attributes: dict[str, Any] | None = None,
+        start_ns: int | None = None,
+    ) -> None:
+        """
+        Initialize a span.
+
+        Args:
+            name: Stage name
+            correlation_id: replyToken of the request
+            attributes: Additional attributes
+            start_ns: Start time (default: now)
+        """
+        self.name = name
+        self.correlation_id = correlation_id
+        self.attributes = attributes or {}
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns = 0
+        self.error: BaseException | None = None
+        self.context: Any = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration of the stage in milliseconds (0 until ended)."""
+        return (self.end_ns - self.start_ns) / 1e6 if self.end_ns else 0.0
+
+    def __repr__(self) -> str:
+        """Describe the span."""
+        return f"Span({self.name!r}, {self.correlation_id!r}, {self.duration_ms:.3f}ms)"
+
+
+class Tracer:
+    """
+    Base class of tracers; override on_start() and/or on_end().
+
+    Hooks run synchronously on the message path, so they should be quick.
+
+    Example:
+        >>> class PrintTracer(Tracer):
+        ...     def on_end(self, span: Span) -> None:
+        ...         print(span.name, span.correlation_id, span.duration_ms)
+        >>> sinric_pro.set_tracer(PrintTracer())
+    """
+
+    def on_start(self, span: Span) -> None:
+        """Called when a stage starts."""
+
+    def on_end(self, span: Span) -> None:
+        """Called when a stage ends."""
+
+    def start(
+        self,
+        name: str,
+        correlation_id: str | None = None,
+        start_ns: int | None = None,
+        **attributes: Any,
+    ) -> Span:
+        """
+        Start a span.
+
+        Args:
+            name: Stage name
+            correlation_id: replyToken of the request
+            start_ns: Start time (default: now)
+            **attributes: Additional attributes
+
+        Returns:
+            The started span
+        """
+        span = Span(name, correlation_id, attributes, start_ns)
+        self.on_start(span)
+        return span
+
+    def end(self, span: Span, error: BaseException | None = None) -> None:
+        """
+        End a span now.
+
+        Args:
+            span: Span returned by start()
+            error: Exception raised by the stage, if any
+        """
+        span.end_ns = time.time_ns()
+        span.error = error
+        self.on_end(span)
+
+    def record(
+        self,
+        name: str,
+        correlation_id: str | None,
+        start_ns: int,
+        **attributes: Any,
+    ) -> None:
+        """
+        Report a stage that started at start_ns and ends now.
+
+        Args:
+            name: Stage name
+            correlation_id: replyToken of the request
+            start_ns: Start time
+            **attributes: Additional attributes
+        """
+        self.end(self.start(name, correlation_id, start_ns, **attributes))
+
+
+class CallbackTracer(Tracer):
+    """
+    Tracer calling plain functions.
+
+    Example:
+        >>> sinric_pro.set_tracer(CallbackTracer(on_end=lambda span: print(span)))
+    """
+
+    def __init__(
+        self,
+        on_start: Callable[[Span], None] | None = None,
+        on_end: Callable[[Span], None] | None = None,
+    ) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            on_start: Called with every started span
+            on_end: Called with every ended span
+        """
+        self._on_start = on_start
+        self._on_end = on_end
+
+    def on_start(self, span: Span) -> None:
+        """Called when a stage starts."""
+        if self._on_start:
+            self._on_start(span)
+
+    def on_end(self, span: Span) -> None:
+        """Called when a stage ends."""
+        if self._on_end:
+            self._on_end(span)
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Tracer exporting the stages as OpenTelemetry spans.
+
+    Requires the opentelemetry-api package (pip install "sinricpro[tracing]")
+    and a configured tracer provider. The replyToken is set as the
+    "sinricpro.reply_token" attribute. While request.handle is active its
+    span is the current span, so spans created in device callbacks become
+    its children.
+
+    Example:
+        >>> sinric_pro.set_tracer(OpenTelemetryTracer())
+    """
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            tracer_provider: OpenTelemetry tracer provider (default: the global one)
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed
+        """
+        try:
+            from opentelemetry import context, trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetryTracer requires opentelemetry-api (pip install opentelemetry-api)"
+            ) from None
+
+        self._context = context
+        self._trace = trace
+        self._tracer = trace.get_tracer("sinricpro", tracer_provider=tracer_provider)
+
+    def on_start(self, span: Span) -> None:
+        """Start the OpenTelemetry span and make it current."""
+        attributes = {f"sinricpro.{key}": value for key, value in span.attributes.items()}
+        if span.correlation_id:
+            attributes["sinricpro.reply_token"] = span.correlation_id
+        otel_span = self._tracer.start_span(
+            f"sinricpro.{span.name}", attributes=attributes, start_time=span.start_ns
+        )
+        token = self._context.attach(self._trace.set_span_in_context(otel_span))
+        span.context = (otel_span, token)
+
+    def on_end(self, span: Span) -> None:
+        """End the OpenTelemetry span."""
+        otel_span, token = span.context
+        self._context.detach(token)
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        otel_span.end(end_time=span.end_ns)
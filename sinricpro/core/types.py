@@ -5,10 +5,16 @@ Common types, protocols, and constants used throughout the SDK.
 """
 
 from dataclasses import dataclass, field
-from typing import Protocol, Any, Callable, Awaitable
+from typing import Protocol, Any, Callable, Awaitable, NamedTuple, TYPE_CHECKING
 import re
 
+from sinricpro.core.codec import CODEC_AUTO, CODEC_JSON, CODEC_ORJSON, orjson_available
 from sinricpro.core.exceptions import SinricProConfigurationError
+from sinricpro.core.event_spool import FsyncPolicy
+from sinricpro.core.message_queue import OverflowPolicy, SchedulingPolicy
+
+if TYPE_CHECKING:
+    from sinricpro.core.sinric_pro_device import SinricProDevice
 
 # Constants
 SINRICPRO_SERVER_URL = "ws.sinric.pro"
@@ -17,6 +23,8 @@ SINRICPRO_SERVER_SSL_PORT = 443
 WEBSOCKET_PING_INTERVAL = 300000  # 5 minutes in milliseconds
 WEBSOCKET_PING_TIMEOUT = 10000  # 10 seconds in milliseconds
 WEBSOCKET_PONG_MISS_MAX = 3  # Close connection after this many consecutive missed pongs
+WEBSOCKET_RECONNECT_DELAY_MIN = 1000  # Backoff base for the first reconnect attempt in milliseconds
+WEBSOCKET_RECONNECT_DELAY_MAX = 60000  # Backoff cap in milliseconds
 EVENT_LIMIT_STATE = 1000  # 1 second in milliseconds
 EVENT_LIMIT_SENSOR_VALUE = 60000  # 60 seconds in milliseconds
 
@@ -46,19 +54,66 @@ class SinricProConfig:
         app_key: SinricPro app key (UUID format)
         app_secret: SinricPro app secret (min 32 characters)
         server_url: WebSocket server URL (default: ws.sinric.pro)
+        server_port: WebSocket server port (None: 443 with SSL, 80 without)
+        use_ssl: Connect with TLS (wss://); disable for local test servers
         debug: Enable debug logging
+        send_queue_max_messages: Maximum number of queued outgoing messages (None: unbounded)
+        send_queue_max_bytes: Maximum total size of queued outgoing messages (None: unbounded)
+        send_queue_overflow_policy: What to do when the send queue is full
+            ("block", "drop_oldest", "drop_newest" or "drop_lowest_priority")
+        send_queue_scheduling: How the send queue orders its priority lanes (responses, state
+            events, sensor telemetry, notifications): "strict" always sends the highest
+            non-empty lane first, "weighted" shares sends between lanes 8:4:2:1
+        max_concurrent_requests: Maximum number of requests handled concurrently. Requests
+            for the same device are always handled one at a time, in arrival order.
+        spool_dir: Directory for the durable event spool (None: events are kept in memory only).
+            Unsent events are replayed from the spool after a restart.
+        spool_fsync_policy: When the spool fsyncs appended events ("always", "interval", "never")
+        json_codec: JSON codec for the message path ("auto": orjson if installed, "orjson",
+            "json"). Signatures are identical with every codec.
+        metrics_enabled: Collect metrics (see SinricPro.metrics); off by default
+        metrics_port: Serve the metrics in Prometheus text format on this port
+            (None: no HTTP endpoint; requires metrics_enabled)
+        metrics_host: Interface the metrics endpoint listens on
+        suppress_duplicate_events: Skip device events repeating the state the server last
+            received (see SinricProDevice.get_state()); sensor readings are always sent
+        event_rate_limit: Maximum sustained rate of events per second across all devices
+            (None: unlimited). Devices waiting for the budget are served round-robin.
+        event_burst: Events that may be sent at once before event_rate_limit applies
     """
 
     app_key: str
     app_secret: str
     server_url: str = SINRICPRO_SERVER_URL
+    server_port: int | None = None
+    use_ssl: bool = True
     debug: bool = False
+    send_queue_max_messages: int | None = None
+    send_queue_max_bytes: int | None = None
+    send_queue_overflow_policy: OverflowPolicy | str = OverflowPolicy.BLOCK
+    send_queue_scheduling: SchedulingPolicy | str = SchedulingPolicy.STRICT
+    max_concurrent_requests: int = 8
+    spool_dir: str | None = None
+    spool_fsync_policy: FsyncPolicy | str = FsyncPolicy.INTERVAL
+    json_codec: str = CODEC_AUTO
+    metrics_enabled: bool = False
+    metrics_port: int | None = None
+    metrics_host: str = "127.0.0.1"
+    suppress_duplicate_events: bool = True
+    event_rate_limit: float | None = None
+    event_burst: int = 10
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         self._validate_app_key()
         self._validate_app_secret()
         self._validate_server_url()
+        self._validate_send_queue()
+        self._validate_max_concurrent_requests()
+        self._validate_spool()
+        self._validate_json_codec()
+        self._validate_metrics()
+        self._validate_event_budget()
 
     def _validate_app_key(self) -> None:
         """Validate app_key format (UUID)."""
@@ -83,13 +138,88 @@ class SinricProConfig:
             )
 
     def _validate_server_url(self) -> None:
-        """Validate server_url format."""
+        """Validate server_url format and port."""
         if not self.server_url or not isinstance(self.server_url, str):
             raise SinricProConfigurationError("server_url must be a non-empty string")
 
         if not self.server_url.strip():
             raise SinricProConfigurationError("server_url must be a non-empty string")
 
+        if self.server_port is not None and (
+            not isinstance(self.server_port, int) or not 0 < self.server_port < 65536
+        ):
+            raise SinricProConfigurationError("server_port must be between 1 and 65535 or None")
+
+    def _validate_send_queue(self) -> None:
+        """Validate send queue limits, overflow policy and scheduling."""
+        for name in ("send_queue_max_messages", "send_queue_max_bytes"):
+            limit = getattr(self, name)
+            if limit is not None and (not isinstance(limit, int) or limit <= 0):
+                raise SinricProConfigurationError(f"{name} must be a positive integer or None")
+
+        try:
+            self.send_queue_overflow_policy = OverflowPolicy(self.send_queue_overflow_policy)
+        except ValueError:
+            valid = ", ".join(policy.value for policy in OverflowPolicy)
+            raise SinricProConfigurationError(
+                f"Invalid send_queue_overflow_policy. Expected one of: {valid}"
+            ) from None
+
+        try:
+            self.send_queue_scheduling = SchedulingPolicy(self.send_queue_scheduling)
+        except ValueError:
+            valid = ", ".join(policy.value for policy in SchedulingPolicy)
+            raise SinricProConfigurationError(
+                f"Invalid send_queue_scheduling. Expected one of: {valid}"
+            ) from None
+
+    def _validate_max_concurrent_requests(self) -> None:
+        """Validate the request concurrency limit."""
+        if not isinstance(self.max_concurrent_requests, int) or self.max_concurrent_requests < 1:
+            raise SinricProConfigurationError("max_concurrent_requests must be a positive integer")
+
+    def _validate_spool(self) -> None:
+        """Validate event spool settings."""
+        if self.spool_dir is not None and (not isinstance(self.spool_dir, str) or not self.spool_dir):
+            raise SinricProConfigurationError("spool_dir must be a non-empty string or None")
+
+        try:
+            self.spool_fsync_policy = FsyncPolicy(self.spool_fsync_policy)
+        except ValueError:
+            valid = ", ".join(policy.value for policy in FsyncPolicy)
+            raise SinricProConfigurationError(
+                f"Invalid spool_fsync_policy. Expected one of: {valid}"
+            ) from None
+
+    def _validate_json_codec(self) -> None:
+        """Validate the JSON codec selection."""
+        if self.json_codec not in (CODEC_AUTO, CODEC_ORJSON, CODEC_JSON):
+            raise SinricProConfigurationError(
+                f"Invalid json_codec. Expected one of: {CODEC_AUTO}, {CODEC_ORJSON}, {CODEC_JSON}"
+            )
+        if self.json_codec == CODEC_ORJSON and not orjson_available():
+            raise SinricProConfigurationError(
+                "json_codec 'orjson' requires the orjson package (pip install orjson)"
+            )
+
+    def _validate_metrics(self) -> None:
+        """Validate the metrics endpoint settings."""
+        if self.metrics_port is None:
+            return
+        if not isinstance(self.metrics_port, int) or not 0 <= self.metrics_port < 65536:
+            raise SinricProConfigurationError("metrics_port must be between 0 and 65535 or None")
+        if not self.metrics_enabled:
+            raise SinricProConfigurationError("metrics_port requires metrics_enabled=True")
+
+    def _validate_event_budget(self) -> None:
+        """Validate the connection-wide event rate limit."""
+        if self.event_rate_limit is not None and (
+            not isinstance(self.event_rate_limit, (int, float)) or self.event_rate_limit <= 0
+        ):
+            raise SinricProConfigurationError("event_rate_limit must be a positive number or None")
+        if not isinstance(self.event_burst, int) or self.event_burst < 1:
+            raise SinricProConfigurationError("event_burst must be a positive integer")
+
 
 @dataclass
 class SinricProRequest:
@@ -127,10 +257,32 @@ class SinricProMessage:
     signature: dict[str, str] = field(default_factory=dict)
 
 
+class BulkEvent(NamedTuple):
+    """
+    One event of a bulk submission (see SinricPro.send_events_bulk()).
+
+    Plain tuples of the same fields are accepted too; the trailing fields
+    may be omitted.
+
+    Attributes:
+        device: The device, or its device ID
+        action: Event action (e.g. "setPowerState")
+        value: Event value (e.g. {"state": "On"})
+        instance_id: Instance ID for multi-instance capabilities
+        cause: Cause of the event (PHYSICAL_INTERACTION or APP_INTERACTION)
+    """
+
+    device: "SinricProDevice | str"
+    action: str
+    value: dict[str, Any]
+    instance_id: str = ""
+    cause: str = PHYSICAL_INTERACTION
+
+
 class ISinricPro(Protocol):
     """Protocol defining the SinricPro interface for devices."""
 
-    async def send_message(self, message: dict[str, Any]) -> None:
+    async def send_message(self, message: dict[str, Any]) -> bool:
         """Send a message to SinricPro."""
         ...
 
@@ -6,15 +6,20 @@ and heartbeat monitoring.
 """
 
 import asyncio
+import functools
+import random
 import time
 import uuid
-from typing import Callable
+from collections import deque
+from typing import TYPE_CHECKING, Callable
 
-import websockets
+if TYPE_CHECKING:
+    from websockets.asyncio.client import ClientConnection
 
 
+@functools.cache
 def get_mac_address() -> str:
-    """Get the MAC address of this machine.
+    """Get the MAC address of this machine (computed once per process).
 
     Returns:
         MAC address string in format XX:XX:XX:XX:XX:XX
@@ -24,15 +29,16 @@ def get_mac_address() -> str:
     return ":".join(f"{(mac >> (8 * i)) & 0xFF:02X}" for i in range(5, -1, -1))
 
 
-from websockets.client import WebSocketClientProtocol
-
 from sinricpro import __version__
 from sinricpro.core.exceptions import SinricProConnectionError, SinricProTimeoutError
 from sinricpro.core.types import (
+    SINRICPRO_SERVER_PORT,
     SINRICPRO_SERVER_SSL_PORT,
     WEBSOCKET_PING_INTERVAL,
     WEBSOCKET_PING_TIMEOUT,
     WEBSOCKET_PONG_MISS_MAX,
+    WEBSOCKET_RECONNECT_DELAY_MAX,
+    WEBSOCKET_RECONNECT_DELAY_MIN,
 )
 from sinricpro.utils.logger import SinricProLogger
 
@@ -47,12 +53,22 @@ class WebSocketConfig:
         device_ids: list[str],
         platform: str = "Python",
         sdk_version: str | None = None,
+        reconnect_delay_min: int = WEBSOCKET_RECONNECT_DELAY_MIN,
+        reconnect_delay_max: int = WEBSOCKET_RECONNECT_DELAY_MAX,
+        server_port: int | None = None,
+        use_ssl: bool = True,
     ) -> None:
         self.server_url = server_url
+        self.use_ssl = use_ssl
+        if server_port is None:
+            server_port = SINRICPRO_SERVER_SSL_PORT if use_ssl else SINRICPRO_SERVER_PORT
+        self.server_port = server_port
         self.app_key = app_key
         self.device_ids = device_ids
         self.platform = platform
         self.sdk_version = sdk_version or __version__
+        self.reconnect_delay_min = reconnect_delay_min  # milliseconds
+        self.reconnect_delay_max = reconnect_delay_max  # milliseconds
 
 
 class WebSocketClient:
@@ -60,6 +76,10 @@ class WebSocketClient:
     WebSocket client for SinricPro communication.
 
     Handles connection, auto-reconnection, and heartbeat monitoring.
+    Reconnection retries forever with exponential backoff and full jitter so
+    that many clients losing the same uplink do not reconnect in lockstep.
+    Outgoing frames are written by a single writer task in the order they
+    were passed to send().
     """
 
     def __init__(self, config: WebSocketConfig) -> None:
@@ -70,12 +90,22 @@ class WebSocketClient:
             config: WebSocket configuration
         """
         self.config = config
-        self.ws: WebSocketClientProtocol | None = None
+        self.ws: "ClientConnection | None" = None
         self.connected = False
         self.should_reconnect = True
         self.last_ping_time = 0.0
         self._ping_task: asyncio.Task[None] | None = None
         self._reconnect_task: asyncio.Task[None] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        self._outbound: deque[tuple[str, asyncio.Future[None]]] = deque()
+        self._outbound_ready = asyncio.Event()
+        self._reconnect_stats: dict[str, float] = {
+            "attempts": 0,
+            "failures": 0,
+            "reconnects": 0,
+            "last_reconnect_ms": 0.0,
+            "pong_timeouts": 0,
+        }
         self._message_callbacks: list[Callable[[str], None]] = []
         self._connected_callbacks: list[Callable[[], None]] = []
         self._disconnected_callbacks: list[Callable[[], None]] = []
@@ -113,9 +143,8 @@ class WebSocketClient:
             SinricProLogger.warn("WebSocket already connected")
             return
 
-        protocol = "wss"
-        port = SINRICPRO_SERVER_SSL_PORT
-        uri = f"{protocol}://{self.config.server_url}:{port}/"
+        protocol = "wss" if self.config.use_ssl else "ws"
+        uri = f"{protocol}://{self.config.server_url}:{self.config.server_port}/"
 
         headers = {
             "appkey": self.config.app_key,
@@ -125,11 +154,14 @@ class WebSocketClient:
             "mac": get_mac_address(),
         }
 
-        SinricProLogger.debug(f"Connecting to {uri}")
-        SinricProLogger.debug(f"WebSocket headers: {headers}")
+        SinricProLogger.debug("Connecting to %s", uri)
+        SinricProLogger.debug("WebSocket headers: %s", headers)
+
+        # websockets is imported on first connect to keep `import sinricpro` fast
+        from websockets.asyncio.client import connect
 
         try:
-            self.ws = await websockets.connect(
+            self.ws = await connect(
                 uri,
                 additional_headers=headers,
                 ping_interval=None,
@@ -138,7 +170,8 @@ class WebSocketClient:
             self.connected = True
             SinricProLogger.debug("WebSocket connected")
 
-            # Start heartbeat
+            # Start writer and heartbeat
+            self._start_writer()
             self._start_heartbeat()
 
             # Notify connected callbacks
@@ -160,17 +193,20 @@ class WebSocketClient:
         if not self.ws:
             return
 
+        from websockets.exceptions import ConnectionClosed
+
         try:
             async for message in self.ws:
                 if isinstance(message, str):
-                    SinricProLogger.debug(f"WebSocket received: {message}")
+                    if SinricProLogger.debug_enabled:
+                        SinricProLogger.debug("WebSocket received: %s", message)
                     for callback in self._message_callbacks:
                         callback(message)
 
-        except websockets.exceptions.ConnectionClosed:
+        except ConnectionClosed:
             SinricProLogger.info("WebSocket connection closed")
         except Exception as e:
-            SinricProLogger.error(f"Error handling messages: {e}")
+            SinricProLogger.error("Error handling messages: %s", e)
         finally:
             await self._handle_disconnect()
 
@@ -178,6 +214,7 @@ class WebSocketClient:
         """Handle disconnection."""
         self.connected = False
         self._stop_heartbeat()
+        self._stop_writer()
         SinricProLogger.info("WebSocket disconnected")
 
         # Notify disconnected callbacks
@@ -187,23 +224,79 @@ class WebSocketClient:
         if self.should_reconnect:
             self._schedule_reconnect()
 
-    def send(self, message: str) -> None:
+    def send(self, message: str) -> "asyncio.Future[None]":
         """
-        Send a message through the WebSocket.
+        Queue a message for the writer task.
 
         Args:
             message: Message string to send
 
+        Returns:
+            Future resolved once the frame has been written to the socket, or
+            failed with SinricProConnectionError if the write did not happen
+
         Raises:
             SinricProConnectionError: If not connected
+
+        Example:
+            >>> await client.send('{"header": {...}}')  # Wait for delivery
         """
         if not self.ws or not self.connected:
             error_msg = "Cannot send message: WebSocket not connected"
             SinricProLogger.error(error_msg)
             raise SinricProConnectionError(error_msg)
 
-        SinricProLogger.debug(f"WebSocket sending: {message}")
-        asyncio.create_task(self.ws.send(message))
+        if SinricProLogger.debug_enabled:
+            SinricProLogger.debug("WebSocket sending: %s", message)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._outbound.append((message, future))
+        self._outbound_ready.set()
+        return future
+
+    def _start_writer(self) -> None:
+        """Start the writer task."""
+        self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self) -> None:
+        """Write queued frames to the socket one at a time, in order."""
+        while self.connected and self.ws:
+            if not self._outbound:
+                self._outbound_ready.clear()
+                await self._outbound_ready.wait()
+                continue
+
+            message, future = self._outbound.popleft()
+            if future.done():
+                continue
+
+            try:
+                await self.ws.send(message)
+            except asyncio.CancelledError:
+                future.set_exception(SinricProConnectionError("WebSocket writer stopped"))
+                raise
+            except Exception as e:
+                error = SinricProConnectionError(f"WebSocket write failed: {e}")
+                future.set_exception(error)
+                # Later frames must not overtake the failed one
+                self._fail_outbound(error)
+                for callback in self._error_callbacks:
+                    callback(e)
+            else:
+                future.set_result(None)
+
+    def _fail_outbound(self, error: Exception) -> None:
+        """Fail all frames still waiting for the writer."""
+        while self._outbound:
+            _, future = self._outbound.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    def _stop_writer(self) -> None:
+        """Stop the writer task and fail unwritten frames."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+        self._fail_outbound(SinricProConnectionError("WebSocket disconnected"))
 
     def is_connected(self) -> bool:
         """Check if WebSocket is connected."""
@@ -233,7 +326,7 @@ class WebSocketClient:
                     )
 
                     latency = int((time.time() - self.last_ping_time) * 1000)
-                    SinricProLogger.debug(f"WebSocket pong received (latency: {latency}ms)")
+                    SinricProLogger.debug("WebSocket pong received (latency: %sms)", latency)
                     consecutive_misses = 0
 
                     for callback in self._pong_callbacks:
@@ -241,8 +334,11 @@ class WebSocketClient:
 
                 except asyncio.TimeoutError:
                     consecutive_misses += 1
+                    self._reconnect_stats["pong_timeouts"] += 1
                     SinricProLogger.warn(
-                        f"WebSocket pong timeout ({consecutive_misses}/{WEBSOCKET_PONG_MISS_MAX})"
+                        "WebSocket pong timeout (%s/%s)",
+                        consecutive_misses,
+                        WEBSOCKET_PONG_MISS_MAX,
                     )
 
                     if consecutive_misses >= WEBSOCKET_PONG_MISS_MAX:
@@ -255,7 +351,7 @@ class WebSocketClient:
                     return
 
                 except Exception as e:
-                    SinricProLogger.error(f"Error sending ping: {e}")
+                    SinricProLogger.error("Error sending ping: %s", e)
 
     def _stop_heartbeat(self) -> None:
         """Stop heartbeat tasks."""
@@ -270,15 +366,60 @@ class WebSocketClient:
 
         self._reconnect_task = asyncio.create_task(self._reconnect())
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Get the delay before a reconnect attempt ("full jitter" backoff).
+
+        Args:
+            attempt: Number of failed attempts so far in this outage
+
+        Returns:
+            Delay in seconds, uniformly random between 0 and the capped
+            exponential backoff for this attempt
+        """
+        ceiling = min(
+            self.config.reconnect_delay_max,
+            self.config.reconnect_delay_min * 2 ** min(attempt, 32),
+        )
+        return random.uniform(0, ceiling) / 1000.0
+
     async def _reconnect(self) -> None:
-        """Attempt to reconnect."""
-        await asyncio.sleep(5)  # Wait 5 seconds before reconnecting
-        SinricProLogger.info("Attempting to reconnect...")
+        """Reconnect with exponential backoff until connected or disconnect() is called."""
+        disconnected_at = time.monotonic()
+        attempt = 0
+
+        while self.should_reconnect and not self.connected:
+            delay = self._backoff_delay(attempt)
+            SinricProLogger.info("Reconnecting in %.1fs (attempt %s)", delay, attempt + 1)
+            await asyncio.sleep(delay)
+
+            if not self.should_reconnect:
+                return
+
+            attempt += 1
+            self._reconnect_stats["attempts"] += 1
+            try:
+                await self.connect()
+            except Exception as e:
+                self._reconnect_stats["failures"] += 1
+                SinricProLogger.error("Reconnection failed: %s", e)
+                continue
+
+            self._reconnect_stats["reconnects"] += 1
+            self._reconnect_stats["last_reconnect_ms"] = (time.monotonic() - disconnected_at) * 1000
+            SinricProLogger.info("Reconnected after %s attempt(s)", attempt)
+
+    def get_reconnect_stats(self) -> dict[str, float]:
+        """
+        Get reconnection metrics.
 
-        try:
-            await self.connect()
-        except Exception as e:
-            SinricProLogger.error(f"Reconnection failed: {e}")
+        Returns:
+            Dict with total reconnect "attempts", failed attempts ("failures"),
+            successful "reconnects", "last_reconnect_ms", the time from the
+            last disconnect until the connection was restored, and the number
+            of "pong_timeouts" (missed pongs close the connection)
+        """
+        return dict(self._reconnect_stats)
 
     def update_device_list(self, device_ids: list[str]) -> None:
         """
@@ -298,6 +439,7 @@ class WebSocketClient:
             self._reconnect_task = None
 
         self._stop_heartbeat()
+        self._stop_writer()
 
         if self.ws:
             await self.ws.close()
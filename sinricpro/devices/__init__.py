@@ -4,36 +4,77 @@ SinricPro Devices
 Device implementations for SinricPro.
 """
 
-# Lighting & Switches
-from sinricpro.devices.sinric_pro_light import SinricProLight
-from sinricpro.devices.sinric_pro_switch import SinricProSwitch
-from sinricpro.devices.sinric_pro_dimswitch import SinricProDimSwitch
-
-# Sensors
-from sinricpro.devices.sinric_pro_motion_sensor import SinricProMotionSensor
-from sinricpro.devices.sinric_pro_contact_sensor import SinricProContactSensor
-from sinricpro.devices.sinric_pro_temperature_sensor import SinricProTemperatureSensor
-from sinricpro.devices.sinric_pro_air_quality_sensor import SinricProAirQualitySensor
-from sinricpro.devices.sinric_pro_power_sensor import SinricProPowerSensor
-
-# Control Devices
-from sinricpro.devices.sinric_pro_blinds import SinricProBlinds
-from sinricpro.devices.sinric_pro_garage_door import SinricProGarageDoor
-from sinricpro.devices.sinric_pro_lock import SinricProLock
-
-# Climate Control
-from sinricpro.devices.sinric_pro_thermostat import SinricProThermostat
-from sinricpro.devices.sinric_pro_window_ac import SinricProWindowAC
-
-# Other
-from sinricpro.devices.sinric_pro_fan import SinricProFan
-from sinricpro.devices.sinric_pro_doorbell import SinricProDoorbell
-from sinricpro.devices.sinric_pro_camera import SinricProCamera
-from sinricpro.devices.sinric_pro_speaker import SinricProSpeaker
-from sinricpro.devices.sinric_pro_tv import SinricProTV
-
-# Custom
-from sinricpro.devices.sinric_pro_custom_device import SinricProCustomDevice
+from typing import TYPE_CHECKING
+
+from sinricpro.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    # Lighting & Switches
+    from sinricpro.devices.sinric_pro_light import SinricProLight
+    from sinricpro.devices.sinric_pro_switch import SinricProSwitch
+    from sinricpro.devices.sinric_pro_dimswitch import SinricProDimSwitch
+
+    # Sensors
+    from sinricpro.devices.sinric_pro_motion_sensor import SinricProMotionSensor
+    from sinricpro.devices.sinric_pro_contact_sensor import SinricProContactSensor
+    from sinricpro.devices.sinric_pro_temperature_sensor import SinricProTemperatureSensor
+    from sinricpro.devices.sinric_pro_air_quality_sensor import SinricProAirQualitySensor
+    from sinricpro.devices.sinric_pro_power_sensor import SinricProPowerSensor
+
+    # Control Devices
+    from sinricpro.devices.sinric_pro_blinds import SinricProBlinds
+    from sinricpro.devices.sinric_pro_garage_door import SinricProGarageDoor
+    from sinricpro.devices.sinric_pro_lock import SinricProLock
+
+    # Climate Control
+    from sinricpro.devices.sinric_pro_thermostat import SinricProThermostat
+    from sinricpro.devices.sinric_pro_window_ac import SinricProWindowAC
+
+    # Other
+    from sinricpro.devices.sinric_pro_fan import SinricProFan
+    from sinricpro.devices.sinric_pro_doorbell import SinricProDoorbell
+    from sinricpro.devices.sinric_pro_camera import SinricProCamera
+    from sinricpro.devices.sinric_pro_speaker import SinricProSpeaker
+    from sinricpro.devices.sinric_pro_tv import SinricProTV
+
+    # Custom
+    from sinricpro.devices.sinric_pro_custom_device import SinricProCustomDevice
+
+# Public name -> defining module, imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    # Lighting & Switches
+    "SinricProLight": "sinricpro.devices.sinric_pro_light",
+    "SinricProSwitch": "sinricpro.devices.sinric_pro_switch",
+    "SinricProDimSwitch": "sinricpro.devices.sinric_pro_dimswitch",
+
+    # Sensors
+    "SinricProMotionSensor": "sinricpro.devices.sinric_pro_motion_sensor",
+    "SinricProContactSensor": "sinricpro.devices.sinric_pro_contact_sensor",
+    "SinricProTemperatureSensor": "sinricpro.devices.sinric_pro_temperature_sensor",
+    "SinricProAirQualitySensor": "sinricpro.devices.sinric_pro_air_quality_sensor",
+    "SinricProPowerSensor": "sinricpro.devices.sinric_pro_power_sensor",
+
+    # Control Devices
+    "SinricProBlinds": "sinricpro.devices.sinric_pro_blinds",
+    "SinricProGarageDoor": "sinricpro.devices.sinric_pro_garage_door",
+    "SinricProLock": "sinricpro.devices.sinric_pro_lock",
+
+    # Climate Control
+    "SinricProThermostat": "sinricpro.devices.sinric_pro_thermostat",
+    "SinricProWindowAC": "sinricpro.devices.sinric_pro_window_ac",
+
+    # Other
+    "SinricProFan": "sinricpro.devices.sinric_pro_fan",
+    "SinricProDoorbell": "sinricpro.devices.sinric_pro_doorbell",
+    "SinricProCamera": "sinricpro.devices.sinric_pro_camera",
+    "SinricProSpeaker": "sinricpro.devices.sinric_pro_speaker",
+    "SinricProTV": "sinricpro.devices.sinric_pro_tv",
+
+    # Custom
+    "SinricProCustomDevice": "sinricpro.devices.sinric_pro_custom_device",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 __all__ = [
     # Lighting & Switches
@@ -24,30 +24,7 @@ from sinricpro.capabilities.range_controller import RangeController
 from sinricpro.capabilities.setting_controller import SettingController
 from sinricpro.capabilities.temperature_sensor import TemperatureSensor
 from sinricpro.capabilities.thermostat_controller import ThermostatController
-from sinricpro.core.actions import (
-    ACTION_ADJUST_BRIGHTNESS,
-    ACTION_ADJUST_POWER_LEVEL,
-    ACTION_ADJUST_RANGE_VALUE,
-    ACTION_DECREASE_COLOR_TEMPERATURE,
-    ACTION_GET_CAMERA_STREAM_URL,
-    ACTION_GET_SNAPSHOT,
-    ACTION_GET_WEBRTC_ANSWER,
-    ACTION_INCREASE_COLOR_TEMPERATURE,
-    ACTION_SET_BRIGHTNESS,
-    ACTION_SET_COLOR,
-    ACTION_SET_COLOR_TEMPERATURE,
-    ACTION_SET_LOCK_STATE,
-    ACTION_SET_MODE,
-    ACTION_SET_PERCENTAGE,
-    ACTION_SET_POWER_LEVEL,
-    ACTION_SET_POWER_STATE,
-    ACTION_SET_RANGE_VALUE,
-    ACTION_SET_SETTING,
-    ACTION_SET_THERMOSTAT_MODE,
-    ACTION_TARGET_TEMPERATURE,
-)
 from sinricpro.core.sinric_pro_device import SinricProDevice
-from sinricpro.core.types import SinricProRequest
 
 
 class SinricProCustomDevice(
@@ -162,166 +139,3 @@ class SinricProCustomDevice(
             >>> device = SinricProCustomDevice("device-id", "SMART_LIGHT")
         """
         super().__init__(device_id=device_id, product_type=product_type)
-
-    async def handle_request(self, request: SinricProRequest) -> bool:
-        """
-        Handle incoming requests for all supported capabilities.
-
-        Args:
-            request: The incoming request object
-
-        Returns:
-            True if request was handled successfully, False otherwise
-        """
-        action = request.action
-
-        # Power State Control
-        if action == ACTION_SET_POWER_STATE:
-            state = request.request_value.get("state", "Off").lower() == "on"
-            success, response_value = await self.handle_power_state_request(state, self)
-            request.response_value = response_value
-            return success
-
-        # Brightness Control
-        elif action == ACTION_SET_BRIGHTNESS:
-            brightness = request.request_value.get("brightness", 0)
-            success, response_value = await self.handle_brightness_request(brightness, self)
-            request.response_value = response_value
-            return success
-
-        elif action == ACTION_ADJUST_BRIGHTNESS:
-            brightness_delta = request.request_value.get("brightnessDelta", 0)
-            success, response_value = await self.handle_adjust_brightness_request(
-                brightness_delta, self
-            )
-            request.response_value = response_value
-            return success
-
-        # Color Control
-        elif action == ACTION_SET_COLOR:
-            r = request.request_value.get("color", {}).get("r", 0)
-            g = request.request_value.get("color", {}).get("g", 0)
-            b = request.request_value.get("color", {}).get("b", 0)
-            success, response_value = await self.handle_color_request(r, g, b, self)
-            request.response_value = response_value
-            return success
-
-        # Color Temperature Control
-        elif action == ACTION_SET_COLOR_TEMPERATURE:
-            color_temp = request.request_value.get("colorTemperature", 2700)
-            success, response_value = await self.handle_color_temperature_request(
-                color_temp, self
-            )
-            request.response_value = response_value
-            return success
-
-        elif action == ACTION_INCREASE_COLOR_TEMPERATURE:
-            success, response_value = await self.handle_increase_color_temperature_request(self)
-            request.response_value = response_value
-            return success
-
-        elif action == ACTION_DECREASE_COLOR_TEMPERATURE:
-            success, response_value = await self.handle_decrease_color_temperature_request(self)
-            request.response_value = response_value
-            return success
-
-        # Power Level Control
-        elif action == ACTION_SET_POWER_LEVEL:
-            power_level = request.request_value.get("powerLevel", 0)
-            success, response_value = await self.handle_power_level_request(power_level, self)
-            request.response_value = response_value
-            return success
-
-        elif action == ACTION_ADJUST_POWER_LEVEL:
-            power_level_delta = request.request_value.get("powerLevelDelta", 0)
-            success, response_value = await self.handle_adjust_power_level_request(
-                power_level_delta, self
-            )
-            request.response_value = response_value
-            return success
-
-        # Range Control
-        elif action == ACTION_SET_RANGE_VALUE:
-            range_value = request.request_value.get("rangeValue", 0)
-            instance_id = request.instance
-            success, response_value = await self.handle_range_value_request(range_value, instance_id, self)
-            request.response_value = response_value
-            return success
-
-        elif action == ACTION_ADJUST_RANGE_VALUE:
-            range_value_delta = request.request_value.get("rangeValueDelta", 0)
-            instance_id = request.instance
-            success, response_value = await self.handle_adjust_range_value_request(
-                range_value_delta, instance_id, self
-            )
-            request.response_value = response_value
-            return success
-
-        # Percentage Control (Legacy)
-        elif action == ACTION_SET_PERCENTAGE:
-            percentage = request.request_value.get("percentage", 0)
-            success, response_value = await self.handle_percentage_request(percentage, self)
-            request.response_value = response_value
-            return success
-
-        # Lock Control
-        elif action == ACTION_SET_LOCK_STATE:
-            lock_state = request.request_value.get("state", "LOCK")
-            success, response_value = await self.handle_lock_state_request(lock_state, self)
-            request.response_value = response_value
-            return success
-
-        # Mode Control
-        elif action == ACTION_SET_MODE:
-            mode = request.request_value.get("mode", "")
-            instance_id = request.instance
-            success, response_value = await self.handle_mode_request(mode, instance_id, self)
-            request.response_value = response_value
-            return success
-
-        # Thermostat Control
-        elif action == ACTION_SET_THERMOSTAT_MODE:
-            thermostat_mode = request.request_value.get("thermostatMode", "AUTO")
-            success, response_value = await self.handle_thermostat_mode_request(
-                thermostat_mode, self
-            )
-            request.response_value = response_value
-            return success
-
-        elif action == ACTION_TARGET_TEMPERATURE:
-            temperature = request.request_value.get("temperature", 20.0)
-            success, response_value = await self.handle_target_temperature_request(
-                temperature, self
-            )
-            request.response_value = response_value
-            return success
-
-        # Camera Control
-        elif action == ACTION_GET_SNAPSHOT:
-            success, response_value = await self.handle_snapshot_request(self)
-            request.response_value = response_value
-            return success
-
-        elif action == ACTION_GET_WEBRTC_ANSWER:
-            offer = request.request_value.get("offer", "")
-            success, response_value = await self.handle_get_webrtc_answer(offer, self)
-            request.response_value = response_value
-            return success
-
-        elif action == ACTION_GET_CAMERA_STREAM_URL:
-            protocol = request.request_value.get("protocol", "")
-            success, response_value = await self.handle_get_camera_stream_url(protocol, self)
-            request.response_value = response_value
-            return success
-
-        # Settings Control
-        elif action == ACTION_SET_SETTING:
-            setting_id = request.request_value.get("id", "")
-            value = request.request_value.get("value")
-            success, response_value = await self.handle_setting_request(setting_id, value, self)
-            request.response_value = response_value
-            return success
-
-        # Unknown action
-        request.error_message = f"Missing callback function: {action}"
-        return False
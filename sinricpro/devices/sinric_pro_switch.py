@@ -9,9 +9,7 @@ from typing import Any
 from sinricpro.capabilities.power_state_controller import PowerStateController
 from sinricpro.capabilities.push_notification import PushNotification
 from sinricpro.capabilities.setting_controller import SettingController
-from sinricpro.core.actions import ACTION_SET_POWER_STATE, ACTION_SET_SETTING
 from sinricpro.core.sinric_pro_device import SinricProDevice
-from sinricpro.core.types import SinricProRequest
 
 
 class SinricProSwitch(SinricProDevice, PowerStateController, SettingController, PushNotification):
@@ -50,36 +48,3 @@ class SinricProSwitch(SinricProDevice, PowerStateController, SettingController,
             >>> my_switch = SinricProSwitch("5dc1564130xxxxxxxxxxxxxx")
         """
         super().__init__(device_id=device_id, product_type="SWITCH")
-
-    async def handle_request(self, request: SinricProRequest) -> bool:
-        """
-        Handle incoming requests for this switch.
-
-        Args:
-            request: The request to handle
-
-        Returns:
-            True if request was handled successfully, False otherwise
-        """
-        action = request.action
-
-        # Handle setPowerState action
-        if action == ACTION_SET_POWER_STATE:
-            state_str = request.request_value.get("state", "Off")
-            state = state_str.lower() == "on"
-
-            success, response_value = await self.handle_power_state_request(state, self)
-            request.response_value = response_value
-            return success
-
-        # Handle setSetting action
-        elif action == ACTION_SET_SETTING:
-            setting_id = request.request_value.get("id", "")
-            value = request.request_value.get("value")
-            success, response_value = await self.handle_setting_request(setting_id, value, self)
-            request.response_value = response_value
-            return success
-
-        # Missing callback function
-        request.error_message = f"Missing callback function: {action}"
-        return False
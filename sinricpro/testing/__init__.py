@@ -0,0 +1,9 @@
+"""Testing utilities for the SinricPro SDK."""
+
+from sinricpro.testing.mock_server import DEFAULT_REQUEST_MIX, MockRequest, MockSinricProServer
+
+__all__ = [
+    "MockSinricProServer",
+    "MockRequest",
+    "DEFAULT_REQUEST_MIX",
+]
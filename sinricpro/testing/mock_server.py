@@ -0,0 +1,495 @@
+"""
+Mock SinricPro Server
+
+Local WebSocket server speaking the SinricPro protocol, for load testing and
+benchmarking the SDK without ws.sinric.pro.
+
+The server accepts SDK connections (checking the appkey and deviceids
+headers), sends signed requests for the registered devices at a target rate,
+validates the signatures and contents of the responses and events it
+receives, and measures the request/response round-trip latency.
+
+Run standalone against an SDK process configured with
+server_url="127.0.0.1", server_port=<port>, use_ssl=False:
+
+    python -m sinricpro.testing.mock_server --app-key ... --app-secret ... --rate 500
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections import deque
+from typing import Any, NamedTuple
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+from sinricpro.core.message_builder import MessageBuilder
+from sinricpro.core.signature import Signature, parse_message
+from sinricpro.utils.logger import SinricProLogger
+
+DEFAULT_RESPONSE_TIMEOUT = 5.0  # seconds
+_MAX_ERRORS = 100  # Most recent protocol errors kept for inspection
+_CLIENT_ID = "sinricpro-mock-server"
+
+# Close code sent to clients with a wrong app key (policy violation)
+_CLOSE_INVALID_APP_KEY = 1008
+
+
+class MockRequest(NamedTuple):
+    """
+    One kind of request in a load mix.
+
+    Example:
+        >>> MockRequest("setRangeValue", {"rangeValue": 50}, instance_id="speed", weight=2)
+    """
+
+    action: str
+    value: dict[str, Any]
+    instance_id: str | None = None
+    weight: float = 1.0
+
+
+# Default load mix: power state requests, alternating on and off
+DEFAULT_REQUEST_MIX = (
+    MockRequest("setPowerState", {"state": "On"}),
+    MockRequest("setPowerState", {"state": "Off"}),
+)
+
+
+class _Pending(NamedTuple):
+    """A request waiting for its response."""
+
+    sent_at: float  # time.perf_counter()
+    device_id: str
+    action: str
+    future: "asyncio.Future[dict[str, Any]] | None"
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Get a percentile of sorted values (nearest rank)."""
+    index = min(len(values) - 1, max(0, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+class MockSinricProServer:
+    """
+    In-process mock of the SinricPro WebSocket server.
+
+    Example:
+        >>> server = MockSinricProServer(APP_KEY, APP_SECRET)
+        >>> await server.start()
+        >>> config = SinricProConfig(
+        ...     app_key=APP_KEY,
+        ...     app_secret=APP_SECRET,
+        ...     server_url=server.host,
+        ...     server_port=server.port,
+        ...     use_ssl=False,
+        ... )
+        >>> await sinric_pro.begin(config)
+        >>> await server.wait_for_devices(1)
+        >>> stats = await server.run_load(rate=1000, duration=5)
+        >>> stats["latency_ms"]["p99"]
+        1.8
+        >>> await server.stop()
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initialize the server (call start() to listen).
+
+        Args:
+            app_key: App key clients must present
+            app_secret: App secret used to sign requests and validate replies
+            host: Interface to listen on
+            port: Port to listen on (0: pick a free port)
+        """
+        self.app_key = app_key
+        self.host = host
+        self.port = port
+        self.signature = Signature(app_secret)
+        self._builder = MessageBuilder(self.signature)
+        self._server: Server | None = None
+        self._connections: dict[ServerConnection, list[str]] = {}
+        self._device_connections: dict[str, ServerConnection] = {}
+        self._devices_changed = asyncio.Condition()
+        self._event_waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._pending: dict[str, _Pending] = {}
+        self._latencies: list[float] = []
+        self.errors: deque[str] = deque(maxlen=_MAX_ERRORS)
+        self.events: deque[dict[str, Any]] = deque(maxlen=_MAX_ERRORS)
+        self._stats: dict[str, int] = {}
+        self.reset_stats()
+
+    async def start(self) -> None:
+        """Start listening; self.port holds the actual port afterwards."""
+        self._server = await serve(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        SinricProLogger.info("Mock SinricPro server listening on %s:%s", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Close all connections and stop listening."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for pending in self._pending.values():
+            if pending.future and not pending.future.done():
+                pending.future.cancel()
+        self._pending.clear()
+
+    def reset_stats(self) -> None:
+        """Reset all counters and latency samples."""
+        self._latencies = []
+        self.errors.clear()
+        self.events.clear()
+        self._stats = {
+            "connections": 0,
+            "requests": 0,
+            "responses": 0,
+            "responses_failed": 0,
+            "events": 0,
+            "invalid_signatures": 0,
+            "invalid_messages": 0,
+            "timeouts": 0,
+        }
+
+    @property
+    def device_ids(self) -> list[str]:
+        """IDs of the devices registered by connected clients."""
+        return list(self._device_connections)
+
+    async def wait_for_devices(self, count: int, timeout: float = 10.0) -> None:
+        """
+        Wait until connected clients have registered at least count devices.
+
+        Args:
+            count: Number of devices to wait for
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            asyncio.TimeoutError: If the devices did not connect in time
+        """
+        async with self._devices_changed:
+            await asyncio.wait_for(
+                self._devices_changed.wait_for(lambda: len(self._device_connections) >= count),
+                timeout,
+            )
+
+    async def wait_for_events(self, count: int, timeout: float = 10.0) -> None:
+        """
+        Wait until the "events" counter reaches count.
+
+        Args:
+            count: Number of received events to wait for
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            asyncio.TimeoutError: If the events did not arrive in time
+        """
+        if self._stats["events"] >= count:
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._event_waiters.append((count, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        finally:
+            if (count, future) in self._event_waiters:
+                self._event_waiters.remove((count, future))
+
+    def _wake_event_waiters(self) -> None:
+        """Resolve the wait_for_events() calls whose count was reached."""
+        events = self._stats["events"]
+        waiting = []
+        for count, future in self._event_waiters:
+            if count > events:
+                waiting.append((count, future))
+            elif not future.done():
+                future.set_result(None)
+        self._event_waiters = waiting
+
+    async def _handle_connection(self, connection: ServerConnection) -> None:
+        """Serve one SDK connection."""
+        headers = connection.request.headers if connection.request else {}
+        if headers.get("appkey") != self.app_key:
+            self._error(f"Rejected connection with app key {headers.get('appkey')!r}")
+            await connection.close(_CLOSE_INVALID_APP_KEY, "Invalid app key")
+            return
+
+        device_ids = [device for device in headers.get("deviceids", "").split(";") if device]
+        self._stats["connections"] += 1
+        self._connections[connection] = device_ids
+        async with self._devices_changed:
+            for device_id in device_ids:
+                self._device_connections[device_id] = connection
+            self._devices_changed.notify_all()
+
+        try:
+            await connection.send(json.dumps({"timestamp": int(time.time())}))
+            async for message in connection:
+                self._handle_message(message if isinstance(message, str) else message.decode())
+        except ConnectionClosed:
+            pass
+        finally:
+            del self._connections[connection]
+            async with self._devices_changed:
+                for device_id in device_ids:
+                    if self._device_connections.get(device_id) is connection:
+                        del self._device_connections[device_id]
+
+    def _error(self, error: str) -> None:
+        """Record a protocol error."""
+        self.errors.append(error)
+        SinricProLogger.debug("Mock server: %s", error)
+
+    def _handle_message(self, raw: str) -> None:
+        """Validate a message from a client and match responses to requests."""
+        try:
+            message, raw_payload = parse_message(raw)
+            payload = message["payload"]
+        except (ValueError, KeyError, TypeError):
+            self._stats["invalid_messages"] += 1
+            self._error(f"Malformed message: {raw[:200]}")
+            return
+
+        if not self.signature.validate(message, raw_payload):
+            self._stats["invalid_signatures"] += 1
+            self._error(f"Invalid signature: {raw[:200]}")
+            return
+
+        message_type = payload.get("type")
+        if message_type == "event":
+            self._stats["events"] += 1
+            self.events.append(payload)
+            self._wake_event_waiters()
+            if payload.get("deviceId") not in self._device_connections:
+                self._error(f"Event for unknown device {payload.get('deviceId')}")
+            return
+
+        if message_type != "response":
+            self._stats["invalid_messages"] += 1
+            self._error(f"Unexpected message type {message_type!r}")
+            return
+
+        pending = self._pending.pop(payload.get("replyToken", ""), None)
+        if pending is None:
+            self._stats["invalid_messages"] += 1
+            self._error(f"Response with unknown replyToken {payload.get('replyToken')!r}")
+            return
+
+        self._latencies.append((time.perf_counter() - pending.sent_at) * 1000)
+        self._stats["responses"] += 1
+        if payload.get("deviceId") != pending.device_id or payload.get("action") != pending.action:
+            self._stats["invalid_messages"] += 1
+            self._error(f"Response does not match request: {raw[:200]}")
+        elif not payload.get("success"):
+            self._stats["responses_failed"] += 1
+        if pending.future and not pending.future.done():
+            pending.future.set_result(payload)
+
+    async def _send(
+        self,
+        device_id: str,
+        request: MockRequest,
+        future: "asyncio.Future[dict[str, Any]] | None" = None,
+    ) -> bool:
+        """Sign and send one request; returns False if the device is not connected."""
+        connection = self._device_connections.get(device_id)
+        if connection is None:
+            return False
+
+        reply_token = str(uuid.uuid4())
+        payload: dict[str, Any] = {
+            "action": request.action,
+            "clientId": _CLIENT_ID,
+            "createdAt": int(time.time()),
+            "deviceId": device_id,
+            "message": "OK",
+            "replyToken": reply_token,
+            "success": True,
+            "type": "request",
+            "value": request.value,
+        }
+        if request.instance_id is not None:
+            payload["instanceId"] = request.instance_id
+
+        message = self._builder.build(payload)
+        sent_at = time.perf_counter()
+        self._pending[reply_token] = _Pending(sent_at, device_id, request.action, future)
+        self._stats["requests"] += 1
+        try:
+            await connection.send(message)
+        except ConnectionClosed:
+            del self._pending[reply_token]
+            self._stats["requests"] -= 1
+            return False
+        return True
+
+    async def send_request(
+        self,
+        device_id: str,
+        action: str,
+        value: dict[str, Any],
+        instance_id: str | None = None,
+        timeout: float = DEFAULT_RESPONSE_TIMEOUT,
+    ) -> dict[str, Any]:
+        """
+        Send one request and wait for the response.
+
+        Args:
+            device_id: Target device (must be connected)
+            action: Request action
+            value: Request value
+            instance_id: Optional instance ID
+            timeout: Maximum time to wait for the response in seconds
+
+        Returns:
+            The response payload
+
+        Raises:
+            KeyError: If no connected client registered the device
+            asyncio.TimeoutError: If no response arrived in time
+
+        Example:
+            >>> response = await server.send_request(DEVICE_ID, "setPowerState", {"state": "On"})
+            >>> response["success"]
+            True
+        """
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        if not await self._send(device_id, MockRequest(action, value, instance_id), future):
+            raise KeyError(f"Device {device_id} is not connected")
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            raise
+
+    async def run_load(
+        self,
+        rate: float,
+        duration: float | None = None,
+        count: int | None = None,
+        mix: tuple[MockRequest, ...] | list[MockRequest] = DEFAULT_REQUEST_MIX,
+        response_timeout: float = DEFAULT_RESPONSE_TIMEOUT,
+    ) -> dict[str, Any]:
+        """
+        Send requests to random connected devices at a target rate.
+
+        Requests are paced against the start time, so the achieved rate does
+        not drift when individual sends are late. Afterwards, waits for the
+        outstanding responses; those still missing count as timeouts.
+
+        Args:
+            rate: Target requests per second
+            duration: How long to send in seconds
+            count: How many requests to send (alternative to duration)
+            mix: Request kinds, chosen at random by weight
+            response_timeout: Maximum time to wait for outstanding responses in seconds
+
+        Returns:
+            The statistics (see get_stats())
+
+        Raises:
+            ValueError: If neither duration nor count is given, or no device is connected
+        """
+        if duration is None and count is None:
+            raise ValueError("run_load() needs a duration or a count")
+        if not self._device_connections:
+            raise ValueError("No devices connected")
+        if count is None:
+            count = int(rate * duration)  # type: ignore[operator]
+
+        weights = [request.weight for request in mix]
+        start = time.perf_counter()
+        sent = 0
+        while sent < count:
+            due = min(count, int((time.perf_counter() - start) * rate) + 1)
+            device_ids = self.device_ids
+            if not device_ids:
+                break
+            for request in random.choices(mix, weights, k=due - sent):
+                await self._send(random.choice(device_ids), request)
+            sent = due
+            # Sleep until the next request is due
+            await asyncio.sleep(max(0.0, start + sent / rate - time.perf_counter()))
+
+        stats = await self.drain(response_timeout)
+        stats["elapsed_s"] = time.perf_counter() - start
+        stats["rate"] = sent / (stats["elapsed_s"] or 1)
+        return stats
+
+    async def drain(self, timeout: float = DEFAULT_RESPONSE_TIMEOUT) -> dict[str, Any]:
+        """
+        Wait for outstanding responses; those still missing count as timeouts.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The statistics (see get_stats())
+        """
+        deadline = time.perf_counter() + timeout
+        while self._pending and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+        self._stats["timeouts"] += len(self._pending)
+        self._pending.clear()
+        return self.get_stats()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get the counters and round-trip latency statistics.
+
+        Returns:
+            Dict with "connections", "requests", "responses", "responses_failed"
+            (success false), "events", "invalid_signatures", "invalid_messages",
+            "timeouts", currently "pending" requests and "latency_ms" with
+            min/mean/p50/p90/p99/max of the request/response round trips
+        """
+        latency: dict[str, float] = {}
+        if self._latencies:
+            values = sorted(self._latencies)
+            latency = {
+                "min": values[0],
+                "mean": sum(values) / len(values),
+                "p50": _percentile(values, 0.50),
+                "p90": _percentile(values, 0.90),
+                "p99": _percentile(values, 0.99),
+                "max": values[-1],
+            }
+        return {**self._stats, "pending": len(self._pending), "latency_ms": latency}
+
+
+async def _main() -> None:
+    """Run the mock server against an external SDK process."""
+    parser = argparse.ArgumentParser(description="Mock SinricPro server for load testing")
+    parser.add_argument("--app-key", required=True)
+    parser.add_argument("--app-secret", required=True)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--devices", type=int, default=1, help="devices to wait for")
+    parser.add_argument("--rate", type=float, default=100.0, help="requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    args = parser.parse_args()
+
+    server = MockSinricProServer(args.app_key, args.app_secret, args.host, args.port)
+    await server.start()
+    try:
+        print(f"Waiting for {args.devices} device(s) on ws://{args.host}:{server.port}/ ...")
+        await server.wait_for_devices(args.devices, timeout=3600)
+        stats = await server.run_load(args.rate, duration=args.duration)
+        print(json.dumps(stats, indent=2))
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,49 @@
+"""
+Lazy Imports
+
+Module-level lazy attribute loading (PEP 562) for the package __init__ files.
+
+Importing the package only records where each public name lives; the module
+defining it is imported on first access. A script using one device type then
+never imports the modules (and third-party dependencies) of the others.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_attributes(
+    package: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Create the module __getattr__ and __dir__ of a package with lazy attributes.
+
+    Loaded attributes are stored in the package namespace, so __getattr__ runs
+    once per name.
+
+    Args:
+        package: Name of the package (__name__)
+        attributes: Public name -> module defining it
+
+    Returns:
+        The (__getattr__, __dir__) functions for the package
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_attributes(
+        ...     __name__, {"SinricProSwitch": "sinricpro.devices.sinric_pro_switch"}
+        ... )
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *attributes})
+
+    return __getattr__, __dir__
@@ -23,14 +23,36 @@ class SinricProLogger:
     Centralized logger for SinricPro SDK.
 
     Provides consistent logging across the SDK with configurable log levels.
+
+    Logging is lazy: a call below the current level returns after a single
+    integer comparison, without formatting anything. Pass values as %-style
+    arguments instead of pre-formatting them with f-strings; on paths run
+    for every message, or when building an argument is expensive, check
+    debug_enabled (or level) before the call. Keyword arguments are logged
+    as structured fields: appended as key=value to the message and available
+    to handlers as record.fields.
+
+    Attributes:
+        level: Current log level as an int (change it with set_level())
+        debug_enabled: True if debug messages are logged
+
+    Example:
+        >>> SinricProLogger.debug("WebSocket received: %s", message)
+        >>> SinricProLogger.info("Device added", device=device_id, type="SWITCH")
+        >>> if SinricProLogger.debug_enabled:
+        ...     SinricProLogger.debug("State: %s", expensive_dump())
     """
 
     _logger: logging.Logger = logging.getLogger("sinricpro")
     _initialized: bool = False
+    # Plain ints: comparing them is much cheaper than accessing LogLevel members
+    level: int = logging.INFO
+    debug_enabled: bool = False
+    _logger.setLevel(level)
 
     @classmethod
     def _init(cls) -> None:
-        """Initialize the logger if not already initialized."""
+        """Attach the console handler (done once, when the first message is logged)."""
         if not cls._initialized:
             # Create console handler
             handler = logging.StreamHandler()
@@ -45,7 +67,6 @@ class SinricProLogger:
 
             # Add handler to logger
             cls._logger.addHandler(handler)
-            cls._logger.setLevel(LogLevel.INFO)
             cls._logger.propagate = False
             cls._initialized = True
 
@@ -57,56 +78,94 @@ class SinricProLogger:
         Args:
             level: The log level to set (DEBUG, INFO, WARN, ERROR, NONE)
 
+        The level is cached for the fast checks of the log methods, so set it
+        here rather than on the "sinricpro" logging.Logger.
+
         Example:
             >>> SinricProLogger.set_level(LogLevel.DEBUG)
         """
-        cls._init()
+        cls.level = int(level)
+        cls.debug_enabled = cls.level <= logging.DEBUG
         cls._logger.setLevel(level)
 
     @classmethod
-    def debug(cls, message: str, *args: object) -> None:
+    def is_enabled_for(cls, level: int) -> bool:
+        """
+        Check whether messages of a level are logged.
+
+        Args:
+            level: The log level to check
+
+        Returns:
+            True if messages of this level are logged
+
+        Example:
+            >>> if SinricProLogger.is_enabled_for(LogLevel.DEBUG):
+            ...     SinricProLogger.debug("Headers: %s", build_headers())
+        """
+        return level >= cls.level
+
+    @classmethod
+    def _log(
+        cls, level: int, message: str, args: tuple[object, ...], fields: dict[str, object]
+    ) -> None:
+        """Emit a message whose level is enabled."""
+        cls._init()
+        if fields:
+            text = " ".join(f"{key}={value}" for key, value in fields.items())
+            # The message is only %-formatted when there are arguments
+            message = f"{message} {text.replace('%', '%%') if args else text}"
+        # stacklevel 3: attribute the record to the caller of debug()/info()/...
+        cls._logger.log(level, message, *args, extra={"fields": fields}, stacklevel=3)
+
+    @classmethod
+    def debug(cls, message: str, *args: object, **fields: object) -> None:
         """
         Log a debug message.
 
         Args:
             message: The message to log
             *args: Additional arguments for string formatting
+            **fields: Structured fields
         """
-        cls._init()
-        cls._logger.debug(message, *args)
+        if cls.level <= logging.DEBUG:
+            cls._log(logging.DEBUG, message, args, fields)
 
     @classmethod
-    def info(cls, message: str, *args: object) -> None:
+    def info(cls, message: str, *args: object, **fields: object) -> None:
         """
         Log an info message.
 
         Args:
             message: The message to log
             *args: Additional arguments for string formatting
+            **fields: Structured fields
         """
-        cls._init()
-        cls._logger.info(message, *args)
+        if cls.level <= logging.INFO:
+            cls._log(logging.INFO, message, args, fields)
 
     @classmethod
-    def warn(cls, message: str, *args: object) -> None:
+    def warn(cls, message: str, *args: object, **fields: object) -> None:
         """
         Log a warning message.
 
         Args:
             message: The message to log
             *args: Additional arguments for string formatting
+            **fields: Structured fields
         """
-        cls._init()
-        cls._logger.warning(message, *args)
+        if cls.level <= logging.WARNING:
+            cls._log(logging.WARNING, message, args, fields)
 
     @classmethod
-    def error(cls, message: str, *args: object) -> None:
+    def error(cls, message: str, *args: object, **fields: object) -> None:
         """
         Log an error message.
 
         Args:
             message: The message to log
             *args: Additional arguments for string formatting
+            **fields: Structured fields
         """
-        cls._init()
-        cls._logger.error(message, *args)
+        if cls.level <= logging.ERROR:
+            cls._log(logging.ERROR, message, args, fields)
@@ -0,0 +1,63 @@
+"""Tests for the event spool together with a bounded send queue."""
+
+import pytest
+
+from sinricpro import SinricPro
+from sinricpro.core.event_spool import EventSpool, FsyncPolicy
+from sinricpro.core.message_builder import MessageBuilder
+from sinricpro.core.message_queue import MessagePriority, MessageQueue, OverflowPolicy
+from sinricpro.core.signature import Signature
+
+APP_SECRET = "test-app-secret-0123456789abcdef"
+DEVICE_ID = "5dc1564130aabbccddeeff00"
+
+
+def _event(index: int) -> dict:
+    """Build the payload of the index-th test event."""
+    return {
+        "action": "setPowerState",
+        "cause": {"type": "PHYSICAL_INTERACTION"},
+        "createdAt": 1700000000 + index,
+        "deviceId": DEVICE_ID,
+        "type": "event",
+        "value": {"state": "On" if index % 2 else "Off"},
+    }
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [OverflowPolicy.DROP_OLDEST, OverflowPolicy.DROP_NEWEST, OverflowPolicy.DROP_LOWEST_PRIORITY],
+)
+async def test_shed_events_are_acknowledged(tmp_path, policy):
+    """Events shed by the overflow policy do not hold back compaction or get replayed."""
+    client = SinricPro()
+    client.send_queue = MessageQueue(max_messages=10, overflow_policy=policy)
+    client.send_queue.on_drop = client._handle_dropped_message
+    spool = EventSpool(tmp_path, FsyncPolicy.NEVER, segment_size=4096)
+    spool.open()
+    client._spool = spool
+    builder = MessageBuilder(Signature(APP_SECRET))
+
+    for index in range(5000):
+        await client._enqueue_event(builder.build(_event(index)), MessagePriority.STATE_EVENT)
+        if index % 2:
+            # Send every other event
+            entry = await client.send_queue.get_entry()
+            spool.ack(entry.spool_seq)
+
+    queued = []
+    while len(client.send_queue):
+        queued.append(await client.send_queue.get_entry())
+    assert 0 < len(queued) <= 10
+
+    # Only the queued events hold back the cursor; older segments were compacted
+    assert spool.pending_count() == len(queued)
+    assert len(spool._acked_ahead) <= len(queued)
+    assert spool._cursor == min(entry.spool_seq for entry in queued)
+    assert spool._segments[0] <= spool._cursor < spool._segments[0] + 100
+
+    # Only the events never sent are replayed after a restart
+    spool.close()
+    replayed = EventSpool(tmp_path, FsyncPolicy.NEVER)
+    assert replayed.open() == sorted((entry.spool_seq, entry.message) for entry in queued)
+    replayed.close()